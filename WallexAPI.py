@@ -1,6 +1,59 @@
-import requests
-import socketio
+import asyncio
+import importlib
+import os
 import re
+import json
+import time
+import bisect
+import random
+import itertools
+import collections
+import functools
+import struct
+import threading
+import uuid
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from decimal import (
+    ROUND_CEILING,
+    ROUND_FLOOR,
+    ROUND_HALF_EVEN,
+    Decimal,
+    InvalidOperation,
+)
+from urllib.parse import urlsplit
+
+
+# ----- Lazy Imports -----
+class _LazyModule:
+    """
+    Stands in for a module and imports it on first attribute access.
+
+    `requests` and the Socket.IO stack (socketio, engineio and aiohttp) make up most of
+    the time it takes to import WallexAPI, so each is only loaded once a client first
+    touches it; a job that never opens a WebSocket never imports socketio.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+requests = _LazyModule("requests")
+socketio = _LazyModule("socketio")
 
 BASE_URL: str = "https://api.wallex.ir/"
 CONTENT_TYPE: str = "application/json"
@@ -52,883 +105,6017 @@ EVENTS: dict = {
 }
 
 
-class MarketInfo:
+# ----- Rate Limiting -----
+class TokenBucket:
     """
-    A class for interacting with the Wallex API to retrieve market-related information.
+    A thread-safe token bucket whose rate adapts to server throttling.
+
+    Each request takes one token; tokens refill at `rate` per second up to `burst`.
+    A throttled response halves the rate (down to `min_rate`) and pauses the bucket for
+    the server's Retry-After; every successful response raises the rate again by 2%,
+    back up to the configured rate.
 
     Args:
-        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+        rate (float): Requests per second.
+        burst (int): Maximum number of requests sent back to back.
+        min_rate (float, optional): Lowest rate the bucket adapts down to. Defaults to rate / 8.
+    """
 
-    Methods:
-        get_markets(self): Retrieves a list of available markets.
-        get_currencies(self): Retrieves currency statistics.
-        get_order_book_symbol(self, symbol: str): Retrieves the order book for a specific symbol.
-        get_order_book_all(self, symbol: str): Retrieves the order book for all symbols.
-        get_latest_trades(self, symbol: str): Retrieves the latest trades for a specific symbol.
-        get_market_history(self, symbol: str, resolution: str, time_from: int, time_to: int): Retrieves market history data for a specific symbol and time range.
+    def __init__(self, rate: float, burst: int, min_rate: float = None):
+        """
+        Initialize a full bucket.
 
-    Example:
-        api = MarketInfo()
-        symbol = "USDTTMN"
-        m00_time = int(time.time())
-        h01_time = m00_time - (m00_time % (60 * 60))
+        Args:
+            rate (float): Requests per second.
+            burst (int): Maximum number of requests sent back to back.
+            min_rate (float, optional): Lowest rate the bucket adapts down to. Defaults to rate / 8.
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = rate / 8 if min_rate is None else min_rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.throttled = 0
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, borrowing against future refills if the bucket is empty.
 
-        # Retrieve a list of available markets
-        markets = api.get_markets()
-        print("Markets Result:")
-        print(markets)
+        :return: (float) Seconds the caller must wait before sending.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
 
-        # Retrieve currency statistics
-        currencies = api.get_currencies()
-        print("Currencies Result:")
-        print(currencies)
+    def throttle(self, retry_after: float = None):
+        """
+        Back off after a throttled (429) response.
 
-        # Retrieve the order book for a specific symbol
-        order_book_symbol = api.get_order_book_symbol(symbol)
-        print("Order Book for Symbol Result:")
-        print(order_book_symbol)
+        :param retry_after(float): Seconds the server asked to wait (optional).
+        """
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+            self.tokens = min(self.tokens, 0.0)
+
+    def recover(self):
+        """
+        Raise the rate again after a successful response.
+        """
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate * 1.02)
 
-        # Retrieve the order book for all symbols
-        order_book_all = api.get_order_book_all(symbol)
-        print("Order Book for All Symbols Result:")
-        print(order_book_all)
 
-        # Retrieve the latest trades for a specific symbol
-        latest_trades = api.get_latest_trades(symbol)
-        print("Latest Trades Result:")
-        print(latest_trades)
+class RateLimiter:
+    """
+    A client-side rate limiter shared by every client that uses the same transport.
 
-        # Retrieve market history data for a specific symbol and time range
-        time_from = h01_time - 60 * 60 * 5
-        time_to = h01_time
-        market_history = api.get_market_history(symbol, "60", time_from, time_to)
-        print("Market History Result:")
-        print(market_history)
+    Public (market data) and private (API-key) requests draw from separate token buckets.
+    Both adapt to 429 responses and Retry-After headers, so bursts are delayed locally
+    instead of being rejected by the server.
+
+    Args:
+        public_rate (float, optional): Public requests per second. Defaults to 10.
+        public_burst (int, optional): Public requests sent back to back. Defaults to 20.
+        private_rate (float, optional): API-key requests per second. Defaults to 5.
+        private_burst (int, optional): API-key requests sent back to back. Defaults to 10.
+
+    Example:
+        limiter = RateLimiter(public_rate=20, private_rate=5)
+        transport = HTTPTransport(rate_limiter=limiter)
+        api_market = MarketInfo(transport=transport)
+        api_orders = OrdersManage(api_key, transport=transport)
     """
 
-    def __init__(self, base_url=BASE_URL):
+    def __init__(
+        self,
+        public_rate: float = 10.0,
+        public_burst: int = 20,
+        private_rate: float = 5.0,
+        private_burst: int = 10,
+    ):
         """
-        Initializes a new instance of the MarketInfo class.
+        Initialize the public and private buckets.
 
         Args:
-            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            public_rate (float, optional): Public requests per second. Defaults to 10.
+            public_burst (int, optional): Public requests sent back to back. Defaults to 20.
+            private_rate (float, optional): API-key requests per second. Defaults to 5.
+            private_burst (int, optional): API-key requests sent back to back. Defaults to 10.
         """
-        self.BASE_URL = base_url
+        self.public = TokenBucket(public_rate, public_burst)
+        self.private = TokenBucket(private_rate, private_burst)
 
-    def _make_request(self, endpoint, params=None):
+    def bucket(self, headers: dict = None) -> TokenBucket:
         """
-        Sends an HTTP GET request to the specified endpoint.
+        Pick the bucket of a request: private if it carries an API key.
 
-        Args:
-            endpoint (str): The API endpoint to request.
-            params (dict, optional): Query parameters to include in the request. Defaults to None.
+        :param headers(dict): The request headers.
+        :return: (TokenBucket) The bucket to draw from.
+        """
+        return self.private if headers and "x-api-key" in headers else self.public
 
-        Returns:
-            dict: The JSON response from the API.
+    def acquire(self, headers: dict = None):
+        """
+        Block until the request may be sent.
 
-        Raises:
-            requests.exceptions.RequestException: If a network-related error occurs.
-            requests.exceptions.HTTPError: If an HTTP error (4xx or 5xx) occurs.
+        :param headers(dict): The request headers.
         """
-        try:
-            response = requests.get(self.BASE_URL + endpoint, params=params)
-            # response.raise_for_status()  # Raises an exception for 4xx and 5xx status codes
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            raise requests.exceptions.RequestException(f"(Request) error: {e}")
-        except requests.exceptions.HTTPError as e:
-            raise requests.exceptions.HTTPError(f"(HTTP) error: {e}")
+        wait = self.bucket(headers).reserve()
+        if wait > 0:
+            time.sleep(wait)
 
-    def get_markets(self, endpoint=MARKET_EP["markets"]):
+    async def acquire_async(self, headers: dict = None):
         """
-        Retrieves a list of available markets.
+        Wait, without blocking the event loop, until the request may be sent.
 
-        Returns:
-            dict: A dictionary containing market information.
+        :param headers(dict): The request headers.
         """
-        return self._make_request(endpoint)
+        wait = self.bucket(headers).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
 
-    def get_currencies(self, endpoint=MARKET_EP["currencies_stats"]):
+    def feedback(self, headers: dict, status_code: int, response_headers=None):
         """
-        Retrieves currency statistics.
+        Adapt the request's bucket to the response status.
 
-        Returns:
-            dict: A dictionary containing currency statistics.
+        :param headers(dict): The request headers.
+        :param status_code(int): The response status code.
+        :param response_headers(dict): The response headers, for Retry-After (optional).
         """
-        return self._make_request(endpoint)
+        bucket = self.bucket(headers)
+        if status_code == 429 or (
+            status_code == 503
+            and response_headers
+            and "Retry-After" in response_headers
+        ):
+            bucket.throttle(_retry_after(response_headers))
+        elif status_code < 400:
+            bucket.recover()
+
+    def stats(self) -> dict:
+        """
+        :return: (dict) Current rate and throttled-response count of each bucket.
+        """
+        return {
+            name: {"rate": bucket.rate, "throttled": bucket.throttled}
+            for name, bucket in (("public", self.public), ("private", self.private))
+        }
 
-    def get_order_book_symbol(
-        self, symbol: str, endpoint=MARKET_EP["order_book_symbol"]
+
+def _retry_after(response_headers) -> float:
+    """
+    Parse a Retry-After header given in seconds; HTTP dates and missing values yield None.
+    """
+    if not response_headers:
+        return None
+    try:
+        return max(0.0, float(response_headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
+# ----- Retry Policy -----
+class RetryPolicy:
+    """
+    When and how long to wait before sending a failed request again.
+
+    Connection errors, timeouts and the listed status codes are retried with a jittered
+    exponential backoff (or the server's Retry-After), but only for idempotent methods.
+    `OrdersManage.set_order` uses the same policy to resubmit an order safely: before
+    each resubmission it looks the order up by its client_id.
+
+    Args:
+        max_retries (int, optional): Retries after the first attempt. Defaults to 3.
+        backoff (float, optional): Delay before the first retry, in seconds. Defaults to 0.25.
+        backoff_max (float, optional): Upper bound of the backoff delay, in seconds. Defaults to 4.
+        statuses (tuple, optional): Status codes worth retrying. Defaults to (429, 500, 502, 503, 504).
+        methods (tuple, optional): Methods retried automatically. Defaults to ("GET",).
+
+    Example:
+        transport = HTTPTransport(retry_policy=RetryPolicy(max_retries=5))
+        api = OrdersManage(api_key, transport=transport)
+        api.set_order("USDTTMN", "LIMIT", "BUY", "50000", "10", "my_order_1")
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.25,
+        backoff_max: float = 4.0,
+        statuses: tuple = (429, 500, 502, 503, 504),
+        methods: tuple = ("GET",),
     ):
         """
-        Retrieves the order book for a specific symbol.
+        Initialize the policy.
 
         Args:
-            symbol (str): The symbol for which to retrieve the order book.
+            max_retries (int, optional): Retries after the first attempt. Defaults to 3.
+            backoff (float, optional): Delay before the first retry, in seconds. Defaults to 0.25.
+            backoff_max (float, optional): Upper bound of the backoff delay, in seconds. Defaults to 4.
+            statuses (tuple, optional): Status codes worth retrying. Defaults to (429, 500, 502, 503, 504).
+            methods (tuple, optional): Methods retried automatically. Defaults to ("GET",).
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
 
-        Returns:
-            dict: A dictionary containing the order book for the specified symbol.
+    def allows(self, method: str, attempt: int) -> bool:
         """
-        params = {"symbol": symbol}
-        return self._make_request(endpoint, params=params)
+        :param method(str): The HTTP method.
+        :param attempt(int): Number of attempts already made.
+        :return: (bool) True if the request may be sent again.
+        """
+        return method.upper() in self.methods and attempt <= self.max_retries
 
-    def get_order_book_all(self, symbol: str, endpoint=MARKET_EP["order_book_all"]):
+    def delay(self, attempt: int, retry_after: float = None) -> float:
         """
-        Retrieves the order book for all symbols.
+        :param attempt(int): The (1-based) retry about to be made.
+        :param retry_after(float): Seconds the server asked to wait (optional).
+        :return: (float) Seconds to wait before the retry.
+        """
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.backoff * 2 ** (attempt - 1), self.backoff_max)
+        return delay * random.uniform(0.5, 1.5)
 
-        Args:
-            symbol (str): The symbol for which to retrieve the order book.
 
-        Returns:
-            dict: A dictionary containing the order book for all symbols.
+def _retryable_errors() -> tuple:
+    """
+    :return: (tuple) Transport errors worth retrying (resolved lazily, see `_LazyModule`).
+    """
+    return (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+# ----- Metrics -----
+LATENCY_BUCKETS: tuple = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_WINDOW: int = 1024
+_KNOWN_ENDPOINTS: tuple = tuple(
+    sorted(
+        {
+            *MARKET_EP.values(),
+            *ACCOUNT_EP.values(),
+            *ORDERS_EP.values(),
+            *OTC_EP.values(),
+        },
+        key=len,
+        reverse=True,
+    )
+)
+
+
+def _endpoint_label(url: str) -> str:
+    """
+    Map a request URL to the endpoint it belongs to, so that e.g. every
+    "v1/account/orders/<clientOrderId>" request shares the "v1/account/orders" label.
+
+    :param url(str): The request URL.
+    :return: (str) The longest known endpoint contained in the URL path, or the path itself.
+    """
+    path = urlsplit(url).path.strip("/")
+    padded = f"/{path}/"
+    for endpoint in _KNOWN_ENDPOINTS:
+        if f"/{endpoint}/" in padded:
+            return endpoint
+    return path
+
+
+def _percentile(ordered: list, q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class _EndpointStats:
+    __slots__ = (
+        "requests",
+        "errors",
+        "statuses",
+        "bytes",
+        "latency_sum",
+        "buckets",
+        "recent",
+        "decodes",
+        "decode_sum",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.statuses = {}
+        self.bytes = 0
+        self.latency_sum = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.recent = collections.deque(maxlen=METRICS_WINDOW)
+        self.decodes = 0
+        self.decode_sum = 0.0
+
+
+class Metrics:
+    """
+    Thread-safe request and stream instrumentation shared by transports and WebSockets.
+
+    For every endpoint it records a latency histogram, status codes, bytes received and
+    JSON decode time; for every WebSocket channel it counts messages. Percentiles are
+    computed over the last `METRICS_WINDOW` requests of each endpoint. Results are
+    available as a dict (`snapshot()`) or in the Prometheus text format (`prometheus()`).
+
+    Example:
+        metrics = Metrics()
+        transport = HTTPTransport(metrics=metrics)
+        MarketInfo(transport=transport).get_markets()
+        print(metrics.snapshot()["endpoints"]["v1/markets"]["latency"])
+        print(metrics.prometheus())
+    """
+
+    def __init__(self):
         """
-        params = {"symbol": symbol}
-        return self._make_request(endpoint, params=params)
+        Initialize empty metrics.
+        """
+        self._lock = threading.Lock()
+        self.reset()
 
-    def get_latest_trades(self, symbol: str, endpoint=MARKET_EP["latest_trades"]):
+    def reset(self):
         """
-        Retrieves the latest trades for a specific symbol.
+        Drop everything recorded so far.
+        """
+        with self._lock:
+            self.started = time.time()
+            self.endpoints: dict = {}  # endpoint -> _EndpointStats
+            self.channels: dict = {}  # channel -> message count
+
+    def _stats(self, url: str) -> _EndpointStats:
+        endpoint = _endpoint_label(url)
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = _EndpointStats()
+        return stats
+
+    def observe_request(self, url: str, status, elapsed: float, received: int = 0):
+        """
+        Record one HTTP request attempt.
 
-        Args:
-            symbol (str): The symbol for which to retrieve the latest trades.
+        :param url(str): The request URL.
+        :param status(int | str): The status code, or "error" if no response arrived.
+        :param elapsed(float): Seconds from sending the request to receiving the body.
+        :param received(int): Size of the response body in bytes.
+        """
+        with self._lock:
+            stats = self._stats(url)
+            stats.requests += 1
+            if not isinstance(status, int) or status >= 400:
+                stats.errors += 1
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.bytes += received
+            stats.latency_sum += elapsed
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            stats.recent.append(elapsed)
+
+    def observe_decode(self, url: str, elapsed: float):
+        """
+        Record the time spent decoding one JSON response body.
 
-        Returns:
-            dict: A dictionary containing the latest trades for the specified symbol.
+        :param url(str): The request URL.
+        :param elapsed(float): Seconds spent decoding.
         """
-        params = {"symbol": symbol}
-        return self._make_request(endpoint, params=params)
+        with self._lock:
+            stats = self._stats(url)
+            stats.decodes += 1
+            stats.decode_sum += elapsed
 
-    def get_market_history(
-        self,
-        symbol: str,
-        resolution: str,
-        time_from: int,
-        time_to: int,
-        endpoint=MARKET_EP["market_history"],
-    ):
+    def observe_message(self, channel: str):
         """
-        Retrieves market history data for a specific symbol and time range.
+        Count one WebSocket message.
 
-        Args:
-            symbol (str): The symbol for which to retrieve market history.
-            resolution (str): The time interval for data (e.g., "60" for 1-hour intervals).
-            time_from (int): The start time for data retrieval (Unix timestamp in seconds).
-            time_to (int): The end time for data retrieval (Unix timestamp in seconds).
+        :param channel(str): The channel the message arrived on (e.g. "USDTTMN@trade").
+        """
+        with self._lock:
+            self.channels[channel] = self.channels.get(channel, 0) + 1
 
-        Returns:
-            dict: A dictionary containing market history data.
+    def snapshot(self) -> dict:
         """
-        params = {
-            "symbol": symbol,
-            "resolution": resolution,
-            "from": time_from,
-            "to": time_to,
-        }
-        return self._make_request(endpoint, params=params)
+        :return: (dict) Per-endpoint request statistics and per-channel message rates.
+        """
+        with self._lock:
+            uptime = max(time.time() - self.started, 1e-9)
+            endpoints = {}
+            for endpoint, stats in self.endpoints.items():
+                ordered = sorted(stats.recent)
+                endpoints[endpoint] = {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "statuses": dict(stats.statuses),
+                    "bytes": stats.bytes,
+                    "latency": {
+                        "mean": (
+                            stats.latency_sum / stats.requests
+                            if stats.requests
+                            else 0.0
+                        ),
+                        "p50": _percentile(ordered, 0.50),
+                        "p90": _percentile(ordered, 0.90),
+                        "p99": _percentile(ordered, 0.99),
+                        "max": ordered[-1] if ordered else 0.0,
+                    },
+                    "decode": {
+                        "count": stats.decodes,
+                        "mean": (
+                            stats.decode_sum / stats.decodes if stats.decodes else 0.0
+                        ),
+                    },
+                }
+            channels = {
+                channel: {"messages": count, "rate": count / uptime}
+                for channel, count in self.channels.items()
+            }
+        return {"uptime": uptime, "endpoints": endpoints, "channels": channels}
 
+    def prometheus(self, prefix: str = "wallex") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
 
-class AccountManage:
+        :param prefix(str): Metric name prefix. Defaults to "wallex".
+        :return: (str) The exposition text.
+        """
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+            channels = sorted(self.channels.items())
+            lines = [f"# TYPE {prefix}_request_duration_seconds histogram"]
+            for endpoint, stats in endpoints:
+                label = f'endpoint="{endpoint}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), stats.buckets):
+                    cumulative += count
+                    lines.append(
+                        f'{prefix}_request_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(
+                    f"{prefix}_request_duration_seconds_sum{{{label}}} {stats.latency_sum}"
+                )
+                lines.append(
+                    f"{prefix}_request_duration_seconds_count{{{label}}} {stats.requests}"
+                )
+            lines.append(f"# TYPE {prefix}_requests_total counter")
+            for endpoint, stats in endpoints:
+                for status, count in sorted(stats.statuses.items(), key=str):
+                    lines.append(
+                        f'{prefix}_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}'
+                    )
+            lines.append(f"# TYPE {prefix}_response_bytes_total counter")
+            for endpoint, stats in endpoints:
+                lines.append(
+                    f'{prefix}_response_bytes_total{{endpoint="{endpoint}"}} {stats.bytes}'
+                )
+            lines.append(f"# TYPE {prefix}_json_decode_seconds summary")
+            for endpoint, stats in endpoints:
+                label = f'endpoint="{endpoint}"'
+                lines.append(
+                    f"{prefix}_json_decode_seconds_sum{{{label}}} {stats.decode_sum}"
+                )
+                lines.append(
+                    f"{prefix}_json_decode_seconds_count{{{label}}} {stats.decodes}"
+                )
+            lines.append(f"# TYPE {prefix}_ws_messages_total counter")
+            for channel, count in channels:
+                lines.append(
+                    f'{prefix}_ws_messages_total{{channel="{channel}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+# ----- JSON Decoding -----
+_json_loads = None
+
+
+def _default_json_loads():
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        return json.loads
+
+
+def get_json_decoder():
     """
-    A Python client for interacting with the Wallex API to manage user accounts and perform financial operations.
+    Get the function used to decode JSON response bodies.
 
-    Args:
-        api_key (str): Your Wallex API key.
-        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+    :return: (callable) `orjson.loads` if orjson is installed, otherwise `json.loads`,
+             unless replaced with `set_json_decoder`.
+    """
+    global _json_loads
+    if _json_loads is None:
+        _json_loads = _default_json_loads()
+    return _json_loads
 
-    Methods:
-        get_profile(): Get the user's profile information.
-        get_fee(): Get user level and fee information related to the user's account.
-        get_card_numbers(): Get bank card numbers associated with the user's account.
-        get_ibans(): Get IBANs associated with the user's account.
-        get_balances(): Get wallet assets balances for the user's account.
-        get_money_deposit(): Get information related to money (Toman) deposits in the user's account.
-        get_money_withdrawal(): Get information related to money (Toman) withdrawal in the user's account.
-        get_crypto_deposit(): Get information related to cryptocurrency deposits in the user's account.
-        get_crypto_withdrawal(): Get information related to cryptocurrency withdrawal in the user's account.
-        get_transfer(): Get information related to transfers in the user's account.
-        set_money_withdrawal(iban, value): Initiate a money (Toman) withdrawal from the user's account to a specified IBAN.
-        set_crypto_withdrawal(coin, network, value, wallet_address, memo=None): Initiate a cryptocurrency withdrawal from the user's account.
 
-    Example:
-        api_key = "Your API Key"
-        api = AccountManage(api_key)
+def set_json_decoder(loads=None):
+    """
+    Replace the function used to decode JSON response bodies.
 
-        # Get the user's profile information
-        profile_info = api.get_profile()
-        print("User Profile:")
-        print(profile_info)
+    :param loads(callable): Takes the raw body (bytes) and returns the decoded object,
+                            e.g. `orjson.loads` or `ujson.loads`. None restores the default.
+    """
+    global _json_loads
+    _json_loads = loads if loads is not None else _default_json_loads()
 
-        # Get user level and fee information
-        fee_info = api.get_fee()
-        print("User Fee Information:")
-        print(fee_info)
 
-        # Get bank card numbers
-        card_numbers = api.get_card_numbers()
-        print("Bank Card Numbers:")
-        print(card_numbers)
+def _decode_json(content: bytes):
+    """
+    Decode a JSON body with the configured decoder.
 
-        # Get IBANs
-        ibans = api.get_ibans()
-        print("IBANs:")
-        print(ibans)
+    :raises requests.exceptions.JSONDecodeError: If the body is not valid JSON.
+    """
+    try:
+        return get_json_decoder()(content)
+    except ValueError as e:
+        raise requests.exceptions.JSONDecodeError(
+            getattr(e, "msg", str(e)), getattr(e, "doc", ""), getattr(e, "pos", 0)
+        )
 
-        # Get wallet balances
-        balances = api.get_balances()
-        print("Wallet Balances:")
-        print(balances)
 
-        # Get money deposit information
-        money_deposit_info = api.get_money_deposit()
-        print("Money Deposit Information:")
-        print(money_deposit_info)
+def _decode(transport, response):
+    """
+    Decode a response through its transport. Custom transports without a `decode`
+    method keep working: their responses are decoded with `response.json()`.
+    """
+    decode = getattr(transport, "decode", None)
+    if decode is None:
+        return response.json()
+    return decode(response)
 
-        # Get money withdrawal information
-        money_withdrawal_info = api.get_money_withdrawal()
-        print("Money Withdrawal Information:")
-        print(money_withdrawal_info)
 
-        # Get cryptocurrency deposit information
-        crypto_deposit_info = api.get_crypto_deposit()
-        print("Crypto Deposit Information:")
-        print(crypto_deposit_info)
+# ----- HTTP Transport Defaults -----
+POOL_CONNECTIONS: int = 4
+POOL_MAXSIZE: int = 16
+TIMEOUT: tuple = (5.0, 30.0)  # (connect, read) in seconds
 
-        # Get cryptocurrency withdrawal information
-        crypto_withdrawal_info = api.get_crypto_withdrawal()
-        print("Crypto Withdrawal Information:")
-        print(crypto_withdrawal_info)
 
-        # Get transfer information
-        transfer_info = api.get_transfer()
-        print("Transfer Information:")
-        print(transfer_info)
+class HTTPTransport:
+    """
+    A pooled HTTP transport shared by the REST client classes.
 
-        # Initiate a money withdrawal
-        iban_to_withdraw_to = "Your IBAN"
-        amount_to_withdraw = 100.0  # Replace with the amount you want to withdraw
-        money_withdrawal_result = api.set_money_withdrawal(iban_to_withdraw_to, amount_to_withdraw)
-        print("Money Withdrawal Result:")
-        print(money_withdrawal_result)
+    Keeps a single `requests.Session` with a keep-alive connection pool, so back-to-back
+    calls to the Wallex API reuse warm TCP/TLS connections instead of opening a new one per call.
 
-        # Initiate a cryptocurrency withdrawal
-        coin = "USDT"
-        network = "TRC20"
-        value = 100.0  # Replace with the amount you want to withdraw
-        wallet_address = "Your wallet address"  # Replace with your wallet address
-        crypto_withdrawal_result = api.set_crypto_withdrawal(coin, network, value, wallet_address)
-        print("Crypto Withdrawal Result:")
-        print(crypto_withdrawal_result)
+    Args:
+        pool_connections (int, optional): Number of host pools to cache. Defaults to 4.
+        pool_maxsize (int, optional): Maximum number of connections kept alive per host. Defaults to 16.
+        timeout (float | tuple, optional): Request timeout, or a (connect, read) tuple, in seconds. Defaults to (5.0, 30.0).
+        pool_block (bool, optional): Whether to block when the pool has no free connection. Defaults to False.
+        rate_limiter (RateLimiter, optional): Client-side rate limiter applied to every request. Defaults to None.
+        retry_policy (RetryPolicy, optional): Retries for idempotent requests and safe order resubmission. Defaults to None (no retries).
+        metrics (Metrics, optional): Records latency, status codes, bytes and decode time per endpoint. Defaults to None.
+
+    Example:
+        transport = HTTPTransport(pool_maxsize=32, timeout=(3.0, 10.0))
+        api_market = MarketInfo(transport=transport)
+        api_orders = OrdersManage(api_key, transport=transport)
     """
 
-    def __init__(self, api_key, base_url=BASE_URL):
+    def __init__(
+        self,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        timeout=TIMEOUT,
+        pool_block: bool = False,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        metrics: Metrics = None,
+    ):
         """
-        Initialize the Wallex Account API client with the provided API key.
+        Initialize the transport and mount a pooled adapter for HTTP and HTTPS.
 
         Args:
-            api_key (str): Your Wallex API key.
-            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            pool_connections (int, optional): Number of host pools to cache. Defaults to 4.
+            pool_maxsize (int, optional): Maximum number of connections kept alive per host. Defaults to 16.
+            timeout (float | tuple, optional): Request timeout, or a (connect, read) tuple, in seconds. Defaults to (5.0, 30.0).
+            pool_block (bool, optional): Whether to block when the pool has no free connection. Defaults to False.
+            rate_limiter (RateLimiter, optional): Client-side rate limiter applied to every request. Defaults to None.
+            retry_policy (RetryPolicy, optional): Retries for idempotent requests and safe order resubmission. Defaults to None (no retries).
+            metrics (Metrics, optional): Records latency, status codes, bytes and decode time per endpoint. Defaults to None.
         """
-        self.api_key = api_key
-        self.BASE_URL = base_url
-        self.CONTENT_TYPE = CONTENT_TYPE
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.metrics = metrics
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-    def _make_request(self, endpoint, method="GET", params=None, json_payload=None):
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict = None,
+        params: dict = None,
+        json: dict = None,
+        timeout=None,
+    ):
         """
-        Make an HTTP request to the Wallex API.
-
-        Args:
-            endpoint (str): The API endpoint.
-            method (str): The HTTP method (GET or POST).
-            params (dict): Query parameters (for GET requests).
-            json_payload (dict): JSON payload (for POST requests).
+        Send an HTTP request over the pooled session, retrying it if the retry policy allows.
+
+        :param method(str): The HTTP method (GET, POST or DELETE).
+        :param url(str): The full request URL.
+        :param headers(dict): Request headers (optional).
+        :param params(dict): Query parameters (optional).
+        :param json(dict): JSON payload (optional).
+        :param timeout(float | tuple): Overrides the transport timeout for this call (optional).
+        :return: (requests.Response) The HTTP response.
+        """
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(headers)
+            started = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    json=json,
+                    timeout=self.timeout if timeout is None else timeout,
+                )
+            except _retryable_errors():
+                if self.metrics is not None:
+                    self.metrics.observe_request(
+                        url, "error", time.perf_counter() - started
+                    )
+                if policy is None or not policy.allows(method, attempt):
+                    raise
+                time.sleep(policy.delay(attempt))
+                continue
+            if self.metrics is not None:
+                self.metrics.observe_request(
+                    url,
+                    response.status_code,
+                    time.perf_counter() - started,
+                    len(response.content),
+                )
+            if self.rate_limiter is not None:
+                self.rate_limiter.feedback(
+                    headers, response.status_code, response.headers
+                )
+            if (
+                policy is None
+                or response.status_code not in policy.statuses
+                or not policy.allows(method, attempt)
+            ):
+                return response
+            time.sleep(policy.delay(attempt, _retry_after(response.headers)))
+
+    def decode(self, response):
+        """
+        Decode the JSON body of a response with the configured decoder (see
+        `set_json_decoder`), timing it when metrics are enabled.
 
-        Returns:
-            dict: JSON response from the API or an error message.
+        :param response(requests.Response): A response returned by `request`.
+        :return: (dict) The decoded JSON body.
         """
-        url = self.BASE_URL + endpoint
-        headers = {
-            "Content-Type": self.CONTENT_TYPE,
-            "x-api-key": self.api_key,
-        }
+        if self.metrics is None:
+            return _decode_json(response.content)
+        started = time.perf_counter()
         try:
-            response = requests.request(
-                method, url, headers=headers, params=params, json=json_payload
-            )
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            return f"(Request) error: {e}"
-        except requests.exceptions.HTTPError as e:
-            return f"(HTTP) error: {e}"
+            return _decode_json(response.content)
+        finally:
+            self.metrics.observe_decode(response.url, time.perf_counter() - started)
 
-    def get_profile(self, endpoint=ACCOUNT_EP["profile"]):
+    def close(self):
         """
-        Get the user's profile information.
-
-        Returns:
-            dict: User profile information.
+        Close the session and release all pooled connections.
         """
-        return self._make_request(endpoint)
+        self.session.close()
 
-    def get_fee(self, endpoint=ACCOUNT_EP["fee"]):
-        """
-        Get User level and fee information related to the user's account.
+    def __enter__(self):
+        return self
 
-        Returns:
-            dict: User level and fee information.
-        """
-        return self._make_request(endpoint)
+    def __exit__(self, *exc_info):
+        self.close()
 
-    def get_card_numbers(self, endpoint=ACCOUNT_EP["card_numbers"]):
-        """
-        Get bank card numbers with the user's account.
 
-        Returns:
-            dict: Bank card numbers information.
-        """
-        return self._make_request(endpoint)
+_default_transport: HTTPTransport = None
+_default_transport_lock = threading.Lock()
 
-    def get_ibans(self, endpoint=ACCOUNT_EP["ibans"]):
-        """
-        Get IBANs associated with the user's account.
 
-        Returns:
-            dict: IBANs information.
-        """
-        return self._make_request(endpoint)
+def get_default_transport() -> HTTPTransport:
+    """
+    Get the process-wide transport shared by clients created without an explicit `transport`.
 
-    def get_balances(self, endpoint=ACCOUNT_EP["balances"]):
-        """
-        Get Wallet assets balances for the user's account.
+    :return: (HTTPTransport) The shared transport, created on first use.
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = HTTPTransport()
+    return _default_transport
 
-        Returns:
-            dict: Account balances.
-        """
-        return self._make_request(endpoint)
 
-    def get_money_deposit(self, endpoint=ACCOUNT_EP["money_deposit"]):
-        """
-        Get information related to money (Toman) deposits in the user's account.
+def set_default_transport(transport: HTTPTransport):
+    """
+    Replace the process-wide shared transport (e.g. to change pool size or timeouts).
 
-        Returns:
-            dict: Money (Toman) deposit information.
+    :param transport(HTTPTransport): The transport new clients will share.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
+
+
+class AsyncResponse:
+    """
+    A minimal response object returned by `AsyncHTTPTransport.request`.
+
+    The body is read eagerly so the underlying connection goes back to the pool
+    before the caller decodes it.
+
+    Args:
+        status_code (int): The HTTP status code.
+        headers (dict): The response headers.
+        content (bytes): The raw response body.
+        url (str, optional): The request URL. Defaults to None.
+    """
+
+    __slots__ = ("status_code", "headers", "content", "url")
+
+    def __init__(
+        self, status_code: int, headers: dict, content: bytes, url: str = None
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    def json(self):
         """
-        return self._make_request(endpoint)
+        Decode the response body as JSON.
 
-    def get_money_withdrawal(self, endpoint=ACCOUNT_EP["money_withdrawal"]):
+        :return: (dict) The decoded JSON body.
+        :raises requests.exceptions.JSONDecodeError: If the body is not valid JSON.
         """
-        Get information related to money (Toman) withdrawal in the user's account.
+        return _decode_json(self.content)
 
-        Returns:
-            dict: Money (Toman) withdrawal information.
+
+class AsyncHTTPTransport:
+    """
+    A pooled asyncio HTTP transport shared by the async client classes.
+
+    Wraps one `aiohttp.ClientSession` whose connector keeps a keep-alive connection pool,
+    so a single event loop can keep many requests in flight over warm connections.
+    Requires the optional `aiohttp` package.
+
+    Args:
+        pool_maxsize (int, optional): Maximum number of concurrent connections. Defaults to 100.
+        pool_maxsize_per_host (int, optional): Maximum number of concurrent connections per host. Defaults to 0 (no limit).
+        timeout (float | tuple, optional): Request timeout, or a (connect, read) tuple, in seconds. Defaults to (5.0, 30.0).
+        keepalive_timeout (float, optional): Seconds an idle connection is kept alive. Defaults to 30.
+        rate_limiter (RateLimiter, optional): Client-side rate limiter applied to every request; may be shared with an HTTPTransport. Defaults to None.
+        retry_policy (RetryPolicy, optional): Retries for idempotent requests and safe order resubmission. Defaults to None (no retries).
+        metrics (Metrics, optional): Records latency, status codes, bytes and decode time per endpoint. Defaults to None.
+
+    Example:
+        async def main():
+            async with AsyncHTTPTransport(pool_maxsize=200) as transport:
+                api = AsyncMarketInfo(transport=transport)
+                markets = await api.get_markets()
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = 100,
+        pool_maxsize_per_host: int = 0,
+        timeout=TIMEOUT,
+        keepalive_timeout: float = 30.0,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        metrics: Metrics = None,
+    ):
         """
-        return self._make_request(endpoint)
+        Initialize the transport. The session is created lazily inside the running event loop.
 
-    def get_crypto_deposit(self, endpoint=ACCOUNT_EP["crypto_deposit"]):
+        Args:
+            pool_maxsize (int, optional): Maximum number of concurrent connections. Defaults to 100.
+            pool_maxsize_per_host (int, optional): Maximum number of concurrent connections per host. Defaults to 0 (no limit).
+            timeout (float | tuple, optional): Request timeout, or a (connect, read) tuple, in seconds. Defaults to (5.0, 30.0).
+            keepalive_timeout (float, optional): Seconds an idle connection is kept alive. Defaults to 30.
+            rate_limiter (RateLimiter, optional): Client-side rate limiter applied to every request; may be shared with an HTTPTransport. Defaults to None.
+            retry_policy (RetryPolicy, optional): Retries for idempotent requests and safe order resubmission. Defaults to None (no retries).
+            metrics (Metrics, optional): Records latency, status codes, bytes and decode time per endpoint. Defaults to None.
         """
-        Get information related to cryptocurrency deposits in the user's account.
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.metrics = metrics
+        self.pool_maxsize = pool_maxsize
+        self.pool_maxsize_per_host = pool_maxsize_per_host
+        self.timeout = timeout
+        self.keepalive_timeout = keepalive_timeout
+        self.session = None
+        self._loop = None
+
+    def _client_timeout(self, timeout):
+        import aiohttp
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=timeout)
+
+    def _get_session(self):
+        """
+        Get the session bound to the running event loop, creating it if needed.
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        if self.session is not None and self._loop is not loop:
+            self._release()
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize,
+                limit_per_host=self.pool_maxsize_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector, timeout=self._client_timeout(self.timeout)
+            )
+            self._loop = loop
+        return self.session
 
-        Returns:
-            dict: Cryptocurrency deposit information.
+    def _release(self):
         """
-        return self._make_request(endpoint)
+        Close the session of a previous event loop before it is replaced.
 
-    def get_crypto_withdrawal(self, endpoint=ACCOUNT_EP["crypto_withdrawal"]):
+        A loop still running in another thread closes the session itself, and a stopped
+        loop is run once in a helper thread to close it. A loop closed by `asyncio.run`
+        can no longer close anything, so its session is dropped and the sockets are freed
+        by the garbage collector; call `close()` (or use `async with`) before such a loop
+        ends to close them cleanly.
         """
-        Get information related to cryptocurrency withdrawal in the user's account.
+        session, loop = self.session, self._loop
+        self.session = self._loop = None
+        if session.closed:
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop).result()
+        elif not loop.is_closed():
+            closer = threading.Thread(
+                target=loop.run_until_complete, args=(session.close(),)
+            )
+            closer.start()
+            closer.join()
+        else:
+            session.detach()
 
-        Returns:
-            dict: Cryptocurrency withdrawal information.
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict = None,
+        params: dict = None,
+        json: dict = None,
+        timeout=None,
+    ) -> AsyncResponse:
         """
-        return self._make_request(endpoint)
+        Send an HTTP request over the pooled session, retrying it if the retry policy allows.
+
+        :param method(str): The HTTP method (GET, POST or DELETE).
+        :param url(str): The full request URL.
+        :param headers(dict): Request headers (optional).
+        :param params(dict): Query parameters (optional).
+        :param json(dict): JSON payload (optional).
+        :param timeout(float | tuple): Overrides the transport timeout for this call (optional).
+        :return: (AsyncResponse) The HTTP response.
+        :raises requests.exceptions.RequestException: If a network-related error occurs.
+        """
+        session = self._get_session()
+        if params:
+            # aiohttp rejects None values; requests silently drops them.
+            params = {k: v for k, v in params.items() if v is not None}
+        kwargs = {"headers": headers, "params": params, "json": json}
+        if timeout is not None:
+            kwargs["timeout"] = self._client_timeout(timeout)
+
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._request_once(session, method, url, kwargs)
+            except _retryable_errors():
+                if policy is None or not policy.allows(method, attempt):
+                    raise
+                await asyncio.sleep(policy.delay(attempt))
+                continue
+            if (
+                policy is None
+                or response.status_code not in policy.statuses
+                or not policy.allows(method, attempt)
+            ):
+                return response
+            await asyncio.sleep(policy.delay(attempt, _retry_after(response.headers)))
+
+    async def _request_once(self, session, method: str, url: str, kwargs: dict):
+        """
+        Send one attempt of a request through the rate limiter.
+        """
+        import aiohttp
 
-    def get_transfer(self, endpoint=ACCOUNT_EP["transfers"]):
+        headers = kwargs["headers"]
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(headers)
+        started = time.perf_counter()
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                content = await response.read()
+                response = AsyncResponse(
+                    response.status,
+                    requests.structures.CaseInsensitiveDict(response.headers),
+                    content,
+                    url,
+                )
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            if self.metrics is not None:
+                self.metrics.observe_request(
+                    url, "error", time.perf_counter() - started
+                )
+            if isinstance(e, asyncio.TimeoutError):
+                raise requests.exceptions.Timeout(e)
+            raise requests.exceptions.ConnectionError(e)
+        if self.metrics is not None:
+            self.metrics.observe_request(
+                url, response.status_code, time.perf_counter() - started, len(content)
+            )
+        if self.rate_limiter is not None:
+            self.rate_limiter.feedback(headers, response.status_code, response.headers)
+        return response
+
+    def decode(self, response: AsyncResponse):
         """
-        Get information related to transfer in the user's account.
+        Decode the JSON body of a response with the configured decoder (see
+        `set_json_decoder`), timing it when metrics are enabled.
 
-        Returns:
-            dict: Transfer information.
+        :param response(AsyncResponse): A response returned by `request`.
+        :return: (dict) The decoded JSON body.
         """
-        return self._make_request(endpoint)
+        if self.metrics is None:
+            return _decode_json(response.content)
+        started = time.perf_counter()
+        try:
+            return _decode_json(response.content)
+        finally:
+            self.metrics.observe_decode(response.url, time.perf_counter() - started)
 
-    def set_money_withdrawal(
-        self, iban: int, value: float, endpoint=ACCOUNT_EP["money_withdrawal"]
-    ):
+    async def close(self):
         """
-        Initiate a money (Toman) withdrawal from the user's account to a specified IBAN.
+        Close the session and release all pooled connections.
+        """
+        if self.session is not None and self._loop is not asyncio.get_running_loop():
+            self._release()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
 
-        Args:
-            iban (int): The IBAN (Shaba) to which money will be withdrawn.
-            value (float): The amount of money (Toman) to withdraw.
+    async def __aenter__(self):
+        return self
 
-        Returns:
-            dict: Withdrawal request result or an error message.
-        """
-        payload_money_withdrawal: dict = {"iban": iban, "value": value}
-        return self._make_request(
-            endpoint, method="POST", json_payload=payload_money_withdrawal
-        )
+    async def __aexit__(self, *exc_info):
+        await self.close()
 
-    def set_crypto_withdrawal(
-        self,
-        coin: str,
-        network: str,
-        value: float,
-        wallet_address: str,
-        memo=None,
-        endpoint=ACCOUNT_EP["crypto_withdrawal"],
-    ):
-        """
-        Initiate a cryptocurrency withdrawal from the user's account.
 
-        Args:
-            coin (str): The cryptocurrency coin symbol (e.g., "BTC").
-            network (str): The network or blockchain (e.g., "Bitcoin").
-            value (float): The amount of cryptocurrency to withdraw.
-            wallet_address (str): The recipient's cryptocurrency wallet address.
-            memo (str, optional): Additional address memo; If the network needs.
+_default_async_transport: AsyncHTTPTransport = None
 
-        Returns:
-            dict: Withdrawal request result or an error message.
-        """
-        payload_crypto_withdrawal: dict = {
-            "coin": coin,
-            "network": network,
-            "value": value,
-            "wallet_address": wallet_address,
-            "memo": memo,
-        }
-        return self._make_request(
-            endpoint, method="POST", json_payload=payload_crypto_withdrawal
-        )
 
+def get_default_async_transport() -> AsyncHTTPTransport:
+    """
+    Get the process-wide transport shared by async clients created without an explicit `transport`.
 
-class OrdersManage:
+    :return: (AsyncHTTPTransport) The shared async transport, created on first use.
     """
-    A Python client for interacting with the Wallex API to place orders and manage trading.
+    global _default_async_transport
+    if _default_async_transport is None:
+        with _default_transport_lock:
+            if _default_async_transport is None:
+                _default_async_transport = AsyncHTTPTransport()
+    return _default_async_transport
 
-    Args:
-        api_key (str): Your Wallex API key.
-        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
 
-    Methods:
-        set_order(self, symbol: str, type_order: str, side: str, price: str, quantity: str, client_id: str = None) -> dict
-            Place an order with the Wallex API.
+def set_default_async_transport(transport: AsyncHTTPTransport):
+    """
+    Replace the process-wide shared async transport.
 
-        get_order(self, clientOrderId: str) -> dict
-            Get information about a specific order by its clientOrderId.
+    :param transport(AsyncHTTPTransport): The transport new async clients will share.
+    """
+    global _default_async_transport
+    with _default_transport_lock:
+        _default_async_transport = transport
 
-        del_order(self, clientOrderId: str) -> dict
-            Cancel an order by its clientOrderId.
 
-        get_open_orders(self, symbol: str = None) -> dict
-            Get a list of open orders.
+# ----- Concurrent Fan-Out -----
+MAX_WORKERS: int = 8
 
-        get_last_trades(self, symbol: str = None, side: str = None) -> dict
-            Get a list of the last trades.
 
-    Example:
-        # Replace with your actual API key
-        api_key: str = "Your-API-Key-Here"
-        api: OrdersManage = OrdersManage(api_key)
+def _fan_out(func, items, max_workers: int = MAX_WORKERS) -> dict:
+    """
+    Call `func(item)` for every item in a bounded thread pool.
 
-        # Example usage of set_order function
-        symbol: str = "USDTTMN"
-        type_order: str = "LIMIT"
-        side: str = "BUY"
-        price: str = "50000"
-        quantity: str = "10"
-        client_id: str = "mohsen_zehtabchi_00001"
+    :param func(callable): The blocking function to call for each item.
+    :param items(list): The items to fan out over (e.g. symbols).
+    :param max_workers(int): Maximum number of calls in flight at once.
+    :return: (dict) Results keyed by item; a failed call yields {"error": "..."}.
+    """
 
-        set_order_result = api.set_order(symbol, type_order, side, price, quantity, client_id)
-        print("Set Order Result:")
-        print(set_order_result)
+    def call(item):
+        try:
+            return func(item)
+        except Exception as e:
+            return {"error": f"{e}"}
 
-        # Example usage of get_order function
-        client_order_id_to_get = "mohsen_zehtabchi_00001"
-        get_order_result = api.get_order(client_order_id_to_get)
-        print("Get Order Result:")
-        print(get_order_result)
+    items = list(dict.fromkeys(items))
+    if not items:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return dict(zip(items, executor.map(call, items)))
 
-        # Example usage of del_order function
-        client_order_id_to_cancel = "mohsen_zehtabchi_00001"
-        cancel_order_result = api.del_order(client_order_id_to_cancel)
-        print("Cancel Order Result:")
-        print(cancel_order_result)
 
-        # Example usage of get_open_orders function
-        open_orders_result = api.get_open_orders(symbol="USDTTMN")
-        print("Open Orders Result:")
-        print(open_orders_result)
+async def _async_fan_out(func, items, max_workers: int = MAX_WORKERS) -> dict:
+    """
+    Await `func(item)` for every item with at most `max_workers` calls in flight.
 
-        # Example usage of get_last_trades function
-        last_trades_result = api.get_last_trades(symbol="USDTTMN", side="buy")
-        print("Last Trades Result:")
-        print(last_trades_result)
+    :param func(callable): The coroutine function to call for each item.
+    :param items(list): The items to fan out over (e.g. symbols).
+    :param max_workers(int): Maximum number of calls in flight at once.
+    :return: (dict) Results keyed by item; a failed call yields {"error": "..."}.
     """
+    semaphore = asyncio.Semaphore(max_workers)
 
-    def __init__(self, api_key: str, base_url=BASE_URL):
-        """
-        Initialize the API client with the provided API key.
+    async def call(item):
+        async with semaphore:
+            try:
+                return await func(item)
+            except Exception as e:
+                return {"error": f"{e}"}
 
-        Args:
+    items = list(dict.fromkeys(items))
+    return dict(zip(items, await asyncio.gather(*(call(item) for item in items))))
+
+
+def _select_orders(open_orders: dict, client_id_prefix: str = None, side: str = None):
+    """
+    Pick the clientOrderIds of a `get_open_orders` response that match the filters.
+
+    :param open_orders(dict): The `get_open_orders` response.
+    :param client_id_prefix(str): Keep only clientOrderIds starting with this prefix (optional).
+    :param side(str): Keep only orders on this side (optional, case-insensitive).
+    :return: (list | None) The matching clientOrderIds, or None if the response is an error.
+    """
+    try:
+        orders = open_orders["result"]["orders"]
+    except (KeyError, TypeError):
+        return None
+    side = side.upper() if side else None
+    return [
+        order["clientOrderId"]
+        for order in orders
+        if (not client_id_prefix or order["clientOrderId"].startswith(client_id_prefix))
+        and (side is None or order["side"].upper() == side)
+    ]
+
+
+# ----- Pagination -----
+PAGE_SIZE: int = 50
+# Endpoints whose result wraps the record list in a key.
+PAGE_KEYS: dict = {ORDERS_EP["last_trades"]: "AccountLatestTrades"}
+TIME_FIELDS: tuple = ("created_at", "timestamp", "createdAt", "updated_at", "time")
+
+
+def _record_time(record):
+    """
+    :param record(dict): One record of a history endpoint.
+    :return: (float | None) Its time as a Unix timestamp, or None if it has none.
+    """
+    if not isinstance(record, dict):
+        return None
+    for key in TIME_FIELDS:
+        value = record.get(key)
+        if value is None or value == "":
+            continue
+        try:
+            stamp = float(value)
+        except (TypeError, ValueError):
+            try:
+                moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+            except ValueError:
+                return None
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=timezone.utc)
+            return moment.timestamp()
+        return stamp / 1000 if stamp > 1e11 else stamp  # milliseconds
+    return None
+
+
+def _page_items(payload, key: str = None) -> list:
+    """
+    :param payload(dict): The response for one page.
+    :param key(str): The key of the record list inside the result, for endpoints that
+                     wrap it (see PAGE_KEYS); the result itself may also be the list.
+    :return: (list) The records of the page.
+    :raises requests.exceptions.RequestException: If the response is an error or has no record list.
+    """
+    if (
+        not isinstance(payload, dict)
+        or "error" in payload
+        or payload.get("success") is False
+    ):
+        raise requests.exceptions.RequestException(f"(Page) error: {payload}")
+    result = _result(payload)
+    if key is not None and isinstance(result, dict):
+        result = result.get(key)
+    if not isinstance(result, list):
+        raise requests.exceptions.RequestException(
+            f"(Page) error: no record list in {payload}"
+        )
+    return result
+
+
+def _page_step(items: list, previous, time_from: float = None, time_to: float = None):
+    """
+    Decide what to yield from a page and whether paging is over.
+
+    Paging ends at an empty page, at a page starting with the same record as the
+    previous page (the endpoint ignores `page`; this is reported), or once the pages have moved past the
+    time range. A page shorter than `per_page` does not end it, since the server may
+    cap the page size.
+
+    :return: (tuple) The records to yield, and whether this was the last page.
+    """
+    if not items:
+        return [], True
+    if previous is not None and items[0] == previous:
+        print(
+            "Error: a page repeated the previous one (is `page` ignored?); paging stopped"
+        )
+        return [], True
+    return _in_window(items, time_from, time_to)
+
+
+def _in_window(items: list, time_from: float = None, time_to: float = None) -> tuple:
+    """
+    Keep the records of a page inside [time_from, time_to].
+
+    :return: (tuple) The kept records, and whether the page has moved past the range
+             (its last record is older than time_from in a newest-first page, or newer
+             than time_to in an oldest-first page), so no later page can match.
+    """
+    if time_from is None and time_to is None:
+        return items, False
+    low = float("-inf") if time_from is None else time_from
+    high = float("inf") if time_to is None else time_to
+    kept, times = [], []
+    for item in items:
+        moment = _record_time(item)
+        if moment is None:
+            kept.append(item)
+            continue
+        times.append(moment)
+        if low <= moment <= high:
+            kept.append(item)
+    if not times:
+        return kept, False
+    if times[0] >= times[-1]:
+        return kept, times[-1] < low
+    return kept, times[-1] > high
+
+
+def _paginate(
+    fetch,
+    key: str = None,
+    time_from: float = None,
+    time_to: float = None,
+    prefetch: bool = True,
+):
+    """
+    Yield the records of every page of a history endpoint, one page at a time.
+
+    While the caller handles one page, the next one is already being requested in a
+    background thread, so at most two pages are held in memory. See `_page_step` for
+    when paging stops.
+
+    :param fetch(callable): `fetch(page)` returns the response of one (1-based) page.
+    :param key(str): The key of the record list inside each result (optional).
+    :param time_from(float): Skip records older than this Unix timestamp (optional).
+    :param time_to(float): Skip records newer than this Unix timestamp (optional).
+    :param prefetch(bool): Request the next page in the background.
+    :raises requests.exceptions.RequestException: If a page response is an error.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page, previous = 1, None
+        future = executor.submit(fetch, page) if executor is not None else None
+        while True:
+            payload = future.result() if future is not None else fetch(page)
+            items = _page_items(payload, key)
+            kept, last = _page_step(items, previous, time_from, time_to)
+            if last:
+                yield from kept
+                return
+            previous = items[0]
+            page += 1
+            if executor is not None:
+                future = executor.submit(fetch, page)
+            yield from kept
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def _apaginate(
+    fetch,
+    key: str = None,
+    time_from: float = None,
+    time_to: float = None,
+    prefetch: bool = True,
+):
+    """
+    The async generator counterpart of `_paginate`; `fetch(page)` returns a coroutine
+    and the next page is requested as a task while the caller handles the current one.
+    """
+    page, previous = 1, None
+    pending = fetch(page)
+    if prefetch:
+        pending = asyncio.ensure_future(pending)
+    try:
+        while True:
+            payload = await pending
+            pending = None
+            items = _page_items(payload, key)
+            kept, last = _page_step(items, previous, time_from, time_to)
+            if last:
+                for item in kept:
+                    yield item
+                return
+            previous = items[0]
+            page += 1
+            pending = fetch(page)
+            if prefetch:
+                pending = asyncio.ensure_future(pending)
+            for item in kept:
+                yield item
+    finally:
+        if isinstance(pending, asyncio.Future):
+            pending.cancel()
+        elif pending is not None:
+            pending.close()
+
+
+# ----- Market History Chunking -----
+RESOLUTIONS: dict = {
+    "1": 60,
+    "5": 300,
+    "15": 900,
+    "30": 1800,
+    "60": 3600,
+    "120": 7200,
+    "180": 10800,
+    "240": 14400,
+    "360": 21600,
+    "720": 43200,
+    "D": 86400,
+    "1D": 86400,
+    "W": 604800,
+    "1W": 604800,
+}
+CANDLE_FIELDS: tuple = ("t", "o", "h", "l", "c", "v")
+HISTORY_BARS_PER_CHUNK: int = 1000
+
+
+def resolution_seconds(resolution: str) -> int:
+    """
+    Get the bar length of a UDF resolution in seconds.
+
+    :param resolution(str): The resolution (e.g. "1", "60", "1D").
+    :return: (int) Seconds per bar.
+    """
+    resolution = str(resolution)
+    if resolution in RESOLUTIONS:
+        return RESOLUTIONS[resolution]
+    return int(resolution) * 60
+
+
+def _history_chunks(
+    resolution: str, time_from: int, time_to: int, bars_per_chunk: int
+) -> list:
+    """
+    Split [time_from, time_to] into consecutive, non-overlapping (from, to) ranges of at most `bars_per_chunk` bars.
+    """
+    step = resolution_seconds(resolution) * bars_per_chunk
+    return [
+        (start, min(start + step - 1, time_to))
+        for start in range(int(time_from), int(time_to) + 1, step)
+    ]
+
+
+def _merge_history(responses: list) -> dict:
+    """
+    Merge UDF history responses into columnar NumPy arrays sorted and deduplicated by timestamp.
+
+    :param responses(list): UDF responses ({"s": "ok", "t": [...], "o": [...], ...}).
+    :return: (dict) "t" as int64 and "o", "h", "l", "c", "v" as float64 arrays.
+    :raises requests.exceptions.RequestException: If a response is an error.
+    """
+    import numpy as np
+
+    columns = {field: [] for field in CANDLE_FIELDS}
+    for response in responses:
+        status = response.get("s") if isinstance(response, dict) else None
+        if status == "no_data":
+            continue
+        if status != "ok":
+            raise requests.exceptions.RequestException(f"(History) error: {response}")
+        for field in CANDLE_FIELDS:
+            columns[field].append(np.asarray(response[field], dtype=np.float64))
+    if not columns["t"]:
+        return {
+            field: np.empty(0, dtype=np.int64 if field == "t" else np.float64)
+            for field in CANDLE_FIELDS
+        }
+    t = np.concatenate(columns["t"]).astype(np.int64)
+    t, index = np.unique(t, return_index=True)
+    merged = {"t": t}
+    for field in CANDLE_FIELDS[1:]:
+        merged[field] = np.concatenate(columns[field])[index]
+    return merged
+
+
+# ----- Response Cache -----
+CACHE_TTL: dict = {
+    MARKET_EP["markets"]: 300.0,
+    MARKET_EP["currencies_stats"]: 60.0,
+    ACCOUNT_EP["fee"]: 600.0,
+    ACCOUNT_EP["card_numbers"]: 3600.0,
+    ACCOUNT_EP["ibans"]: 3600.0,
+    OTC_EP["otc_markets"]: 300.0,
+}
+
+
+class ResponseCache:
+    """
+    An opt-in, size-bounded LRU cache for slow-changing reference endpoints.
+
+    Fresh entries are served from memory. Entries past their TTL but still inside the
+    stale-while-revalidate window are served immediately while a single background
+    refresh replaces them; older entries are fetched again in the foreground.
+    Only successful JSON responses are cached, and cached values are shared between
+    callers, so treat them as read-only.
+
+    Args:
+        ttl (dict, optional): TTL in seconds keyed by endpoint; endpoints not listed are never cached. Defaults to CACHE_TTL.
+        maxsize (int, optional): Maximum number of cached responses before the least recently used is evicted. Defaults to 256.
+        stale_while_revalidate (float, optional): Seconds past the TTL during which a stale entry is still served. Defaults to 60.
+
+    Example:
+        cache = ResponseCache(ttl={MARKET_EP["markets"]: 60.0})
+        api = MarketInfo(cache=cache)
+        api.get_markets()  # network
+        api.get_markets()  # memory
+        print(cache.stats())
+    """
+
+    def __init__(
+        self,
+        ttl: dict = None,
+        maxsize: int = 256,
+        stale_while_revalidate: float = 60.0,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl (dict, optional): TTL in seconds keyed by endpoint; endpoints not listed are never cached. Defaults to CACHE_TTL.
+            maxsize (int, optional): Maximum number of cached responses before the least recently used is evicted. Defaults to 256.
+            stale_while_revalidate (float, optional): Seconds past the TTL during which a stale entry is still served. Defaults to 60.
+        """
+        self.ttl = dict(CACHE_TTL if ttl is None else ttl)
+        self.maxsize = maxsize
+        self.stale_while_revalidate = stale_while_revalidate
+        self._entries = collections.OrderedDict()  # key -> (value, stored_at)
+        self._refreshing = set()
+        self._tasks = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """
+        Get the TTL configured for an endpoint.
+
+        :param endpoint(str): The API endpoint.
+        :return: (float) TTL in seconds, or None if the endpoint is not cached.
+        """
+        return self.ttl.get(endpoint)
+
+    @staticmethod
+    def _cacheable(value) -> bool:
+        return (
+            isinstance(value, dict)
+            and "error" not in value
+            and value.get("success", True) is not False
+        )
+
+    def _lookup(self, key, ttl: float):
+        """
+        Look a key up and classify it as "fresh", "stale" or "miss".
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, "miss"
+            value, stored_at = entry
+            age = now - stored_at
+            if age <= ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value, "fresh"
+            if age <= ttl + self.stale_while_revalidate:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                if key in self._refreshing:
+                    return value, "refreshing"
+                self._refreshing.add(key)
+                return value, "stale"
+            del self._entries[key]
+            self.misses += 1
+            return None, "miss"
+
+    def _store(self, key, value):
+        with self._lock:
+            self._refreshing.discard(key)
+            if not self._cacheable(value):
+                return
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _refresh(self, key, loader):
+        try:
+            value = loader()
+        except Exception:
+            value = None
+        with self._lock:
+            self.refreshes += 1
+        self._store(key, value)
+
+    async def _arefresh(self, key, loader):
+        try:
+            value = await loader()
+        except Exception:
+            value = None
+        with self._lock:
+            self.refreshes += 1
+        self._store(key, value)
+
+    def fetch(self, key, ttl: float, loader):
+        """
+        Get a response from the cache, calling `loader()` on a miss.
+
+        :param key(hashable): The cache key.
+        :param ttl(float): Seconds the response stays fresh.
+        :param loader(callable): Blocking function that fetches the response.
+        :return: (dict) The cached or freshly loaded response.
+        """
+        value, state = self._lookup(key, ttl)
+        if state == "stale":
+            threading.Thread(
+                target=self._refresh, args=(key, loader), daemon=True
+            ).start()
+        if state != "miss":
+            return value
+        value = loader()
+        self._store(key, value)
+        return value
+
+    async def afetch(self, key, ttl: float, loader):
+        """
+        Get a response from the cache, awaiting `loader()` on a miss.
+
+        :param key(hashable): The cache key.
+        :param ttl(float): Seconds the response stays fresh.
+        :param loader(callable): Coroutine function that fetches the response.
+        :return: (dict) The cached or freshly loaded response.
+        """
+        value, state = self._lookup(key, ttl)
+        if state == "stale":
+            task = asyncio.ensure_future(self._arefresh(key, loader))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        if state != "miss":
+            return value
+        value = await loader()
+        self._store(key, value)
+        return value
+
+    def invalidate(self, endpoint: str = None):
+        """
+        Drop cached responses.
+
+        :param endpoint(str): Only drop responses of this endpoint (optional; all by default).
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[1] == endpoint]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        :return: (dict) Hits, stale hits, misses, background refreshes, evictions and current size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+
+def _cache_key(client, endpoint: str) -> tuple:
+    return (client.BASE_URL, endpoint, getattr(client, "api_key", None))
+
+
+def _cached(client, endpoint: str, loader):
+    """
+    Serve `loader()` through the client's cache if it has one and the endpoint has a TTL.
+    """
+    cache = client.cache
+    ttl = cache.ttl_for(endpoint) if cache is not None else None
+    if not ttl:
+        return loader()
+    return cache.fetch(_cache_key(client, endpoint), ttl, loader)
+
+
+async def _acached(client, endpoint: str, loader):
+    """
+    Serve `await loader()` through the client's cache if it has one and the endpoint has a TTL.
+    """
+    cache = client.cache
+    ttl = cache.ttl_for(endpoint) if cache is not None else None
+    if not ttl:
+        return await loader()
+    return await cache.afetch(_cache_key(client, endpoint), ttl, loader)
+
+
+# ----- Response Models -----
+def _number(value):
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def _result(payload):
+    if isinstance(payload, dict) and "result" in payload:
+        return payload["result"]
+    return payload
+
+
+class Records:
+    """
+    A read-only sequence of typed records over already decoded items.
+
+    The response itself is decoded in full, once, by the client that fetched it; only
+    the record objects are built on access, so reading a few records of a large
+    response does not build the rest.
+
+    Args:
+        items (list): The raw decoded items.
+        model (type): The record class built from each item.
+    """
+
+    __slots__ = ("_items", "_model")
+
+    def __init__(self, items, model):
+        self._items = items if isinstance(items, list) else list(items)
+        self._model = model
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Records(self._items[index], self._model)
+        return self._model(self._items[index])
+
+    def __iter__(self):
+        model = self._model
+        for item in self._items:
+            yield model(item)
+
+    def __repr__(self) -> str:
+        return f"Records({self._model.__name__}, {len(self._items)} items)"
+
+
+class _Model:
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        """
+        Returns:
+            dict: The record's fields.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Market(_Model):
+    """
+    One market of `get_markets`.
+
+    Args:
+        data (dict): One market of the decoded response.
+
+    Example:
+        markets = Market.parse(MarketInfo().get_markets())
+        print(markets[0].symbol, markets[0].last_price)
+    """
+
+    __slots__ = (
+        "symbol",
+        "base_asset",
+        "quote_asset",
+        "base_precision",
+        "quote_precision",
+        "last_price",
+        "volume_24h",
+    )
+
+    def __init__(self, data: dict):
+        stats = data.get("stats") or {}
+        self.symbol = data.get("symbol")
+        self.base_asset = data.get("baseAsset")
+        self.quote_asset = data.get("quoteAsset")
+        self.base_precision = data.get("baseAssetPrecision")
+        self.quote_precision = data.get("quotePrecision")
+        self.last_price = _number(stats.get("lastPrice"))
+        self.volume_24h = _number(stats.get("24h_volume"))
+
+    @classmethod
+    def parse(cls, payload) -> Records:
+        """
+        Args:
+            payload (dict): A `get_markets` response.
+
+        Returns:
+            Records: The markets.
+        """
+        result = _result(payload)
+        if isinstance(result, dict):
+            result = result.get("symbols", result)
+        return Records(
+            list(result.values()) if isinstance(result, dict) else result, cls
+        )
+
+
+class Order(_Model):
+    """
+    One order of `get_order`, `set_order` or `get_open_orders`.
+
+    Args:
+        data (dict): One order of the decoded response.
+
+    Example:
+        for order in Order.parse(api.get_open_orders("USDTTMN")):
+            print(order.client_order_id, order.executed_qty, order.status)
+    """
+
+    __slots__ = (
+        "client_order_id",
+        "symbol",
+        "type",
+        "side",
+        "price",
+        "orig_qty",
+        "executed_qty",
+        "status",
+        "active",
+        "created_at",
+    )
+
+    def __init__(self, data: dict):
+        self.client_order_id = data.get("clientOrderId")
+        self.symbol = data.get("symbol")
+        self.type = data.get("type")
+        self.side = data.get("side")
+        self.price = _number(data.get("price"))
+        self.orig_qty = _number(data.get("origQty"))
+        self.executed_qty = _number(data.get("executedQty"))
+        self.status = data.get("status")
+        self.active = data.get("active")
+        self.created_at = data.get("created_at")
+
+    @classmethod
+    def parse(cls, payload) -> Records:
+        """
+        Args:
+            payload (dict): A `get_open_orders`, `get_order` or `set_order` response.
+
+        Returns:
+            Records: The orders.
+        """
+        result = _result(payload)
+        if isinstance(result, dict):
+            result = result["orders"] if "orders" in result else [result]
+        return Records(result or [], cls)
+
+
+class Trade(_Model):
+    """
+    One trade of `get_latest_trades`, `OrdersManage.get_last_trades` or the @trade channel.
+
+    Args:
+        data (dict): One trade of the decoded response.
+
+    Example:
+        trades = Trade.parse(MarketInfo().get_latest_trades("USDTTMN"))
+        print(sum(trade.quantity for trade in trades))
+    """
+
+    __slots__ = ("symbol", "price", "quantity", "sum", "is_buy", "timestamp")
+
+    def __init__(self, data: dict):
+        self.symbol = data.get("symbol")
+        self.price = _number(data.get("price"))
+        self.quantity = _number(data.get("quantity"))
+        self.sum = _number(data.get("sum"))
+        self.is_buy = data.get("isBuyOrder", data.get("isBuyer"))
+        self.timestamp = data.get("timestamp")
+
+    @classmethod
+    def parse(cls, payload) -> Records:
+        """
+        Args:
+            payload (dict | list): A trades response, or a list of trades.
+
+        Returns:
+            Records: The trades.
+        """
+        result = _result(payload)
+        if isinstance(result, dict):
+            for key in ("latestTrades", "AccountLatestTrades"):
+                if key in result:
+                    return Records(result[key], cls)
+            result = [result]
+        return Records(result or [], cls)
+
+
+class DepthLevel(_Model):
+    """
+    One price level of an order book side.
+
+    Args:
+        data (dict | list): One level, as a dict or a [price, quantity] pair.
+
+    Example:
+        asks = DepthLevel.parse(MarketInfo().get_order_book_symbol("USDTTMN"), "ask")
+        print(asks[0].price, asks[0].quantity)
+    """
+
+    __slots__ = ("price", "quantity", "sum")
+
+    def __init__(self, data):
+        if isinstance(data, dict):
+            self.price = _number(data.get("price"))
+            self.quantity = _number(data.get("quantity"))
+            self.sum = _number(data.get("sum"))
+        else:
+            self.price = _number(data[0])
+            self.quantity = _number(data[1])
+            self.sum = None
+
+    @classmethod
+    def parse(cls, payload, side: str = None) -> Records:
+        """
+        Args:
+            payload (dict | list): A depth response or a depth channel payload.
+            side (str, optional): "ask" or "bid" when `payload` holds both sides. Defaults to None.
+
+        Returns:
+            Records: The levels of one side.
+        """
+        result = _result(payload)
+        if isinstance(result, dict) and side is not None:
+            result = result.get(side, [])
+        if isinstance(result, dict):
+            result = list(result.values())
+        return Records(result or [], cls)
+
+
+class Balance(_Model):
+    """
+    One asset of `get_balances`.
+
+    Args:
+        data (dict): One balance of the decoded response.
+
+    Example:
+        for balance in Balance.parse(AccountManage(api_key).get_balances()):
+            print(balance.asset, balance.free)
+    """
+
+    __slots__ = ("asset", "value", "locked")
+
+    def __init__(self, data: dict):
+        self.asset = data.get("asset")
+        self.value = _number(data.get("value"))
+        self.locked = _number(data.get("locked"))
+
+    @property
+    def free(self) -> float:
+        """
+        Returns:
+            float: The amount not locked in open orders.
+        """
+        return (self.value or 0.0) - (self.locked or 0.0)
+
+    @classmethod
+    def parse(cls, payload) -> Records:
+        """
+        Args:
+            payload (dict): A `get_balances` response.
+
+        Returns:
+            Records: The balances.
+        """
+        result = _result(payload)
+        if isinstance(result, dict):
+            result = result.get("balances", result)
+        return Records(
+            list(result.values()) if isinstance(result, dict) else result, cls
+        )
+
+
+# ----- Fixed-Point Numbers -----
+DEFAULT_SCALE: int = 8
+
+
+def _to_units(value, scale: int) -> int:
+    """
+    Convert a price or quantity to an integer number of 10**-scale units, exactly.
+
+    Strings and Decimals are converted without going through a float; floats use their
+    shortest repr, so 0.1 becomes exactly 10**(scale - 1) units. Halves round to even.
+    """
+    if isinstance(value, Fixed):
+        return value.rescale(scale).units
+    if isinstance(value, int):
+        return value * 10**scale
+    number = Decimal(repr(value) if isinstance(value, float) else str(value).strip())
+    return int(number.scaleb(scale).to_integral_value(ROUND_HALF_EVEN))
+
+
+@functools.total_ordering
+class Fixed:
+    """
+    An exact decimal number stored as an integer count of 10**-scale units.
+
+    Prices and quantities keep the precision of their market, so sums, differences and
+    comparisons are exact and `str()` gives the wire format expected by the API. The
+    other operand keeps its own decimal places (Fixed("58000", 0) * 0.5 is 29000.0);
+    comparisons and hashing agree with int, float and Decimal. Use `Precision` to get
+    the scales of a market and `to_units`/`from_units` for arrays.
+
+    Args:
+        value (str | int | float | Decimal | Fixed): The number.
+        scale (int, optional): Number of decimal places kept. Defaults to 8.
+
+    Example:
+        price = Fixed("58000.5", 1)
+        quantity = Fixed("0.125", 3)
+        print(price + Fixed("0.5", 1), price * quantity)  # 58001.0 7250.0625
+    """
+
+    __slots__ = ("units", "scale")
+
+    def __init__(self, value, scale: int = DEFAULT_SCALE):
+        self.units = _to_units(value, scale)
+        self.scale = scale
+
+    @classmethod
+    def from_units(cls, units: int, scale: int) -> "Fixed":
+        """
+        :param units(int): The integer number of 10**-scale units.
+        :param scale(int): Number of decimal places.
+        :return: (Fixed) The number units * 10**-scale.
+        """
+        number = cls.__new__(cls)
+        number.units = int(units)
+        number.scale = scale
+        return number
+
+    def rescale(self, scale: int) -> "Fixed":
+        """
+        :param scale(int): The new number of decimal places.
+        :return: (Fixed) The same number at another scale, rounding halves to even.
+        """
+        if scale >= self.scale:
+            return Fixed.from_units(self.units * 10 ** (scale - self.scale), scale)
+        factor = 10 ** (self.scale - scale)
+        quotient, remainder = divmod(self.units, factor)
+        if remainder * 2 > factor or (remainder * 2 == factor and quotient % 2):
+            quotient += 1
+        return Fixed.from_units(quotient, scale)
+
+    def _align(self, other, exact: bool = False):
+        other = _operand(other, exact)
+        if other is None:
+            return None
+        scale = max(self.scale, other.scale)
+        return (
+            self.units * 10 ** (scale - self.scale),
+            other.units * 10 ** (scale - other.scale),
+            scale,
+        )
+
+    def __add__(self, other):
+        aligned = self._align(other)
+        if aligned is None:
+            return NotImplemented
+        a, b, scale = aligned
+        return Fixed.from_units(a + b, scale)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        aligned = self._align(other)
+        if aligned is None:
+            return NotImplemented
+        a, b, scale = aligned
+        return Fixed.from_units(a - b, scale)
+
+    def __rsub__(self, other):
+        aligned = self._align(other)
+        if aligned is None:
+            return NotImplemented
+        a, b, scale = aligned
+        return Fixed.from_units(b - a, scale)
+
+    def __mul__(self, other):
+        other = _operand(other)
+        if other is None:
+            return NotImplemented
+        return Fixed.from_units(self.units * other.units, self.scale + other.scale)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Fixed.from_units(-self.units, self.scale)
+
+    def __abs__(self):
+        return Fixed.from_units(abs(self.units), self.scale)
+
+    def _compare(self, other):
+        if isinstance(other, str):
+            return None
+        return self._align(other, exact=True)
+
+    def __eq__(self, other):
+        aligned = self._compare(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] == aligned[1]
+
+    def __lt__(self, other):
+        aligned = self._compare(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] < aligned[1]
+
+    def __hash__(self):
+        # Equal to the hash of an equal int, float or Decimal.
+        return hash(Decimal(self.units).scaleb(-self.scale))
+
+    def __bool__(self):
+        return self.units != 0
+
+    def __float__(self):
+        return self.units / 10**self.scale
+
+    def __str__(self):
+        sign = "-" if self.units < 0 else ""
+        digits = str(abs(self.units)).rjust(self.scale + 1, "0")
+        if not self.scale:
+            return sign + digits
+        return f"{sign}{digits[:-self.scale]}.{digits[-self.scale:]}"
+
+    def __repr__(self):
+        return f"Fixed('{self}', {self.scale})"
+
+
+def _operand(value, exact: bool = False):
+    """
+    Convert the other operand of a `Fixed` operation to a `Fixed` at its own scale, exactly.
+
+    Ints keep scale 0; strings, Decimals and floats keep all of their decimal places, so
+    nothing is rounded to the scale of the left operand. Floats use their shortest repr
+    (0.1 is 0.1), or their exact binary value with `exact=True` as comparisons do, like
+    Decimal, so that equal numbers hash alike.
+
+    :return: (Fixed | None) The operand, or None if it is not a number.
+    """
+    if isinstance(value, Fixed):
+        return value
+    if isinstance(value, int):
+        return Fixed.from_units(value, 0)
+    if isinstance(value, float):
+        number = Decimal(value) if exact else Decimal(repr(value))
+    elif isinstance(value, (str, Decimal)):
+        try:
+            number = Decimal(str(value).strip())
+        except InvalidOperation:
+            return None
+    else:
+        return None
+    if not number.is_finite():
+        return None
+    scale = max(0, -number.as_tuple().exponent)
+    return Fixed.from_units(int(number.scaleb(scale)), scale)
+
+
+class Precision:
+    """
+    The price and quantity scales of one market.
+
+    Args:
+        price_scale (int, optional): Decimal places of prices. Defaults to 8.
+        quantity_scale (int, optional): Decimal places of quantities. Defaults to 8.
+
+    Example:
+        precision = Precision.from_markets(MarketInfo().get_markets())["USDTTMN"]
+        api.set_order("USDTTMN", "LIMIT", "BUY", precision.price("58000"), precision.quantity(10.5))
+    """
+
+    __slots__ = ("price_scale", "quantity_scale")
+
+    def __init__(
+        self, price_scale: int = DEFAULT_SCALE, quantity_scale: int = DEFAULT_SCALE
+    ):
+        self.price_scale = price_scale
+        self.quantity_scale = quantity_scale
+
+    @classmethod
+    def from_markets(cls, payload) -> dict:
+        """
+        :param payload(dict): A `get_markets` response.
+        :return: (dict) Precision keyed by symbol (quotePrecision for prices, baseAssetPrecision for quantities).
+        """
+
+        def scale(market: dict, key: str) -> int:
+            value = market.get(key)
+            return DEFAULT_SCALE if value in (None, "") else int(value)
+
+        precisions = {}
+        for market in Market.parse(payload)._items:
+            if not isinstance(market, dict):
+                continue
+            precisions[market.get("symbol")] = cls(
+                scale(market, "quotePrecision"), scale(market, "baseAssetPrecision")
+            )
+        return precisions
+
+    def price(self, value) -> Fixed:
+        """
+        :return: (Fixed) The value at this market's price scale.
+        """
+        return Fixed(value, self.price_scale)
+
+    def quantity(self, value) -> Fixed:
+        """
+        :return: (Fixed) The value at this market's quantity scale.
+        """
+        return Fixed(value, self.quantity_scale)
+
+    def __repr__(self):
+        return f"Precision({self.price_scale}, {self.quantity_scale})"
+
+
+def _string_units(value, scale: int) -> int:
+    """
+    Convert a plain decimal string ("58000.25") to units straight from its digits.
+    Anything else (exponents, more than `scale` decimals, non-strings) goes through
+    `_to_units`, which is exact as well.
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        sign = -1 if text.startswith("-") else 1
+        whole, _, fraction = text.lstrip("+-").partition(".")
+        if (
+            len(fraction) <= scale
+            and (whole.isdigit() or (not whole and fraction))
+            and (fraction.isdigit() or not fraction)
+        ):
+            return sign * (
+                int(whole or "0") * 10**scale + int(fraction.ljust(scale, "0") or "0")
+            )
+    return _to_units(value, scale)
+
+
+def to_units(values, scale: int):
+    """
+    Convert many prices or quantities to int64 fixed-point units, exactly.
+
+    Wire strings are parsed straight from their digits, without going through a float,
+    so prices of any magnitude keep every digit (3.9e9 TMN at scale 8 is beyond the
+    2**53 a float holds exactly). Values must fit in int64 once scaled.
+
+    :param values(list | numpy.ndarray): Numeric strings, ints, Decimals or floats.
+    :param scale(int): Number of decimal places.
+    :return: (numpy.ndarray) int64 units.
+    """
+    import numpy as np
+
+    return np.array([_string_units(value, scale) for value in values], dtype=np.int64)
+
+
+def from_units(units, scale: int):
+    """
+    :param units(numpy.ndarray): int64 fixed-point units.
+    :param scale(int): Number of decimal places.
+    :return: (numpy.ndarray) float64 values.
+    """
+    import numpy as np
+
+    return np.asarray(units, dtype=np.int64) / 10.0**scale
+
+
+def depth_units(payload, side: str = None, precision: Precision = None) -> tuple:
+    """
+    Parse one side of a depth payload into fixed-point price and quantity arrays.
+
+    :param payload(dict | list): A depth response or a depth channel payload.
+    :param side(str): "ask" or "bid" when `payload` holds both sides.
+    :param precision(Precision): The market's scales. Defaults to Precision().
+    :return: (tuple) (prices, quantities) as int64 unit arrays.
+    """
+    precision = precision if precision is not None else Precision()
+    levels = _raw_levels(DepthLevel.parse(payload, side)._items)
+    prices = [level[0] for level in levels]
+    quantities = [level[1] for level in levels]
+    return (
+        to_units(prices, precision.price_scale),
+        to_units(quantities, precision.quantity_scale),
+    )
+
+
+def trade_units(payload, precision: Precision = None) -> tuple:
+    """
+    Parse trades into fixed-point price and quantity arrays.
+
+    :param payload(dict | list): A trades response, or a list of trades.
+    :param precision(Precision): The market's scales. Defaults to Precision().
+    :return: (tuple) (prices, quantities) as int64 unit arrays.
+    """
+    precision = precision if precision is not None else Precision()
+    trades = Trade.parse(payload)._items
+    return (
+        to_units([trade["price"] for trade in trades], precision.price_scale),
+        to_units([trade["quantity"] for trade in trades], precision.quantity_scale),
+    )
+
+
+def _wire_str(value):
+    return str(value) if isinstance(value, Fixed) else value
+
+
+class MarketInfo:
+    """
+    A class for interacting with the Wallex API to retrieve market-related information.
+
+    Args:
+        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+        transport (HTTPTransport, optional): Pooled transport to send requests through. Defaults to the shared transport.
+        cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+
+    Methods:
+        get_markets(self): Retrieves a list of available markets.
+        get_currencies(self): Retrieves currency statistics.
+        get_order_book_symbol(self, symbol: str): Retrieves the order book for a specific symbol.
+        get_order_book_all(self, symbol: str): Retrieves the order book for all symbols.
+        get_latest_trades(self, symbol: str): Retrieves the latest trades for a specific symbol.
+        get_market_history(self, symbol: str, resolution: str, time_from: int, time_to: int): Retrieves market history data for a specific symbol and time range.
+        get_order_book_symbols(self, symbols: list, max_workers: int = 8): Retrieves the order books for several symbols concurrently.
+        get_latest_trades_symbols(self, symbols: list, max_workers: int = 8): Retrieves the latest trades for several symbols concurrently.
+        get_market_history_range(self, symbol: str, resolution: str, time_from: int, time_to: int, ...): Retrieves long-range market history as NumPy arrays.
+
+    Example:
+        api = MarketInfo()
+        symbol = "USDTTMN"
+        m00_time = int(time.time())
+        h01_time = m00_time - (m00_time % (60 * 60))
+
+        # Retrieve a list of available markets
+        markets = api.get_markets()
+        print("Markets Result:")
+        print(markets)
+
+        # Retrieve currency statistics
+        currencies = api.get_currencies()
+        print("Currencies Result:")
+        print(currencies)
+
+        # Retrieve the order book for a specific symbol
+        order_book_symbol = api.get_order_book_symbol(symbol)
+        print("Order Book for Symbol Result:")
+        print(order_book_symbol)
+
+        # Retrieve the order book for all symbols
+        order_book_all = api.get_order_book_all(symbol)
+        print("Order Book for All Symbols Result:")
+        print(order_book_all)
+
+        # Retrieve the latest trades for a specific symbol
+        latest_trades = api.get_latest_trades(symbol)
+        print("Latest Trades Result:")
+        print(latest_trades)
+
+        # Retrieve market history data for a specific symbol and time range
+        time_from = h01_time - 60 * 60 * 5
+        time_to = h01_time
+        market_history = api.get_market_history(symbol, "60", time_from, time_to)
+        print("Market History Result:")
+        print(market_history)
+    """
+
+    def __init__(
+        self,
+        base_url=BASE_URL,
+        transport: HTTPTransport = None,
+        cache: ResponseCache = None,
+    ):
+        """
+        Initializes a new instance of the MarketInfo class.
+
+        Args:
+            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            transport (HTTPTransport, optional): Pooled transport to send requests through. Defaults to the shared transport.
+            cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+        """
+        self.BASE_URL = base_url
+        self.transport = transport if transport is not None else get_default_transport()
+        self.cache = cache
+
+    def _make_request(self, endpoint, params=None):
+        """
+        Sends an HTTP GET request to the specified endpoint.
+
+        Args:
+            endpoint (str): The API endpoint to request.
+            params (dict, optional): Query parameters to include in the request. Defaults to None.
+
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            requests.exceptions.RequestException: If a network-related error occurs.
+            requests.exceptions.HTTPError: If an HTTP error (4xx or 5xx) occurs.
+        """
+        try:
+            response = self.transport.request(
+                "GET", self.BASE_URL + endpoint, params=params
+            )
+            # response.raise_for_status()  # Raises an exception for 4xx and 5xx status codes
+            return _decode(self.transport, response)
+        except requests.exceptions.RequestException as e:
+            raise requests.exceptions.RequestException(f"(Request) error: {e}")
+        except requests.exceptions.HTTPError as e:
+            raise requests.exceptions.HTTPError(f"(HTTP) error: {e}")
+
+    def get_markets(self, endpoint=MARKET_EP["markets"]):
+        """
+        Retrieves a list of available markets.
+
+        Returns:
+            dict: A dictionary containing market information.
+        """
+        return _cached(self, endpoint, lambda: self._make_request(endpoint))
+
+    def get_currencies(self, endpoint=MARKET_EP["currencies_stats"]):
+        """
+        Retrieves currency statistics.
+
+        Returns:
+            dict: A dictionary containing currency statistics.
+        """
+        return _cached(self, endpoint, lambda: self._make_request(endpoint))
+
+    def get_order_book_symbol(
+        self, symbol: str, endpoint=MARKET_EP["order_book_symbol"]
+    ):
+        """
+        Retrieves the order book for a specific symbol.
+
+        Args:
+            symbol (str): The symbol for which to retrieve the order book.
+
+        Returns:
+            dict: A dictionary containing the order book for the specified symbol.
+        """
+        params = {"symbol": symbol}
+        return self._make_request(endpoint, params=params)
+
+    def get_order_book_all(self, symbol: str, endpoint=MARKET_EP["order_book_all"]):
+        """
+        Retrieves the order book for all symbols.
+
+        Args:
+            symbol (str): The symbol for which to retrieve the order book.
+
+        Returns:
+            dict: A dictionary containing the order book for all symbols.
+        """
+        params = {"symbol": symbol}
+        return self._make_request(endpoint, params=params)
+
+    def get_latest_trades(self, symbol: str, endpoint=MARKET_EP["latest_trades"]):
+        """
+        Retrieves the latest trades for a specific symbol.
+
+        Args:
+            symbol (str): The symbol for which to retrieve the latest trades.
+
+        Returns:
+            dict: A dictionary containing the latest trades for the specified symbol.
+        """
+        params = {"symbol": symbol}
+        return self._make_request(endpoint, params=params)
+
+    def get_market_history(
+        self,
+        symbol: str,
+        resolution: str,
+        time_from: int,
+        time_to: int,
+        endpoint=MARKET_EP["market_history"],
+    ):
+        """
+        Retrieves market history data for a specific symbol and time range.
+
+        Args:
+            symbol (str): The symbol for which to retrieve market history.
+            resolution (str): The time interval for data (e.g., "60" for 1-hour intervals).
+            time_from (int): The start time for data retrieval (Unix timestamp in seconds).
+            time_to (int): The end time for data retrieval (Unix timestamp in seconds).
+
+        Returns:
+            dict: A dictionary containing market history data.
+        """
+        params = {
+            "symbol": symbol,
+            "resolution": resolution,
+            "from": time_from,
+            "to": time_to,
+        }
+        return self._make_request(endpoint, params=params)
+
+    def get_order_book_symbols(self, symbols: list, max_workers: int = MAX_WORKERS):
+        """
+        Retrieves the order books for several symbols concurrently.
+
+        Args:
+            symbols (list): The symbols for which to retrieve the order books.
+            max_workers (int, optional): Maximum number of requests in flight at once. Defaults to 8.
+
+        Returns:
+            dict: Order book responses keyed by symbol; a failed symbol maps to {"error": "..."}.
+        """
+        return _fan_out(self.get_order_book_symbol, symbols, max_workers)
+
+    def get_latest_trades_symbols(self, symbols: list, max_workers: int = MAX_WORKERS):
+        """
+        Retrieves the latest trades for several symbols concurrently.
+
+        Args:
+            symbols (list): The symbols for which to retrieve the latest trades.
+            max_workers (int, optional): Maximum number of requests in flight at once. Defaults to 8.
+
+        Returns:
+            dict: Latest trades responses keyed by symbol; a failed symbol maps to {"error": "..."}.
+        """
+        return _fan_out(self.get_latest_trades, symbols, max_workers)
+
+    def get_market_history_range(
+        self,
+        symbol: str,
+        resolution: str,
+        time_from: int,
+        time_to: int,
+        bars_per_chunk: int = HISTORY_BARS_PER_CHUNK,
+        max_workers: int = MAX_WORKERS,
+    ):
+        """
+        Retrieves market history over a long time range as columnar NumPy arrays.
+
+        The range is split into chunks of at most `bars_per_chunk` bars, which are fetched
+        concurrently with get_market_history and merged by timestamp. Requires NumPy.
+
+        Args:
+            symbol (str): The symbol for which to retrieve market history.
+            resolution (str): The time interval for data (e.g., "1" for 1-minute intervals).
+            time_from (int): The start time for data retrieval (Unix timestamp in seconds).
+            time_to (int): The end time for data retrieval (Unix timestamp in seconds).
+            bars_per_chunk (int, optional): Maximum number of bars per request. Defaults to 1000.
+            max_workers (int, optional): Maximum number of requests in flight at once. Defaults to 8.
+
+        Returns:
+            dict: "t" (int64) and "o", "h", "l", "c", "v" (float64) arrays, sorted and deduplicated by "t".
+
+        Raises:
+            requests.exceptions.RequestException: If any chunk fails.
+        """
+        chunks = _history_chunks(resolution, time_from, time_to, bars_per_chunk)
+        responses = _fan_out(
+            lambda chunk: self.get_market_history(symbol, resolution, *chunk),
+            chunks,
+            max_workers,
+        )
+        return _merge_history([responses[chunk] for chunk in chunks])
+
+
+class AccountManage:
+    """
+    A Python client for interacting with the Wallex API to manage user accounts and perform financial operations.
+
+    Args:
+        api_key (str): Your Wallex API key.
+        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+        transport (HTTPTransport, optional): Pooled transport to send requests through. Defaults to the shared transport.
+        cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+
+    Methods:
+        get_profile(): Get the user's profile information.
+        get_fee(): Get user level and fee information related to the user's account.
+        get_card_numbers(): Get bank card numbers associated with the user's account.
+        get_ibans(): Get IBANs associated with the user's account.
+        get_balances(): Get wallet assets balances for the user's account.
+        get_money_deposit(): Get information related to money (Toman) deposits in the user's account.
+        get_money_withdrawal(): Get information related to money (Toman) withdrawal in the user's account.
+        get_crypto_deposit(): Get information related to cryptocurrency deposits in the user's account.
+        get_crypto_withdrawal(): Get information related to cryptocurrency withdrawal in the user's account.
+        get_transfer(): Get information related to transfers in the user's account.
+        iter_money_deposit(), iter_money_withdrawal(), iter_crypto_deposit(), iter_crypto_withdrawal(), iter_transfer():
+            Iterate over the full history of each endpoint page by page, yielding one record (dict) at a time.
+            They all take per_page (records per page, default 50), time_from/time_to (skip records outside
+            these Unix timestamps) and prefetch (request the next page while the current one is consumed,
+            default True).
+        set_money_withdrawal(iban, value): Initiate a money (Toman) withdrawal from the user's account to a specified IBAN.
+        set_crypto_withdrawal(coin, network, value, wallet_address, memo=None): Initiate a cryptocurrency withdrawal from the user's account.
+
+    Example:
+        api_key = "Your API Key"
+        api = AccountManage(api_key)
+
+        # Get the user's profile information
+        profile_info = api.get_profile()
+        print("User Profile:")
+        print(profile_info)
+
+        # Get user level and fee information
+        fee_info = api.get_fee()
+        print("User Fee Information:")
+        print(fee_info)
+
+        # Get bank card numbers
+        card_numbers = api.get_card_numbers()
+        print("Bank Card Numbers:")
+        print(card_numbers)
+
+        # Get IBANs
+        ibans = api.get_ibans()
+        print("IBANs:")
+        print(ibans)
+
+        # Get wallet balances
+        balances = api.get_balances()
+        print("Wallet Balances:")
+        print(balances)
+
+        # Get money deposit information
+        money_deposit_info = api.get_money_deposit()
+        print("Money Deposit Information:")
+        print(money_deposit_info)
+
+        # Get money withdrawal information
+        money_withdrawal_info = api.get_money_withdrawal()
+        print("Money Withdrawal Information:")
+        print(money_withdrawal_info)
+
+        # Get cryptocurrency deposit information
+        crypto_deposit_info = api.get_crypto_deposit()
+        print("Crypto Deposit Information:")
+        print(crypto_deposit_info)
+
+        # Get cryptocurrency withdrawal information
+        crypto_withdrawal_info = api.get_crypto_withdrawal()
+        print("Crypto Withdrawal Information:")
+        print(crypto_withdrawal_info)
+
+        # Get transfer information
+        transfer_info = api.get_transfer()
+        print("Transfer Information:")
+        print(transfer_info)
+
+        # Initiate a money withdrawal
+        iban_to_withdraw_to = "Your IBAN"
+        amount_to_withdraw = 100.0  # Replace with the amount you want to withdraw
+        money_withdrawal_result = api.set_money_withdrawal(iban_to_withdraw_to, amount_to_withdraw)
+        print("Money Withdrawal Result:")
+        print(money_withdrawal_result)
+
+        # Initiate a cryptocurrency withdrawal
+        coin = "USDT"
+        network = "TRC20"
+        value = 100.0  # Replace with the amount you want to withdraw
+        wallet_address = "Your wallet address"  # Replace with your wallet address
+        crypto_withdrawal_result = api.set_crypto_withdrawal(coin, network, value, wallet_address)
+        print("Crypto Withdrawal Result:")
+        print(crypto_withdrawal_result)
+    """
+
+    def __init__(
+        self,
+        api_key,
+        base_url=BASE_URL,
+        transport: HTTPTransport = None,
+        cache: ResponseCache = None,
+    ):
+        """
+        Initialize the Wallex Account API client with the provided API key.
+
+        Args:
+            api_key (str): Your Wallex API key.
+            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            transport (HTTPTransport, optional): Pooled transport to send requests through. Defaults to the shared transport.
+            cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+        """
+        self.api_key = api_key
+        self.BASE_URL = base_url
+        self.CONTENT_TYPE = CONTENT_TYPE
+        self.transport = transport if transport is not None else get_default_transport()
+        self.cache = cache
+
+    def _make_request(self, endpoint, method="GET", params=None, json_payload=None):
+        """
+        Make an HTTP request to the Wallex API.
+
+        Args:
+            endpoint (str): The API endpoint.
+            method (str): The HTTP method (GET or POST).
+            params (dict): Query parameters (for GET requests).
+            json_payload (dict): JSON payload (for POST requests).
+
+        Returns:
+            dict: JSON response from the API or an error message.
+        """
+        url = self.BASE_URL + endpoint
+        headers = {
+            "Content-Type": self.CONTENT_TYPE,
+            "x-api-key": self.api_key,
+        }
+        try:
+            response = self.transport.request(
+                method, url, headers=headers, params=params, json=json_payload
+            )
+            return _decode(self.transport, response)
+
+        except requests.exceptions.RequestException as e:
+            return f"(Request) error: {e}"
+        except requests.exceptions.HTTPError as e:
+            return f"(HTTP) error: {e}"
+
+    def get_profile(self, endpoint=ACCOUNT_EP["profile"]):
+        """
+        Get the user's profile information.
+
+        Returns:
+            dict: User profile information.
+        """
+        return self._make_request(endpoint)
+
+    def get_fee(self, endpoint=ACCOUNT_EP["fee"]):
+        """
+        Get User level and fee information related to the user's account.
+
+        Returns:
+            dict: User level and fee information.
+        """
+        return _cached(self, endpoint, lambda: self._make_request(endpoint))
+
+    def get_card_numbers(self, endpoint=ACCOUNT_EP["card_numbers"]):
+        """
+        Get bank card numbers with the user's account.
+
+        Returns:
+            dict: Bank card numbers information.
+        """
+        return _cached(self, endpoint, lambda: self._make_request(endpoint))
+
+    def get_ibans(self, endpoint=ACCOUNT_EP["ibans"]):
+        """
+        Get IBANs associated with the user's account.
+
+        Returns:
+            dict: IBANs information.
+        """
+        return _cached(self, endpoint, lambda: self._make_request(endpoint))
+
+    def get_balances(self, endpoint=ACCOUNT_EP["balances"]):
+        """
+        Get Wallet assets balances for the user's account.
+
+        Returns:
+            dict: Account balances.
+        """
+        return self._make_request(endpoint)
+
+    def get_money_deposit(self, endpoint=ACCOUNT_EP["money_deposit"]):
+        """
+        Get information related to money (Toman) deposits in the user's account.
+
+        Returns:
+            dict: Money (Toman) deposit information.
+        """
+        return self._make_request(endpoint)
+
+    def get_money_withdrawal(self, endpoint=ACCOUNT_EP["money_withdrawal"]):
+        """
+        Get information related to money (Toman) withdrawal in the user's account.
+
+        Returns:
+            dict: Money (Toman) withdrawal information.
+        """
+        return self._make_request(endpoint)
+
+    def get_crypto_deposit(self, endpoint=ACCOUNT_EP["crypto_deposit"]):
+        """
+        Get information related to cryptocurrency deposits in the user's account.
+
+        Returns:
+            dict: Cryptocurrency deposit information.
+        """
+        return self._make_request(endpoint)
+
+    def get_crypto_withdrawal(self, endpoint=ACCOUNT_EP["crypto_withdrawal"]):
+        """
+        Get information related to cryptocurrency withdrawal in the user's account.
+
+        Returns:
+            dict: Cryptocurrency withdrawal information.
+        """
+        return self._make_request(endpoint)
+
+    def get_transfer(self, endpoint=ACCOUNT_EP["transfers"]):
+        """
+        Get information related to transfer in the user's account.
+
+        Returns:
+            dict: Transfer information.
+        """
+        return self._make_request(endpoint)
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: dict = None,
+        per_page: int = PAGE_SIZE,
+        time_from: float = None,
+        time_to: float = None,
+        prefetch: bool = True,
+    ):
+        return _paginate(
+            lambda page: self._make_request(
+                endpoint, params=dict(params or {}, page=page, per_page=per_page)
+            ),
+            PAGE_KEYS.get(endpoint),
+            time_from,
+            time_to,
+            prefetch,
+        )
+
+    def iter_money_deposit(
+        self,
+        per_page: int = PAGE_SIZE,
+        time_from: float = None,
+        time_to: float = None,
+        prefetch: bool = True,
+        endpoint=ACCOUNT_EP["money_deposit"],
+    ):
+        """
+        Iterate over the full history of money (Toman) deposits; see the class docstring for the arguments.
+        """
+        return self._iter_pages(endpoint, None, per_page, time_from, time_to, prefetch)
+
+    def iter_money_withdrawal(
+        self,
+        per_page: int = PAGE_SIZE,
+        time_from: float = None,
+        time_to: float = None,
+        prefetch: bool = True,
+        endpoint=ACCOUNT_EP["money_withdrawal"],
+    ):
+        """
+        Iterate over the full history of money (Toman) withdrawals; see the class docstring for the arguments.
+        """
+        return self._iter_pages(endpoint, None, per_page, time_from, time_to, prefetch)
+
+    def iter_crypto_deposit(
+        self,
+        per_page: int = PAGE_SIZE,
+        time_from: float = None,
+        time_to: float = None,
+        prefetch: bool = True,
+        endpoint=ACCOUNT_EP["crypto_deposit"],
+    ):
+        """
+        Iterate over the full history of cryptocurrency deposits; see the class docstring for the arguments.
+        """
+        return self._iter_pages(endpoint, None, per_page, time_from, time_to, prefetch)
+
+    def iter_crypto_withdrawal(
+        self,
+        per_page: int = PAGE_SIZE,
+        time_from: float = None,
+        time_to: float = None,
+        prefetch: bool = True,
+        endpoint=ACCOUNT_EP["crypto_withdrawal"],
+    ):
+        """
+        Iterate over the full history of cryptocurrency withdrawals; see the class docstring for the arguments.
+        """
+        return self._iter_pages(endpoint, None, per_page, time_from, time_to, prefetch)
+
+    def iter_transfer(
+        self,
+        per_page: int = PAGE_SIZE,
+        time_from: float = None,
+        time_to: float = None,
+        prefetch: bool = True,
+        endpoint=ACCOUNT_EP["transfers"],
+    ):
+        """
+        Iterate over the full history of transfers; see the class docstring for the arguments.
+        """
+        return self._iter_pages(endpoint, None, per_page, time_from, time_to, prefetch)
+
+    def set_money_withdrawal(
+        self, iban: int, value: float, endpoint=ACCOUNT_EP["money_withdrawal"]
+    ):
+        """
+        Initiate a money (Toman) withdrawal from the user's account to a specified IBAN.
+
+        Args:
+            iban (int): The IBAN (Shaba) to which money will be withdrawn.
+            value (float | Fixed): The amount of money (Toman) to withdraw.
+
+        Returns:
+            dict: Withdrawal request result or an error message.
+        """
+        payload_money_withdrawal: dict = {"iban": iban, "value": _wire_str(value)}
+        return self._make_request(
+            endpoint, method="POST", json_payload=payload_money_withdrawal
+        )
+
+    def set_crypto_withdrawal(
+        self,
+        coin: str,
+        network: str,
+        value: float,
+        wallet_address: str,
+        memo=None,
+        endpoint=ACCOUNT_EP["crypto_withdrawal"],
+    ):
+        """
+        Initiate a cryptocurrency withdrawal from the user's account.
+
+        Args:
+            coin (str): The cryptocurrency coin symbol (e.g., "BTC").
+            network (str): The network or blockchain (e.g., "Bitcoin").
+            value (float | Fixed): The amount of cryptocurrency to withdraw.
+            wallet_address (str): The recipient's cryptocurrency wallet address.
+            memo (str, optional): Additional address memo; If the network needs.
+
+        Returns:
+            dict: Withdrawal request result or an error message.
+        """
+        payload_crypto_withdrawal: dict = {
+            "coin": coin,
+            "network": network,
+            "value": _wire_str(value),
+            "wallet_address": wallet_address,
+            "memo": memo,
+        }
+        return self._make_request(
+            endpoint, method="POST", json_payload=payload_crypto_withdrawal
+        )
+
+
+class OrdersManage:
+    """
+    A Python client for interacting with the Wallex API to place orders and manage trading.
+
+    Args:
+        api_key (str): Your Wallex API key.
+        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+        transport (HTTPTransport, optional): Pooled transport to send requests through. Defaults to the shared transport.
+
+    Methods:
+        set_order(self, symbol: str, type_order: str, side: str, price: str, quantity: str, client_id: str = None) -> dict
+            Place an order with the Wallex API.
+
+        get_order(self, clientOrderId: str) -> dict
+            Get information about a specific order by its clientOrderId.
+
+        del_order(self, clientOrderId: str) -> dict
+            Cancel an order by its clientOrderId.
+
+        get_open_orders(self, symbol: str = None) -> dict
+            Get a list of open orders.
+
+        get_last_trades(self, symbol: str = None, side: str = None) -> dict
+            Get a list of the last trades.
+
+        iter_last_trades(self, symbol: str = None, side: str = None, per_page: int = 50, time_from: float = None, time_to: float = None, prefetch: bool = True)
+            Iterate over the full trade history, prefetching the next page in the background.
+
+        set_orders(self, orders: list, max_workers: int = 8) -> list
+            Place several orders concurrently.
+
+        cancel_orders(self, client_ids: list, max_workers: int = 8) -> dict
+            Cancel several orders concurrently by their clientOrderIds.
+
+        cancel_all(self, symbol: str = None, client_id_prefix: str = None, side: str = None, max_workers: int = 8) -> dict
+            Cancel every open order matching the filters.
+
+    Example:
+        # Replace with your actual API key
+        api_key: str = "Your-API-Key-Here"
+        api: OrdersManage = OrdersManage(api_key)
+
+        # Example usage of set_order function
+        symbol: str = "USDTTMN"
+        type_order: str = "LIMIT"
+        side: str = "BUY"
+        price: str = "50000"
+        quantity: str = "10"
+        client_id: str = "mohsen_zehtabchi_00001"
+
+        set_order_result = api.set_order(symbol, type_order, side, price, quantity, client_id)
+        print("Set Order Result:")
+        print(set_order_result)
+
+        # Example usage of get_order function
+        client_order_id_to_get = "mohsen_zehtabchi_00001"
+        get_order_result = api.get_order(client_order_id_to_get)
+        print("Get Order Result:")
+        print(get_order_result)
+
+        # Example usage of del_order function
+        client_order_id_to_cancel = "mohsen_zehtabchi_00001"
+        cancel_order_result = api.del_order(client_order_id_to_cancel)
+        print("Cancel Order Result:")
+        print(cancel_order_result)
+
+        # Example usage of get_open_orders function
+        open_orders_result = api.get_open_orders(symbol="USDTTMN")
+        print("Open Orders Result:")
+        print(open_orders_result)
+
+        # Example usage of get_last_trades function
+        last_trades_result = api.get_last_trades(symbol="USDTTMN", side="buy")
+        print("Last Trades Result:")
+        print(last_trades_result)
+
+        # Example usage of set_orders and cancel_all functions
+        ladder = [
+            {"symbol": "USDTTMN", "type_order": "LIMIT", "side": "BUY",
+             "price": str(49000 + 100 * i), "quantity": "10", "client_id": f"ladder_{i}"}
+            for i in range(10)
+        ]
+        set_orders_result = api.set_orders(ladder)
+        cancel_all_result = api.cancel_all(symbol="USDTTMN", client_id_prefix="ladder_")
+    """
+
+    def __init__(
+        self, api_key: str, base_url=BASE_URL, transport: HTTPTransport = None
+    ):
+        """
+        Initialize the API client with the provided API key.
+
+        Args:
+            api_key (str): Your Wallex API key.
+            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            transport (HTTPTransport, optional): Pooled transport to send requests through. Defaults to the shared transport.
+        """
+        self.api_key: str = api_key
+        self.BASE_URL = base_url
+        self.CONTENT_TYPE = CONTENT_TYPE
+        self.transport = transport if transport is not None else get_default_transport()
+
+    def _make_request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: dict = None,
+        json_payload: dict = None,
+    ) -> dict:
+        """
+        Make an HTTP request to the Wallex API.
+
+        :param endpoint(str): The API endpoint.
+        :param method(str): The HTTP method (GET or POST or DELETE).
+        :param params(dict): Query parameters (for GET requests).
+        :param json_payload(dict): JSON payload (for POST requests).
+        :return: (dict) JSON response or an error message.
+        """
+        try:
+            response = self._send(endpoint, method, params, json_payload)
+            return _decode(self.transport, response)
+        except requests.exceptions.RequestException as e:
+            return {"error": f"(Request) error: {e}"}
+        except requests.exceptions.HTTPError as e:
+            return {"error": f"(HTTP) error: {e}"}
+
+    def _send(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: dict = None,
+        json_payload: dict = None,
+    ):
+        """
+        Send an authenticated request and return the raw response.
+
+        :raises requests.exceptions.RequestException: If a network-related error occurs.
+        """
+        url: str = self.BASE_URL + endpoint
+        headers: dict = {
+            "Content-Type": self.CONTENT_TYPE,
+            "x-api-key": self.api_key,
+        }
+        return self.transport.request(
+            method, url, headers=headers, params=params, json=json_payload
+        )
+
+    def _lookup_order(self, client_id: str, endpoint: str):
+        """
+        Look an order up by its client ID after an uncertain submission.
+
+        :return: (tuple) (order, known): the order response if it exists, and whether
+                 the exchange answered definitively (False when the lookup itself failed).
+        """
+        try:
+            response = self._send(f"{endpoint}/{client_id}")
+            result = _decode(self.transport, response)
+        except requests.exceptions.RequestException:
+            return None, False
+        if response.status_code == 404:
+            return None, True
+        if response.status_code >= 300:
+            return None, False
+        if isinstance(result, dict) and result.get("result"):
+            return result, True
+        return None, True
+
+    def _submit_order(self, endpoint: str, payload: dict, policy: RetryPolicy) -> dict:
+        """
+        Submit an order, retrying without ever placing it twice.
+
+        After a failed or ambiguous attempt the order is looked up by its client ID. It is
+        only sent again once the exchange has confirmed that it does not know the order.
+        """
+        client_id = payload["client_id"]
+        attempt = 0
+        submit = True
+        while True:
+            retry_after = None
+            if submit:
+                try:
+                    response = self._send(endpoint, "POST", json_payload=payload)
+                    if response.status_code not in policy.statuses:
+                        return _decode(self.transport, response)
+                    error = f"(HTTP) error: {response.status_code}"
+                    retry_after = _retry_after(response.headers)
+                except requests.exceptions.RequestException as e:
+                    error = f"(Request) error: {e}"
+            attempt += 1
+            if attempt > policy.max_retries:
+                return {"error": error}
+            time.sleep(policy.delay(attempt, retry_after))
+            order, submit = self._lookup_order(client_id, endpoint)
+            if order is not None:
+                return order
+
+    def _validate_client_id(self, client_id: str) -> bool:
+        """
+        Validate the client ID string.
+
+        :param client_id(str): The client ID string to validate.
+        :return: (bool) True if valid, False otherwise.
+        """
+        pattern = re.compile(r"^[\w.:-]+$")
+        # Allow letters, numbers, '.', ':', '-' and '_'
+        return bool(pattern.match(client_id))
+
+    def set_order(
+        self,
+        symbol: str,
+        type_order: str,
+        side: str,
+        price: str,
+        quantity: str,
+        client_id: str = None,
+        endpoint=ORDERS_EP["orders"],
+    ) -> dict:
+        """
+        Place an order with the Wallex API.
+
+        :param symbol(str): The trading symbol.
+        :param type_order(str): Order type (LIMIT or MARKET).
+        :param side(str): Order side (BUY or SELL).
+        :param price(str | Fixed): Order price (for LIMIT orders).
+        :param quantity(str | Fixed): Order quantity.
+        :param client_id(str): Unique client identifier (optional). When the transport has a
+                               retry policy, one is generated if missing so that the order can
+                               be looked up before it is ever resubmitted.
+        :return: (dict) JSON response or an error message.
+        """
+
+        payload: dict = {
+            "symbol": symbol,
+            "type": type_order,
+            "side": side,
+            "price": _wire_str(price),
+            "quantity": _wire_str(quantity),
+        }
+
+        if client_id:
+            if not self._validate_client_id(client_id):
+                return {
+                    "error": "Invalid client ID. Only letters, numbers, '.', ':', '-' and '_' are allowed."
+                }
+            payload["client_id"] = client_id
+
+        policy = getattr(self.transport, "retry_policy", None)
+        if policy is not None:
+            payload.setdefault("client_id", uuid.uuid4().hex)
+            return self._submit_order(endpoint, payload, policy)
+        return self._make_request(endpoint, method="POST", json_payload=payload)
+
+    def get_order(self, clientOrderId: str, endpoint=ORDERS_EP["orders"]) -> dict:
+        """
+        Get information about a specific order by its clientOrderId.
+
+        :param clientOrderId(str): The unique client identifier of the order.
+        :return: (dict) JSON response or an error message.
+        """
+        endpoint = f"{endpoint}/{clientOrderId}"
+        return self._make_request(endpoint)
+
+    def del_order(self, clientOrderId: str, endpoint=ORDERS_EP["orders"]) -> dict:
+        """
+        Cancel an order by its clientOrderId.
+
+        :param clientOrderId(str): The unique client identifier of the order to cancel.
+        :return: (dict) JSON response or an error message.
+        """
+        endpoint = f"{endpoint}/{clientOrderId}"
+        return self._make_request(endpoint, method="DELETE")
+
+    def get_open_orders(
+        self, symbol: str = None, endpoint=ORDERS_EP["openOrders"]
+    ) -> dict:
+        """
+        Get a list of open orders.
+
+        :param symbol(str): The trading symbol (optional).
+        :return: (dict) JSON response or an error message.
+        """
+        # params = {"symbol": symbol} if symbol else None
+        params = {"symbol": symbol}
+        return self._make_request(endpoint, params=params)
+
+    def get_last_trades(
+        self, symbol: str = None, side: str = None, endpoint=ORDERS_EP["last_trades"]
+    ) -> dict:
+        """
+        Get a list of the last trades.
+
+        :param symbol(str): The trading symbol (optional).
+        :param side(str): Order side ("buy" or "sell") (optional).
+        :return: (dict) JSON response or an error message.
+        """
+        # params = {"symbol": symbol, "side": side} if symbol and side else None
+        params = {"symbol": symbol, "side": side}
+        return self._make_request(endpoint, params=params)
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: dict = None,
+        per_page: int = PAGE_SIZE,
+        time_from: float = None,
+        time_to: float = None,
+        prefetch: bool = True,
+    ):
+        return _paginate(
+            lambda page: self._make_request(
+                endpoint, params=dict(params or {}, page=page, per_page=per_page)
+            ),
+            PAGE_KEYS.get(endpoint),
+            time_from,
+            time_to,
+            prefetch,
+        )
+
+    def iter_last_trades(
+        self,
+        symbol: str = None,
+        side: str = None,
+        per_page: int = PAGE_SIZE,
+        time_from: float = None,
+        time_to: float = None,
+        prefetch: bool = True,
+        endpoint=ORDERS_EP["last_trades"],
+    ):
+        """
+        Iterate over the full trade history, page by page.
+
+        :param symbol(str): The trading symbol (optional).
+        :param side(str): Order side ("buy" or "sell") (optional).
+        :param per_page(int): Records per page.
+        :param time_from(float): Skip trades older than this Unix timestamp (optional).
+        :param time_to(float): Skip trades newer than this Unix timestamp (optional).
+        :param prefetch(bool): Request the next page while the current one is consumed.
+        :return: (generator) One trade (dict) at a time.
+        """
+        params = {"symbol": symbol, "side": side}
+        return self._iter_pages(
+            endpoint, params, per_page, time_from, time_to, prefetch
+        )
+
+    def set_orders(self, orders: list, max_workers: int = MAX_WORKERS) -> list:
+        """
+        Place several orders concurrently over the pooled transport.
+
+        :param orders(list): Orders as dicts of `set_order` arguments (symbol, type_order,
+                             side, price, quantity and optionally client_id).
+        :param max_workers(int): Maximum number of orders in flight at once.
+        :return: (list) One result per order, in the same order as `orders`.
+        """
+        results = _fan_out(
+            lambda i: self.set_order(**orders[i]), range(len(orders)), max_workers
+        )
+        return [results[i] for i in range(len(orders))]
+
+    def cancel_orders(self, client_ids: list, max_workers: int = MAX_WORKERS) -> dict:
+        """
+        Cancel several orders concurrently by their clientOrderIds.
+
+        :param client_ids(list): The clientOrderIds of the orders to cancel.
+        :param max_workers(int): Maximum number of cancellations in flight at once.
+        :return: (dict) Results keyed by clientOrderId.
+        """
+        return _fan_out(self.del_order, client_ids, max_workers)
+
+    def cancel_all(
+        self,
+        symbol: str = None,
+        client_id_prefix: str = None,
+        side: str = None,
+        max_workers: int = MAX_WORKERS,
+    ) -> dict:
+        """
+        Cancel every open order matching the filters.
+
+        :param symbol(str): Only cancel orders of this symbol (optional).
+        :param client_id_prefix(str): Only cancel orders whose clientOrderId starts with this prefix (optional).
+        :param side(str): Only cancel orders on this side, "BUY" or "SELL" (optional).
+        :param max_workers(int): Maximum number of cancellations in flight at once.
+        :return: (dict) Results keyed by clientOrderId, or the open orders error.
+        """
+        open_orders = self.get_open_orders(symbol)
+        client_ids = _select_orders(open_orders, client_id_prefix, side)
+        if client_ids is None:
+            return open_orders
+        return self.cancel_orders(client_ids, max_workers)
+
+
+class MarketsOTC:
+    """
+    A Python client for interacting with the Wallex OTC Markets API.
+
+    Args:
+        api_key (str): Your Wallex API key.
+        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+        transport (HTTPTransport, optional): Pooled transport to send requests through. Defaults to the shared transport.
+        cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+
+    Methods:
+        get_otc_markets():
+            Get OTC markets.
+
+            Returns:
+                dict: JSON response or an error message.
+
+        get_otc_price(symbol: str, side: str):
+            Get the OTC price for a specific symbol and side.
+
+            Args:
+                symbol (str): The trading symbol.
+                side (str): OTC side (BUY or SELL).
+
+            Returns:
+                dict: JSON response or an error message.
+
+        get_otc_orders(symbol: str, side: str, amount: float):
+            Get OTC orders for a specific symbol, side, and amount.
+
+            Args:
+                symbol (str): The trading symbol.
+                side (str): OTC side (BUY or SELL).
+                amount (float): The amount of the OTC order.
+
+            Returns:
+                dict: JSON response or an error message.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        base_url=BASE_URL,
+        transport: HTTPTransport = None,
+        cache: ResponseCache = None,
+    ):
+        """
+        Initialize the API client with the provided API key.
+
+        Args:
+            api_key (str): Your Wallex API key.
+            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            transport (HTTPTransport, optional): Pooled transport to send requests through. Defaults to the shared transport.
+            cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+        """
+        self.api_key = api_key
+        self.BASE_URL = base_url
+        self.CONTENT_TYPE = CONTENT_TYPE
+        self.transport = transport if transport is not None else get_default_transport()
+        self.cache = cache
+
+    def _make_request(self, endpoint, method="GET", params=None, json_payload=None):
+        """
+        Make an HTTP request to the Wallex API.
+
+        :param endpoint(str): The API endpoint.
+        :param method(str): The HTTP method (GET or POST or DELETE).
+        :param params(dict): Query parameters (for GET requests).
+        :param json_payload(dict): JSON payload (for POST requests).
+        :return: (dict) JSON response or an error message.
+        """
+        url = self.BASE_URL + endpoint
+        headers = {
+            "Content-Type": self.CONTENT_TYPE,
+            "x-api-key": self.api_key,
+        }
+        try:
+            response = self.transport.request(
+                method, url, headers=headers, params=params, json=json_payload
+            )
+            # response.raise_for_status()  # Raise an error if the response status code is not in the 200s.
+            return _decode(self.transport, response)
+        except requests.exceptions.RequestException as e:
+            return {"error": f"(Request) error: {e}"}
+        except requests.exceptions.HTTPError as e:
+            return {"error": f"(HTTP) error: {e}"}
+
+    def get_otc_markets(self, endpoint=OTC_EP["otc_markets"]):
+        """
+        Get a list of OTC markets.
+
+        :return: (dict) JSON response or an error message.
+        """
+        return _cached(self, endpoint, lambda: self._make_request(endpoint))
+
+    def get_otc_price(self, symbol: str, side: str, endpoint=OTC_EP["otc_price"]):
+        """
+        Get the OTC price for a specific symbol and side.
+
+        :param symbol(str): The trading symbol.
+        :param side(str): OTC side (BUY or SELL).
+        :return: (dict) JSON response or an error message.
+        """
+        if side not in {"BUY", "SELL"}:
+            return {"error": "Invalid OTC side"}
+
+        params = {"symbol": symbol, "side": side}
+        return self._make_request(endpoint, params=params)
+
+    def get_otc_orders(
+        self, symbol: str, side: str, amount: float, endpoint=OTC_EP["otc_orders"]
+    ):
+        """
+        Get OTC orders for a specific symbol, side, and amount.
+
+        :param symbol(str): The trading symbol.
+        :param side(str): OTC side (BUY or SELL).
+        :param amount(float | Fixed): The amount of the OTC order.
+        :return: (dict) JSON response or an error message.
+        """
+        if side not in {"BUY", "SELL"}:
+            return {"error": "Invalid OTC side"}
+
+        payload = {"symbol": symbol, "side": side, "amount": _wire_str(amount)}
+        return self._make_request(endpoint, method="POST", json_payload=payload)
+
+
+# ----- Asyncio Clients -----
+class AsyncMarketInfo(MarketInfo):
+    """
+    The asyncio counterpart of `MarketInfo`.
+
+    Every public method has the same signature as in `MarketInfo` and must be awaited.
+    Requests go through a shared `AsyncHTTPTransport`, so one event loop can keep many
+    requests in flight at once.
+
+    Args:
+        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+        transport (AsyncHTTPTransport, optional): Pooled async transport to send requests through. Defaults to the shared async transport.
+        cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+
+    Example:
+        async def main():
+            api = AsyncMarketInfo()
+            markets, depth = await asyncio.gather(
+                api.get_markets(), api.get_order_book_symbol("USDTTMN")
+            )
+    """
+
+    def __init__(
+        self,
+        base_url=BASE_URL,
+        transport: AsyncHTTPTransport = None,
+        cache: ResponseCache = None,
+    ):
+        """
+        Initializes a new instance of the AsyncMarketInfo class.
+
+        Args:
+            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            transport (AsyncHTTPTransport, optional): Pooled async transport to send requests through. Defaults to the shared async transport.
+            cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+        """
+        super().__init__(
+            base_url,
+            transport if transport is not None else get_default_async_transport(),
+            cache,
+        )
+
+    async def _make_request(self, endpoint, params=None):
+        """
+        Sends an HTTP GET request to the specified endpoint.
+
+        Args:
+            endpoint (str): The API endpoint to request.
+            params (dict, optional): Query parameters to include in the request. Defaults to None.
+
+        Returns:
+            dict: The JSON response from the API.
+
+        Raises:
+            requests.exceptions.RequestException: If a network-related error occurs.
+        """
+        try:
+            response = await self.transport.request(
+                "GET", self.BASE_URL + endpoint, params=params
+            )
+            return _decode(self.transport, response)
+        except requests.exceptions.RequestException as e:
+            raise requests.exceptions.RequestException(f"(Request) error: {e}")
+
+    async def get_markets(self, endpoint=MARKET_EP["markets"]):
+        """
+        Retrieves a list of available markets.
+        """
+        return await _acached(self, endpoint, lambda: self._make_request(endpoint))
+
+    async def get_currencies(self, endpoint=MARKET_EP["currencies_stats"]):
+        """
+        Retrieves currency statistics.
+        """
+        return await _acached(self, endpoint, lambda: self._make_request(endpoint))
+
+    async def get_order_book_symbol(
+        self, symbol: str, endpoint=MARKET_EP["order_book_symbol"]
+    ):
+        """
+        Retrieves the order book for a specific symbol.
+        """
+        params = {"symbol": symbol}
+        return await self._make_request(endpoint, params=params)
+
+    async def get_order_book_all(
+        self, symbol: str, endpoint=MARKET_EP["order_book_all"]
+    ):
+        """
+        Retrieves the order book for all symbols.
+        """
+        params = {"symbol": symbol}
+        return await self._make_request(endpoint, params=params)
+
+    async def get_latest_trades(self, symbol: str, endpoint=MARKET_EP["latest_trades"]):
+        """
+        Retrieves the latest trades for a specific symbol.
+        """
+        params = {"symbol": symbol}
+        return await self._make_request(endpoint, params=params)
+
+    async def get_market_history(
+        self,
+        symbol: str,
+        resolution: str,
+        time_from: int,
+        time_to: int,
+        endpoint=MARKET_EP["market_history"],
+    ):
+        """
+        Retrieves market history data for a specific symbol and time range.
+        """
+        params = {
+            "symbol": symbol,
+            "resolution": resolution,
+            "from": time_from,
+            "to": time_to,
+        }
+        return await self._make_request(endpoint, params=params)
+
+    async def get_order_book_symbols(
+        self, symbols: list, max_workers: int = MAX_WORKERS
+    ):
+        """
+        Retrieves the order books for several symbols concurrently.
+        """
+        return await _async_fan_out(self.get_order_book_symbol, symbols, max_workers)
+
+    async def get_latest_trades_symbols(
+        self, symbols: list, max_workers: int = MAX_WORKERS
+    ):
+        """
+        Retrieves the latest trades for several symbols concurrently.
+        """
+        return await _async_fan_out(self.get_latest_trades, symbols, max_workers)
+
+    async def get_market_history_range(
+        self,
+        symbol: str,
+        resolution: str,
+        time_from: int,
+        time_to: int,
+        bars_per_chunk: int = HISTORY_BARS_PER_CHUNK,
+        max_workers: int = MAX_WORKERS,
+    ):
+        """
+        Retrieves market history over a long time range as columnar NumPy arrays.
+        """
+        chunks = _history_chunks(resolution, time_from, time_to, bars_per_chunk)
+        responses = await _async_fan_out(
+            lambda chunk: self.get_market_history(symbol, resolution, *chunk),
+            chunks,
+            max_workers,
+        )
+        return _merge_history([responses[chunk] for chunk in chunks])
+
+
+class AsyncAccountManage(AccountManage):
+    """
+    The asyncio counterpart of `AccountManage`.
+
+    Every public method has the same signature as in `AccountManage` and must be awaited.
+
+    Args:
+        api_key (str): Your Wallex API key.
+        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+        transport (AsyncHTTPTransport, optional): Pooled async transport to send requests through. Defaults to the shared async transport.
+        cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+    """
+
+    def __init__(
+        self,
+        api_key,
+        base_url=BASE_URL,
+        transport: AsyncHTTPTransport = None,
+        cache: ResponseCache = None,
+    ):
+        """
+        Initialize the async Wallex Account API client with the provided API key.
+
+        Args:
+            api_key (str): Your Wallex API key.
+            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            transport (AsyncHTTPTransport, optional): Pooled async transport to send requests through. Defaults to the shared async transport.
+            cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+        """
+        super().__init__(
+            api_key,
+            base_url,
+            transport if transport is not None else get_default_async_transport(),
+            cache,
+        )
+
+    async def _make_request(
+        self, endpoint, method="GET", params=None, json_payload=None
+    ):
+        """
+        Make an HTTP request to the Wallex API.
+
+        Args:
+            endpoint (str): The API endpoint.
+            method (str): The HTTP method (GET or POST).
+            params (dict): Query parameters (for GET requests).
+            json_payload (dict): JSON payload (for POST requests).
+
+        Returns:
+            dict: JSON response from the API or an error message.
+        """
+        url = self.BASE_URL + endpoint
+        headers = {
+            "Content-Type": self.CONTENT_TYPE,
+            "x-api-key": self.api_key,
+        }
+        try:
+            response = await self.transport.request(
+                method, url, headers=headers, params=params, json=json_payload
+            )
+            return _decode(self.transport, response)
+
+        except requests.exceptions.RequestException as e:
+            return f"(Request) error: {e}"
+
+    async def get_profile(self, endpoint=ACCOUNT_EP["profile"]):
+        """
+        Get the user's profile information.
+        """
+        return await self._make_request(endpoint)
+
+    async def get_fee(self, endpoint=ACCOUNT_EP["fee"]):
+        """
+        Get User level and fee information related to the user's account.
+        """
+        return await _acached(self, endpoint, lambda: self._make_request(endpoint))
+
+    async def get_card_numbers(self, endpoint=ACCOUNT_EP["card_numbers"]):
+        """
+        Get bank card numbers with the user's account.
+        """
+        return await _acached(self, endpoint, lambda: self._make_request(endpoint))
+
+    async def get_ibans(self, endpoint=ACCOUNT_EP["ibans"]):
+        """
+        Get IBANs associated with the user's account.
+        """
+        return await _acached(self, endpoint, lambda: self._make_request(endpoint))
+
+    async def get_balances(self, endpoint=ACCOUNT_EP["balances"]):
+        """
+        Get Wallet assets balances for the user's account.
+        """
+        return await self._make_request(endpoint)
+
+    async def get_money_deposit(self, endpoint=ACCOUNT_EP["money_deposit"]):
+        """
+        Get information related to money (Toman) deposits in the user's account.
+        """
+        return await self._make_request(endpoint)
+
+    async def get_money_withdrawal(self, endpoint=ACCOUNT_EP["money_withdrawal"]):
+        """
+        Get information related to money (Toman) withdrawal in the user's account.
+        """
+        return await self._make_request(endpoint)
+
+    async def get_crypto_deposit(self, endpoint=ACCOUNT_EP["crypto_deposit"]):
+        """
+        Get information related to cryptocurrency deposits in the user's account.
+        """
+        return await self._make_request(endpoint)
+
+    async def get_crypto_withdrawal(self, endpoint=ACCOUNT_EP["crypto_withdrawal"]):
+        """
+        Get information related to cryptocurrency withdrawal in the user's account.
+        """
+        return await self._make_request(endpoint)
+
+    async def get_transfer(self, endpoint=ACCOUNT_EP["transfers"]):
+        """
+        Get information related to transfer in the user's account.
+        """
+        return await self._make_request(endpoint)
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: dict = None,
+        per_page: int = PAGE_SIZE,
+        time_from: float = None,
+        time_to: float = None,
+        prefetch: bool = True,
+    ):
+        """
+        Pages are fetched through `_apaginate`, so the iter_* methods return async generators.
+        """
+        return _apaginate(
+            lambda page: self._make_request(
+                endpoint, params=dict(params or {}, page=page, per_page=per_page)
+            ),
+            PAGE_KEYS.get(endpoint),
+            time_from,
+            time_to,
+            prefetch,
+        )
+
+    async def set_money_withdrawal(
+        self, iban: int, value: float, endpoint=ACCOUNT_EP["money_withdrawal"]
+    ):
+        """
+        Initiate a money (Toman) withdrawal from the user's account to a specified IBAN.
+        """
+        payload_money_withdrawal: dict = {"iban": iban, "value": _wire_str(value)}
+        return await self._make_request(
+            endpoint, method="POST", json_payload=payload_money_withdrawal
+        )
+
+    async def set_crypto_withdrawal(
+        self,
+        coin: str,
+        network: str,
+        value: float,
+        wallet_address: str,
+        memo=None,
+        endpoint=ACCOUNT_EP["crypto_withdrawal"],
+    ):
+        """
+        Initiate a cryptocurrency withdrawal from the user's account.
+        """
+        payload_crypto_withdrawal: dict = {
+            "coin": coin,
+            "network": network,
+            "value": _wire_str(value),
+            "wallet_address": wallet_address,
+            "memo": memo,
+        }
+        return await self._make_request(
+            endpoint, method="POST", json_payload=payload_crypto_withdrawal
+        )
+
+
+class AsyncOrdersManage(OrdersManage):
+    """
+    The asyncio counterpart of `OrdersManage`.
+
+    Every public method has the same signature as in `OrdersManage` and must be awaited.
+
+    Args:
+        api_key (str): Your Wallex API key.
+        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+        transport (AsyncHTTPTransport, optional): Pooled async transport to send requests through. Defaults to the shared async transport.
+    """
+
+    def __init__(
+        self, api_key: str, base_url=BASE_URL, transport: AsyncHTTPTransport = None
+    ):
+        """
+        Initialize the async API client with the provided API key.
+
+        Args:
+            api_key (str): Your Wallex API key.
+            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            transport (AsyncHTTPTransport, optional): Pooled async transport to send requests through. Defaults to the shared async transport.
+        """
+        super().__init__(
+            api_key,
+            base_url,
+            transport if transport is not None else get_default_async_transport(),
+        )
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: dict = None,
+        json_payload: dict = None,
+    ) -> dict:
+        """
+        Make an HTTP request to the Wallex API.
+
+        :param endpoint(str): The API endpoint.
+        :param method(str): The HTTP method (GET or POST or DELETE).
+        :param params(dict): Query parameters (for GET requests).
+        :param json_payload(dict): JSON payload (for POST requests).
+        :return: (dict) JSON response or an error message.
+        """
+        try:
+            response = await self._send(endpoint, method, params, json_payload)
+            return _decode(self.transport, response)
+        except requests.exceptions.RequestException as e:
+            return {"error": f"(Request) error: {e}"}
+
+    async def _send(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: dict = None,
+        json_payload: dict = None,
+    ):
+        """
+        Send an authenticated request and return the raw response.
+        """
+        url: str = self.BASE_URL + endpoint
+        headers: dict = {
+            "Content-Type": self.CONTENT_TYPE,
+            "x-api-key": self.api_key,
+        }
+        return await self.transport.request(
+            method, url, headers=headers, params=params, json=json_payload
+        )
+
+    async def _lookup_order(self, client_id: str, endpoint: str):
+        """
+        Look an order up by its client ID after an uncertain submission.
+        """
+        try:
+            response = await self._send(f"{endpoint}/{client_id}")
+            result = _decode(self.transport, response)
+        except requests.exceptions.RequestException:
+            return None, False
+        if response.status_code == 404:
+            return None, True
+        if response.status_code >= 300:
+            return None, False
+        if isinstance(result, dict) and result.get("result"):
+            return result, True
+        return None, True
+
+    async def _submit_order(
+        self, endpoint: str, payload: dict, policy: RetryPolicy
+    ) -> dict:
+        """
+        Submit an order, retrying without ever placing it twice.
+        """
+        client_id = payload["client_id"]
+        attempt = 0
+        submit = True
+        while True:
+            retry_after = None
+            if submit:
+                try:
+                    response = await self._send(endpoint, "POST", json_payload=payload)
+                    if response.status_code not in policy.statuses:
+                        return _decode(self.transport, response)
+                    error = f"(HTTP) error: {response.status_code}"
+                    retry_after = _retry_after(response.headers)
+                except requests.exceptions.RequestException as e:
+                    error = f"(Request) error: {e}"
+            attempt += 1
+            if attempt > policy.max_retries:
+                return {"error": error}
+            await asyncio.sleep(policy.delay(attempt, retry_after))
+            order, submit = await self._lookup_order(client_id, endpoint)
+            if order is not None:
+                return order
+
+    async def set_order(
+        self,
+        symbol: str,
+        type_order: str,
+        side: str,
+        price: str,
+        quantity: str,
+        client_id: str = None,
+        endpoint=ORDERS_EP["orders"],
+    ) -> dict:
+        """
+        Place an order with the Wallex API.
+        """
+
+        payload: dict = {
+            "symbol": symbol,
+            "type": type_order,
+            "side": side,
+            "price": _wire_str(price),
+            "quantity": _wire_str(quantity),
+        }
+
+        if client_id:
+            if not self._validate_client_id(client_id):
+                return {
+                    "error": "Invalid client ID. Only letters, numbers, '.', ':', '-' and '_' are allowed."
+                }
+            payload["client_id"] = client_id
+
+        policy = getattr(self.transport, "retry_policy", None)
+        if policy is not None:
+            payload.setdefault("client_id", uuid.uuid4().hex)
+            return await self._submit_order(endpoint, payload, policy)
+        return await self._make_request(endpoint, method="POST", json_payload=payload)
+
+    async def get_order(self, clientOrderId: str, endpoint=ORDERS_EP["orders"]) -> dict:
+        """
+        Get information about a specific order by its clientOrderId.
+        """
+        endpoint = f"{endpoint}/{clientOrderId}"
+        return await self._make_request(endpoint)
+
+    async def del_order(self, clientOrderId: str, endpoint=ORDERS_EP["orders"]) -> dict:
+        """
+        Cancel an order by its clientOrderId.
+        """
+        endpoint = f"{endpoint}/{clientOrderId}"
+        return await self._make_request(endpoint, method="DELETE")
+
+    async def get_open_orders(
+        self, symbol: str = None, endpoint=ORDERS_EP["openOrders"]
+    ) -> dict:
+        """
+        Get a list of open orders.
+        """
+        params = {"symbol": symbol}
+        return await self._make_request(endpoint, params=params)
+
+    async def get_last_trades(
+        self, symbol: str = None, side: str = None, endpoint=ORDERS_EP["last_trades"]
+    ) -> dict:
+        """
+        Get a list of the last trades.
+        """
+        params = {"symbol": symbol, "side": side}
+        return await self._make_request(endpoint, params=params)
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: dict = None,
+        per_page: int = PAGE_SIZE,
+        time_from: float = None,
+        time_to: float = None,
+        prefetch: bool = True,
+    ):
+        """
+        Pages are fetched through `_apaginate`, so the iter_* methods return async generators.
+        """
+        return _apaginate(
+            lambda page: self._make_request(
+                endpoint, params=dict(params or {}, page=page, per_page=per_page)
+            ),
+            PAGE_KEYS.get(endpoint),
+            time_from,
+            time_to,
+            prefetch,
+        )
+
+    async def set_orders(self, orders: list, max_workers: int = MAX_WORKERS) -> list:
+        """
+        Place several orders concurrently.
+        """
+        results = await _async_fan_out(
+            lambda i: self.set_order(**orders[i]), range(len(orders)), max_workers
+        )
+        return [results[i] for i in range(len(orders))]
+
+    async def cancel_orders(
+        self, client_ids: list, max_workers: int = MAX_WORKERS
+    ) -> dict:
+        """
+        Cancel several orders concurrently by their clientOrderIds.
+        """
+        return await _async_fan_out(self.del_order, client_ids, max_workers)
+
+    async def cancel_all(
+        self,
+        symbol: str = None,
+        client_id_prefix: str = None,
+        side: str = None,
+        max_workers: int = MAX_WORKERS,
+    ) -> dict:
+        """
+        Cancel every open order matching the filters.
+        """
+        open_orders = await self.get_open_orders(symbol)
+        client_ids = _select_orders(open_orders, client_id_prefix, side)
+        if client_ids is None:
+            return open_orders
+        return await self.cancel_orders(client_ids, max_workers)
+
+
+class AsyncMarketsOTC(MarketsOTC):
+    """
+    The asyncio counterpart of `MarketsOTC`.
+
+    Every public method has the same signature as in `MarketsOTC` and must be awaited.
+
+    Args:
+        api_key (str): Your Wallex API key.
+        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+        transport (AsyncHTTPTransport, optional): Pooled async transport to send requests through. Defaults to the shared async transport.
+        cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+    """
+
+    def __init__(
+        self,
+        api_key,
+        base_url=BASE_URL,
+        transport: AsyncHTTPTransport = None,
+        cache: ResponseCache = None,
+    ):
+        """
+        Initialize the async API client with the provided API key.
+
+        Args:
             api_key (str): Your Wallex API key.
             base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            transport (AsyncHTTPTransport, optional): Pooled async transport to send requests through. Defaults to the shared async transport.
+            cache (ResponseCache, optional): Opt-in cache for slow-changing reference endpoints. Defaults to None (no caching).
+        """
+        super().__init__(
+            api_key,
+            base_url,
+            transport if transport is not None else get_default_async_transport(),
+            cache,
+        )
+
+    async def _make_request(
+        self, endpoint, method="GET", params=None, json_payload=None
+    ):
+        """
+        Make an HTTP request to the Wallex API.
+
+        :param endpoint(str): The API endpoint.
+        :param method(str): The HTTP method (GET or POST or DELETE).
+        :param params(dict): Query parameters (for GET requests).
+        :param json_payload(dict): JSON payload (for POST requests).
+        :return: (dict) JSON response or an error message.
+        """
+        url = self.BASE_URL + endpoint
+        headers = {
+            "Content-Type": self.CONTENT_TYPE,
+            "x-api-key": self.api_key,
+        }
+        try:
+            response = await self.transport.request(
+                method, url, headers=headers, params=params, json=json_payload
+            )
+            return _decode(self.transport, response)
+        except requests.exceptions.RequestException as e:
+            return {"error": f"(Request) error: {e}"}
+
+    async def get_otc_markets(self, endpoint=OTC_EP["otc_markets"]):
+        """
+        Get a list of OTC markets.
+        """
+        return await _acached(self, endpoint, lambda: self._make_request(endpoint))
+
+    async def get_otc_price(self, symbol: str, side: str, endpoint=OTC_EP["otc_price"]):
+        """
+        Get the OTC price for a specific symbol and side.
+        """
+        if side not in {"BUY", "SELL"}:
+            return {"error": "Invalid OTC side"}
+
+        params = {"symbol": symbol, "side": side}
+        return await self._make_request(endpoint, params=params)
+
+    async def get_otc_orders(
+        self, symbol: str, side: str, amount: float, endpoint=OTC_EP["otc_orders"]
+    ):
+        """
+        Get OTC orders for a specific symbol, side, and amount.
+        """
+        if side not in {"BUY", "SELL"}:
+            return {"error": "Invalid OTC side"}
+
+        payload = {"symbol": symbol, "side": side, "amount": _wire_str(amount)}
+        return await self._make_request(endpoint, method="POST", json_payload=payload)
+
+
+class WebSocket:
+    """
+    A class for interacting with the Wallex WebSocket API to receive live market data.
+
+    A single Socket.IO connection carries any number of channel subscriptions; "Broadcaster"
+    messages are routed to the callbacks of the channel they arrive on, and the latest
+    payload of every channel is kept in `snapshots`.
+
+    Args:
+        once (bool, optional): Whether to disconnect after receiving data once. Defaults to True.
+        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+        persistent (bool, optional): Keep the connection open and serve get_* from the latest cached payload. Defaults to False.
+        snapshot_timeout (float, optional): Seconds a persistent get_* waits for the first message of a new channel. Defaults to 10.
+        reconnect (bool, optional): Reconnect with jittered exponential backoff when the connection drops. Defaults to True.
+        reconnect_delay (float, optional): Delay before the first reconnection attempt, in seconds. Defaults to 1.
+        reconnect_delay_max (float, optional): Upper bound of the backoff delay, in seconds. Defaults to 30.
+        reconnect_attempts (int, optional): Maximum number of attempts; 0 retries reconnects forever but never retries the first connection. Defaults to 0.
+        market_info (MarketInfo, optional): Used to resync depth channels from a REST snapshot after a reconnect. Defaults to None.
+        on_stale (callable, optional): Called with the list of active channels when the connection drops. Defaults to None.
+        on_recovered (callable, optional): Called with the list of active channels once they are resubscribed. Defaults to None.
+        metrics (Metrics, optional): Counts messages per channel. Defaults to None.
+
+    Methods:
+        __init__(self, once: bool = True, base_url: str = BASE_URL, persistent: bool = False, ...): Initialize the WebSocket class.
+        connect(self): Connect to the Socket.IO server without blocking.
+        wait(self): Block until the connection is closed.
+        subscribe(self, symbol: str, event: str, callback: callable, wait: bool = True): Subscribe to a market event.
+        unsubscribe(self, symbol: str, event: str, callback: callable = None): Unsubscribe from a market event.
+        handle_received_data(self, data: dict): Handle received data.
+        disconnect(self): Disconnect from the Socket.IO server.
+        get_market_cap(self, symbol, event=EVENTS["marketCap"]): Get market capitalization data.
+        get_buy_depth(self, symbol, event=EVENTS["buyDepth"]): Get buy depth data.
+        get_sell_depth(self, symbol, event=EVENTS["sellDepth"]): Get sell depth data.
+        get_trade(self, symbol, event=EVENTS["trade"]): Get trade data.
+
+    Example:
+        # Create an instance of the WebSocket class
+        client = WebSocket(once=False)
+
+        # Subscribe to several channels over the same connection
+        for symbol in ["USDTTMN", "BTCUSDT"]:
+            client.subscribe(symbol, EVENTS["trade"], print, wait=False)
+            client.subscribe(symbol, EVENTS["buyDepth"], print, wait=False)
+
+        # Channels can be dropped at runtime
+        client.unsubscribe("BTCUSDT", EVENTS["buyDepth"])
+
+        # Keep the client running
+        client.wait()
+
+        # Persistent snapshots: the first call per channel waits for one message,
+        # later calls return the latest cached payload immediately.
+        snapshots = WebSocket(persistent=True)
+        buy_depth = snapshots.get_buy_depth("USDTTMN")
+
+        # Stop quoting while the feed is down; depth is resynced from REST on recovery.
+        feed = WebSocket(
+            once=False,
+            market_info=MarketInfo(),
+            on_stale=lambda channels: print("stale:", channels),
+            on_recovered=lambda channels: print("recovered:", channels),
+        )
+    """
+
+    def __init__(
+        self,
+        once: bool = True,
+        base_url=BASE_URL,
+        persistent: bool = False,
+        snapshot_timeout: float = 10.0,
+        reconnect: bool = True,
+        reconnect_delay: float = 1.0,
+        reconnect_delay_max: float = 30.0,
+        reconnect_attempts: int = 0,
+        market_info: MarketInfo = None,
+        on_stale: callable = None,
+        on_recovered: callable = None,
+        metrics: Metrics = None,
+    ):
+        """
+        Initialize the WebSocket class.
+
+        Args:
+            once (bool, optional): Whether to disconnect after receiving data once. Defaults to True.
+            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            persistent (bool, optional): Keep the connection open and serve get_* from the latest cached payload. Defaults to False.
+            snapshot_timeout (float, optional): Seconds a persistent get_* waits for the first message of a new channel. Defaults to 10.
+            reconnect (bool, optional): Reconnect with jittered exponential backoff when the connection drops. Defaults to True.
+            reconnect_delay (float, optional): Delay before the first reconnection attempt, in seconds. Defaults to 1.
+            reconnect_delay_max (float, optional): Upper bound of the backoff delay, in seconds. Defaults to 30.
+            reconnect_attempts (int, optional): Maximum number of attempts; 0 retries reconnects forever but never retries the first connection. Defaults to 0.
+            market_info (MarketInfo, optional): Used to resync depth channels from a REST snapshot after a reconnect. Defaults to None.
+            on_stale (callable, optional): Called with the list of active channels when the connection drops. Defaults to None.
+            on_recovered (callable, optional): Called with the list of active channels once they are resubscribed. Defaults to None.
+            metrics (Metrics, optional): Counts messages per channel. Defaults to None.
+        """
+        self.once = once
+        self.persistent = persistent
+        self.snapshot_timeout = snapshot_timeout
+        self.reconnect = reconnect
+        self.reconnect_delay = reconnect_delay
+        self.reconnect_delay_max = reconnect_delay_max
+        self.reconnect_attempts = reconnect_attempts
+        self.market_info = market_info
+        self.on_stale = on_stale
+        self.on_recovered = on_recovered
+        self.metrics = metrics
+        self.stale = False  # True while an unexpected disconnect is being recovered
+        self._closing = False
+        # The Socket.IO client handles reconnection itself, with a randomized exponential backoff.
+        self.sio = socketio.Client(
+            reconnection=reconnect,
+            reconnection_attempts=reconnect_attempts,
+            reconnection_delay=reconnect_delay,
+            reconnection_delay_max=reconnect_delay_max,
+            randomization_factor=0.5,
+        )
+        self.latest_data = None  # Initialize instance variable to store latest data
+        self.BASE_URL = base_url
+        self.TRANSPORT = "websocket"
+        self.subscriptions: dict = {}  # channel -> list of callbacks
+        self.snapshots: dict = {}  # channel -> latest payload
+        self._snapshot_ready: dict = {}  # channel -> threading.Event
+        self._lock = threading.RLock()
+
+        self.sio.on("connect", self._on_connect)
+        self.sio.on("disconnect", self._on_disconnect)
+        self.sio.on("Broadcaster", self._on_broadcaster)
+
+    def _on_connect(self):
+        """
+        Internal event handler for "connect": (re)subscribe every active channel.
+
+        After an unexpected disconnect, depth channels are first resynced from a REST
+        snapshot (if `market_info` is set) and `on_recovered` is called afterwards.
+        """
+        with self._lock:
+            channels = list(self.subscriptions)
+        recovered = self.stale
+        if recovered and self.market_info is not None:
+            self._resync_depth(channels)
+        for channel in channels:
+            self.sio.emit("subscribe", {"channel": channel})
+        print(f"Connected to {self.BASE_URL}")
+        if recovered:
+            self.stale = False
+            self._notify(self.on_recovered, channels)
+
+    def _on_disconnect(self, *args):
+        """
+        Internal event handler for "disconnect": flag the feed as stale unless the disconnect was requested.
+        """
+        print("Disconnected from the server")
+        if self._closing or not self.reconnect:
+            return
+        self.stale = True
+        with self._lock:
+            channels = list(self.subscriptions)
+        self._notify(self.on_stale, channels)
+
+    def _notify(self, callback: callable, channels: list):
+        if callback is None:
+            return
+        try:
+            callback(channels)
+        except Exception as e:
+            print(f"Error in callback: {e}")
+
+    def _resync_depth(self, channels: list):
+        """
+        Feed REST order book snapshots to the depth channels, as if they came from the socket.
+
+        :param channels: The active channels.
+        :type channels: list
+        """
+        sides = {EVENTS["buyDepth"]: "bid", EVENTS["sellDepth"]: "ask"}
+        depth_channels = {}
+        for channel in channels:
+            for event, side in sides.items():
+                if channel.endswith(event):
+                    depth_channels[channel] = (channel[: -len(event)], side)
+        if not depth_channels:
+            return
+        symbols = [symbol for symbol, _ in depth_channels.values()]
+        books = self.market_info.get_order_book_symbols(symbols)
+        for channel, (symbol, side) in depth_channels.items():
+            try:
+                levels = books[symbol]["result"][side]
+            except (KeyError, TypeError) as e:
+                print(f"Error: depth resync for {channel} failed: {e}")
+                continue
+            self._on_broadcaster(channel, levels)
+
+    def _backoff(self, attempt: int) -> float:
+        """
+        Jittered exponential backoff delay for a (1-based) first-connection attempt.
+
+        Reconnects after a dropped connection are made by `socketio.Client` itself; it is
+        configured with the same schedule (reconnect_delay doubling up to
+        reconnect_delay_max, randomized by +/-50%), so both follow one policy.
+        """
+        delay = min(self.reconnect_delay * 2 ** (attempt - 1), self.reconnect_delay_max)
+        return delay * random.uniform(0.5, 1.5)
+
+    def _on_broadcaster(self, channel: str, data: dict):
+        """
+        Internal event handler for "Broadcaster" events.
+
+        :param channel: The channel name.
+        :type channel: str
+
+        :param data: The data received.
+        :type data: dict
+
+        """
+        if self.metrics is not None:
+            self.metrics.observe_message(channel)
+        self.snapshots[channel] = data
+        with self._lock:
+            callbacks = tuple(self.subscriptions.get(channel, ()))
+        for callback in callbacks:
+            try:
+                callback(data)
+            except Exception as e:
+                print(f"Error in callback: {e}")
+
+    def connect(self):
+        """
+        Connect to the Socket.IO server without blocking; active channels are subscribed on connect.
+
+        A failed first connection is only retried when `reconnect` is enabled, `once` is
+        False and `reconnect_attempts` is a finite number (> 0); otherwise the error is
+        raised at once, as `subscribe` and the one-shot `get_*` helpers expect.
+        """
+        self._closing = False
+        attempts = self.reconnect_attempts if self.reconnect and not self.once else 0
+        attempt = 0
+        while not self.sio.connected:
+            try:
+                # Connect to the Socket.IO server with the specified transport
+                self.sio.connect(self.BASE_URL, transports=[self.TRANSPORT])
+            except socketio.exceptions.ConnectionError:
+                attempt += 1
+                if attempt > attempts:
+                    raise
+                time.sleep(self._backoff(attempt))
+
+    def wait(self):
+        """
+        Block until the connection to the Socket.IO server is closed.
+        """
+        self.sio.wait()
+
+    def disconnect(self):
+        """
+        Disconnect from the Socket.IO server.
+        """
+        self._closing = True
+        self.sio.disconnect()
+
+    def subscribe(self, symbol: str, event: str, callback: callable, wait: bool = True):
+        """
+        Subscribe to a specific channel and add a callback function to handle received data.
+
+        Any number of channels can share the connection; subscribing while connected takes
+        effect immediately.
+
+        :param symbol: The symbol or market identifier.
+        :type symbol: str
+
+        :param event: The event type to subscribe to (e.g.,EVENTS["marketCap"]).
+        :type event: str
+
+        :param callback: The callback function to handle received data.
+        :type callback: callable
+
+        :param wait: Whether to block until the connection is closed. Defaults to True.
+        :type wait: bool
+
+        """
+        channel = symbol + event
+        with self._lock:
+            callbacks = self.subscriptions.setdefault(channel, [])
+            is_new = not callbacks
+            callbacks.append(callback)
+        try:
+            if not self.sio.connected:
+                self.connect()
+            elif is_new:
+                self.sio.emit("subscribe", {"channel": channel})
+
+            if wait:
+                # Keep the client running
+                self.wait()
+
+        except Exception as e:
+            print(f"Error: {e}")
+
+    def unsubscribe(self, symbol: str, event: str, callback: callable = None):
+        """
+        Remove a callback from a channel, and leave the channel once it has none left.
+
+        :param symbol: The symbol or market identifier.
+        :type symbol: str
+
+        :param event: The event type to unsubscribe from (e.g.,EVENTS["marketCap"]).
+        :type event: str
+
+        :param callback: The callback to remove (optional; all callbacks of the channel by default).
+        :type callback: callable
+
+        """
+        channel = symbol + event
+        with self._lock:
+            callbacks = self.subscriptions.get(channel)
+            if callbacks is None:
+                return
+            if callback is not None and callback in callbacks:
+                callbacks.remove(callback)
+            if callback is None or not callbacks:
+                del self.subscriptions[channel]
+            else:
+                return
+        if self.sio.connected:
+            try:
+                self.sio.emit("unsubscribe", {"channel": channel})
+            except Exception as e:
+                print(f"Error: {e}")
+
+    def handle_received_data(self, data: dict):
+        """
+        Handle received data.
+
+        :param data: The received data.
+        :type data: dict
+        """
+
+        # print(f"{self.channel} - Received message:\n", data)
+
+        # Store received data in instance variable
+        self.latest_data = data
+
+        # Disconnect after receiving data once
+        if self.once:
+            self.disconnect()
+
+    def _get_snapshot(self, symbol: str, event: str) -> dict:
+        """
+        Return the cached payload of a channel, subscribing and waiting for the first message if it is new.
+        """
+        channel = symbol + event
+        data = self.snapshots.get(channel)
+        if data is None:
+            with self._lock:
+                ready = self._snapshot_ready.get(channel)
+                is_new = ready is None
+                if is_new:
+                    ready = self._snapshot_ready[channel] = threading.Event()
+            if is_new:
+                self.subscribe(symbol, event, lambda _: ready.set(), wait=False)
+            ready.wait(self.snapshot_timeout)
+            data = self.snapshots.get(channel)
+        self.latest_data = data
+        return data
+
+    def _get_latest(self, symbol: str, event: str) -> dict:
+        """
+        Return the latest data of a channel.
+
+        In persistent mode this is the cached payload; otherwise subscribe until the
+        connection closes, then drop the channel.
+        """
+        if self.persistent:
+            return self._get_snapshot(symbol, event)
+        self.subscribe(symbol=symbol, event=event, callback=self.handle_received_data)
+        self.unsubscribe(symbol=symbol, event=event, callback=self.handle_received_data)
+        return self.latest_data
+
+    def get_market_cap(self, symbol, event=EVENTS["marketCap"]) -> dict:
+        """
+        Get market capitalization data for a symbol.
+
+        :param symbol: The symbol or market identifier.
+        :type symbol: str
+
+        :param event: The event type (default: marketCap).
+        :type event: str
+
+        :return: The latest market capitalization data.
+        :rtype: dict
+        """
+        return self._get_latest(symbol, event)
+
+    def get_buy_depth(self, symbol, event=EVENTS["buyDepth"]) -> dict:
+        """
+        Get buy depth data for a symbol.
+
+        :param symbol: The symbol or market identifier.
+        :type symbol: str
+
+        :param event: The event type (default: buyDepth).
+        :type event: str
+
+        :return: The latest buy depth data.
+        :rtype: dict
+        """
+        return self._get_latest(symbol, event)
+
+    def get_sell_depth(self, symbol, event=EVENTS["sellDepth"]) -> dict:
+        """
+        Get sell depth data for a symbol.
+
+        :param symbol: The symbol or market identifier.
+        :type symbol: str
+
+        :param event: The event type (default: sellDepth).
+        :type event: str
+
+        :return: The latest sell depth data.
+        :rtype: dict
+        """
+        return self._get_latest(symbol, event)
+
+    def get_trade(self, symbol, event=EVENTS["trade"]) -> dict:
+        """
+        Get trade data for a symbol.
+
+        :param symbol: The symbol or market identifier.
+        :type symbol: str
+
+        :param event: The event type (default: trade).
+        :type event: str
+
+        :return: The latest trade data.
+        :rtype: dict
+        """
+        return self._get_latest(symbol, event)
+
+
+# ----- Local Order Book -----
+class _BookSide:
+    """
+    One side of an order book stored as parallel sorted arrays.
+
+    Levels are kept best-first: asks by ascending price, bids by descending price
+    (stored as ascending negated keys), so the best level is always at index 0.
+    """
+
+    __slots__ = ("sign", "keys", "quantities", "_cumulative")
+
+    def __init__(self, sign: int, levels=()):
+        self.sign = sign
+        pairs = sorted((sign * price, quantity) for price, quantity in levels)
+        self.keys = array("d", [key for key, quantity in pairs if quantity > 0])
+        self.quantities = array(
+            "d", [quantity for _, quantity in pairs if quantity > 0]
+        )
+        self._cumulative = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def best(self):
+        if not self.keys:
+            return None
+        return self.sign * self.keys[0], self.quantities[0]
+
+    def top(self, k: int) -> list:
+        sign = self.sign
+        return [
+            (sign * key, quantity)
+            for key, quantity in zip(self.keys[:k], self.quantities[:k])
+        ]
+
+    def update(self, price: float, quantity: float):
+        key = self.sign * price
+        i = bisect.bisect_left(self.keys, key)
+        exists = i < len(self.keys) and self.keys[i] == key
+        if quantity > 0:
+            if exists:
+                self.quantities[i] = quantity
+            else:
+                self.keys.insert(i, key)
+                self.quantities.insert(i, quantity)
+        elif exists:
+            del self.keys[i]
+            del self.quantities[i]
+        self._cumulative = None
+
+    def cumulative(self) -> array:
+        if self._cumulative is None:
+            self._cumulative = array("d", itertools.accumulate(self.quantities))
+        return self._cumulative
+
+    def quantity_within(self, price: float) -> float:
+        """
+        Total quantity at levels priced at or better than `price`.
+        """
+        i = bisect.bisect_right(self.keys, self.sign * price)
+        return self.cumulative()[i - 1] if i else 0.0
+
+
+def _raw_levels(levels) -> list:
+    """
+    Read Wallex depth levels ({"price", "quantity", ...} dicts or [price, quantity] pairs) as (price, quantity) pairs, as sent.
+    """
+    if isinstance(levels, dict):
+        levels = levels.values()
+    return [
+        (
+            (level["price"], level["quantity"])
+            if isinstance(level, dict)
+            else (level[0], level[1])
+        )
+        for level in levels
+    ]
+
+
+def _parse_levels(levels) -> list:
+    """
+    Parse Wallex depth levels ({"price", "quantity", ...} dicts or [price, quantity] pairs) into float pairs.
+    """
+    return [(float(price), float(quantity)) for price, quantity in _raw_levels(levels)]
+
+
+class OrderBook:
+    """
+    A local in-memory order book for one symbol.
+
+    The book is seeded from `MarketInfo.get_order_book_symbol` and kept current from the
+    `@buyDepth`/`@sellDepth` WebSocket channels. Each side is stored as compact sorted
+    arrays, so the best bid/ask is O(1), the top k levels are O(k) and cumulative depth
+    up to a price is O(log n), without re-parsing the raw payload on every read.
+
+    Args:
+        symbol (str): The symbol or market identifier (e.g. "USDTTMN").
+
+    Methods:
+        seed(self, market_info: MarketInfo): Load a REST snapshot of the book.
+        attach(self, websocket: WebSocket): Keep the book current from the depth channels of a WebSocket.
+        apply_snapshot(self, result: dict): Replace both sides from a {"bid": [...], "ask": [...]} payload.
+        on_buy_depth(self, levels): Replace the bid side from a buyDepth payload.
+        on_sell_depth(self, levels): Replace the ask side from a sellDepth payload.
+        update(self, side: str, price: float, quantity: float): Apply a single level change.
+        best_bid(self) / best_ask(self): Best (price, quantity) of a side.
+        top_bids(self, k: int) / top_asks(self, k: int): The k best levels of a side.
+        bid_depth(self, price: float) / ask_depth(self, price: float): Cumulative quantity up to a price.
+
+    Example:
+        book = OrderBook("USDTTMN")
+        book.seed(MarketInfo())
+        client = WebSocket(once=False)
+        book.attach(client)
+        print(book.best_bid(), book.best_ask(), book.spread())
+        print(book.top_asks(5))
+    """
+
+    def __init__(self, symbol: str):
         """
-        self.api_key: str = api_key
-        self.BASE_URL = base_url
-        self.CONTENT_TYPE = CONTENT_TYPE
+        Initialize an empty order book.
 
-    def _make_request(
-        self,
-        endpoint: str,
-        method: str = "GET",
-        params: dict = None,
-        json_payload: dict = None,
-    ) -> dict:
+        Args:
+            symbol (str): The symbol or market identifier (e.g. "USDTTMN").
         """
-        Make an HTTP request to the Wallex API.
+        self.symbol = symbol
+        self.bids = _BookSide(-1)
+        self.asks = _BookSide(1)
+        self.updated_at = None  # time.time() of the last change
+        self._lock = threading.Lock()
 
-        :param endpoint(str): The API endpoint.
-        :param method(str): The HTTP method (GET or POST or DELETE).
-        :param params(dict): Query parameters (for GET requests).
-        :param json_payload(dict): JSON payload (for POST requests).
-        :return: (dict) JSON response or an error message.
+    def seed(self, market_info: MarketInfo):
         """
-        url: str = self.BASE_URL + endpoint
-        headers: dict = {
-            "Content-Type": self.CONTENT_TYPE,
-            "x-api-key": self.api_key,
-        }
+        Load a REST snapshot of the book.
+
+        :param market_info: The client used to call get_order_book_symbol.
+        :type market_info: MarketInfo
+
+        :raises requests.exceptions.RequestException: If the response is an error; the book is left unchanged.
+        """
+        payload = market_info.get_order_book_symbol(self.symbol)
+        result = _result(payload)
+        if not isinstance(result, dict) or "error" in result:
+            raise requests.exceptions.RequestException(f"(Depth) error: {payload}")
+        self.apply_snapshot(result)
+
+    def attach(self, websocket: WebSocket):
+        """
+        Keep the book current from the buyDepth and sellDepth channels of a WebSocket.
+
+        :param websocket: A WebSocket client created with once=False.
+        :type websocket: WebSocket
+        """
+        websocket.subscribe(
+            self.symbol, EVENTS["buyDepth"], self.on_buy_depth, wait=False
+        )
+        websocket.subscribe(
+            self.symbol, EVENTS["sellDepth"], self.on_sell_depth, wait=False
+        )
+
+    def apply_snapshot(self, result: dict):
+        """
+        Replace both sides of the book.
+
+        :param result: A depth result with "bid" and "ask" level lists.
+        :type result: dict
+        """
+        bids = _BookSide(-1, _parse_levels(result.get("bid", ())))
+        asks = _BookSide(1, _parse_levels(result.get("ask", ())))
+        with self._lock:
+            self.bids, self.asks = bids, asks
+            self.updated_at = time.time()
+
+    def on_buy_depth(self, levels):
+        """
+        Replace the bid side from a buyDepth payload.
+
+        :param levels: The levels received on the buyDepth channel.
+        :type levels: list
+        """
+        bids = _BookSide(-1, _parse_levels(levels))
+        with self._lock:
+            self.bids = bids
+            self.updated_at = time.time()
+
+    def on_sell_depth(self, levels):
+        """
+        Replace the ask side from a sellDepth payload.
+
+        :param levels: The levels received on the sellDepth channel.
+        :type levels: list
+        """
+        asks = _BookSide(1, _parse_levels(levels))
+        with self._lock:
+            self.asks = asks
+            self.updated_at = time.time()
+
+    def update(self, side: str, price: float, quantity: float):
+        """
+        Apply a single level change; a zero quantity removes the level.
+
+        :param side: "bid" (or "BUY") or "ask" (or "SELL").
+        :type side: str
+
+        :param price: The level price.
+        :type price: float
+
+        :param quantity: The new total quantity at that price.
+        :type quantity: float
+        """
+        with self._lock:
+            book_side = self.bids if side.lower() in ("bid", "buy") else self.asks
+            book_side.update(float(price), float(quantity))
+            self.updated_at = time.time()
+
+    def best_bid(self):
+        """
+        :return: The best bid as (price, quantity), or None if the side is empty.
+        :rtype: tuple
+        """
+        return self.bids.best()
+
+    def best_ask(self):
+        """
+        :return: The best ask as (price, quantity), or None if the side is empty.
+        :rtype: tuple
+        """
+        return self.asks.best()
+
+    def mid(self) -> float:
+        """
+        :return: The mid price, or None if either side is empty.
+        :rtype: float
+        """
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def spread(self) -> float:
+        """
+        :return: The best ask minus the best bid, or None if either side is empty.
+        :rtype: float
+        """
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def top_bids(self, k: int) -> list:
+        """
+        :return: The k best bids as (price, quantity) pairs, best first.
+        :rtype: list
+        """
+        return self.bids.top(k)
+
+    def top_asks(self, k: int) -> list:
+        """
+        :return: The k best asks as (price, quantity) pairs, best first.
+        :rtype: list
+        """
+        return self.asks.top(k)
+
+    def bid_depth(self, price: float) -> float:
+        """
+        :return: Total bid quantity priced at or above `price`.
+        :rtype: float
+        """
+        return self.bids.quantity_within(price)
+
+    def ask_depth(self, price: float) -> float:
+        """
+        :return: Total ask quantity priced at or below `price`.
+        :rtype: float
+        """
+        return self.asks.quantity_within(price)
+
+
+# ----- Local Candle Store -----
+CANDLE_DTYPE: list = [
+    ("t", "<i8"),
+    ("o", "<f8"),
+    ("h", "<f8"),
+    ("l", "<f8"),
+    ("c", "<f8"),
+    ("v", "<f8"),
+]
+
+
+def _merge_ranges(ranges: list) -> list:
+    """
+    Merge overlapping or adjacent [from, to] second ranges.
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+class CandleStore:
+    """
+    An incremental on-disk OHLCV store backing `MarketInfo.get_market_history`.
+
+    Candles are kept per (symbol, resolution) in a flat file of fixed-size little-endian
+    records (see CANDLE_DTYPE), sorted by timestamp, next to a small JSON index of the
+    time ranges already downloaded. A history call fetches only the missing gaps and
+    appends them; reads are zero-copy slices of a read-only memory map. Requires NumPy.
+
+    Only closed bars are stored, so the bar that is still open is never cached. A bar is
+    open while its own `t` plus the resolution is in the future, which holds for daily
+    and weekly bars that do not start at a multiple of their length. The store is safe
+    to share between threads, but not between processes writing the same file.
+
+    Args:
+        directory (str): Directory holding the candle files; created if missing.
+        market_info (MarketInfo, optional): Client used to download missing ranges. Defaults to MarketInfo().
+
+    Example:
+        store = CandleStore("candles")
+        now = int(time.time())
+        bars = store.get("USDTTMN", "1", now - 365 * 86400, now)
+        print(len(bars), bars["c"][-1])
+    """
+
+    def __init__(self, directory: str, market_info: MarketInfo = None):
+        """
+        Initialize the store.
+
+        Args:
+            directory (str): Directory holding the candle files; created if missing.
+            market_info (MarketInfo, optional): Client used to download missing ranges. Defaults to MarketInfo().
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.market_info = market_info if market_info is not None else MarketInfo()
+        self._open_bars: dict = (
+            {}
+        )  # (symbol, resolution) -> t of the last open bar seen
+        self._lock = threading.Lock()
+
+    def _paths(self, symbol: str, resolution: str) -> tuple:
+        name = os.path.join(self.directory, f"{symbol}_{resolution}")
+        return name + ".candles", name + ".json"
+
+    def ranges(self, symbol: str, resolution: str) -> list:
+        """
+        Get the time ranges already stored.
+
+        :param symbol(str): The trading symbol.
+        :param resolution(str): The candle resolution.
+        :return: (list) Merged [from, to] ranges in Unix seconds.
+        """
+        _, index_path = self._paths(symbol, resolution)
         try:
-            response = requests.request(
-                method, url, headers=headers, params=params, json=json_payload
-            )
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"(Request) error: {e}"}
-        except requests.exceptions.HTTPError as e:
-            return {"error": f"(HTTP) error: {e}"}
+            with open(index_path) as f:
+                return json.load(f)["ranges"]
+        except FileNotFoundError:
+            return []
+
+    def missing(
+        self, symbol: str, resolution: str, time_from: int, time_to: int
+    ) -> list:
+        """
+        Get the parts of [time_from, time_to] that are not stored yet.
 
-    def _validate_client_id(self, client_id: str) -> bool:
+        :param symbol(str): The trading symbol.
+        :param resolution(str): The candle resolution.
+        :param time_from(int): Start of the range (Unix seconds).
+        :param time_to(int): End of the range (Unix seconds).
+        :return: (list) (from, to) gaps in Unix seconds.
         """
-        Validate the client ID string.
+        gaps = []
+        cursor = int(time_from)
+        for start, end in self.ranges(symbol, resolution):
+            if end < cursor:
+                continue
+            if start > time_to:
+                break
+            if start > cursor:
+                gaps.append((cursor, start - 1))
+            cursor = max(cursor, end + 1)
+        if cursor <= time_to:
+            gaps.append((cursor, int(time_to)))
+        return gaps
+
+    def read(self, symbol: str, resolution: str, time_from: int, time_to: int):
+        """
+        Read stored candles without copying.
 
-        :param client_id(str): The client ID string to validate.
-        :return: (bool) True if valid, False otherwise.
+        :param symbol(str): The trading symbol.
+        :param resolution(str): The candle resolution.
+        :param time_from(int): Start of the range (Unix seconds).
+        :param time_to(int): End of the range (Unix seconds).
+        :return: (numpy.ndarray) A read-only structured view with fields t, o, h, l, c, v.
         """
-        pattern = re.compile(r"^[\w.:-]+$")
-        # Allow letters, numbers, '.', ':', '-' and '_'
-        return bool(pattern.match(client_id))
+        import numpy as np
+
+        data_path, _ = self._paths(symbol, resolution)
+        if not os.path.exists(data_path) or os.path.getsize(data_path) == 0:
+            return np.empty(0, dtype=CANDLE_DTYPE)
+        candles = np.memmap(data_path, dtype=CANDLE_DTYPE, mode="r")
+        t = candles["t"]
+        start = np.searchsorted(t, time_from, side="left")
+        end = np.searchsorted(t, time_to, side="right")
+        return candles[start:end]
+
+    @staticmethod
+    def _last_time(data_path: str):
+        """
+        :return: (int | None) The timestamp of the last stored candle, read from the end
+                 of the file only, or None if nothing is stored.
+        """
+        import numpy as np
+
+        if not os.path.exists(data_path):
+            return None
+        size = np.dtype(CANDLE_DTYPE).itemsize
+        with open(data_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() < size:
+                return None
+            f.seek(-size, os.SEEK_END)
+            return int(np.frombuffer(f.read(size), dtype=CANDLE_DTYPE)["t"][0])
+
+    def write(
+        self,
+        symbol: str,
+        resolution: str,
+        columns: dict,
+        time_from: int,
+        time_to: int,
+    ):
+        """
+        Store downloaded candles and record [time_from, time_to] as covered.
 
-    def set_order(
+        Candles newer than everything stored are appended; anything else is merged
+        and the file is rewritten atomically.
+
+        :param symbol(str): The trading symbol.
+        :param resolution(str): The candle resolution.
+        :param columns(dict): t/o/h/l/c/v arrays as returned by get_market_history_range.
+        :param time_from(int): Start of the downloaded range (Unix seconds).
+        :param time_to(int): End of the downloaded range (Unix seconds).
+        """
+        import numpy as np
+
+        data_path, index_path = self._paths(symbol, resolution)
+        rows = np.empty(len(columns["t"]), dtype=CANDLE_DTYPE)
+        for field in CANDLE_FIELDS:
+            rows[field] = columns[field]
+
+        with self._lock:
+            last = self._last_time(data_path)
+            if len(rows) and (last is None or rows["t"][0] > last):
+                with open(data_path, "ab") as f:
+                    f.write(rows.tobytes())
+            elif len(rows):
+                stored = np.fromfile(data_path, dtype=CANDLE_DTYPE)
+                merged = np.concatenate([stored, rows])
+                _, index = np.unique(merged["t"][::-1], return_index=True)
+                merged = merged[::-1][index]  # newest download wins on duplicates
+                merged.tofile(data_path + ".tmp")
+                os.replace(data_path + ".tmp", data_path)
+
+            ranges = _merge_ranges(
+                self.ranges(symbol, resolution) + [[int(time_from), int(time_to)]]
+            )
+            with open(index_path + ".tmp", "w") as f:
+                json.dump({"ranges": ranges}, f)
+            os.replace(index_path + ".tmp", index_path)
+
+    def get(
         self,
         symbol: str,
-        type_order: str,
-        side: str,
-        price: str,
-        quantity: str,
-        client_id: str = None,
-        endpoint=ORDERS_EP["orders"],
-    ) -> dict:
+        resolution: str,
+        time_from: int,
+        time_to: int,
+        max_workers: int = MAX_WORKERS,
+    ):
         """
-        Place an order with the Wallex API.
+        Get candles for a range, downloading only the gaps that are not stored yet.
 
         :param symbol(str): The trading symbol.
-        :param type_order(str): Order type (LIMIT or MARKET).
-        :param side(str): Order side (BUY or SELL).
-        :param price(str): Order price (for LIMIT orders).
-        :param quantity(str): Order quantity.
-        :param client_id(str): Unique client identifier (optional).
-        :return: (dict) JSON response or an error message.
+        :param resolution(str): The candle resolution (e.g. "1", "60", "1D").
+        :param time_from(int): Start of the range (Unix seconds).
+        :param time_to(int): End of the range (Unix seconds).
+        :param max_workers(int): Maximum number of history requests in flight at once.
+        :return: (numpy.ndarray) A read-only structured view with fields t, o, h, l, c, v.
         """
+        seconds = resolution_seconds(resolution)
+        now = int(time.time())
+        # The open bar is only known from the server's own timestamps; until it closes,
+        # nothing from its start onwards needs to be requested again.
+        open_bar = self._open_bars.get((symbol, resolution))
+        if open_bar is not None and open_bar + seconds > now:
+            closed_to = min(int(time_to), open_bar - 1)
+        else:
+            closed_to = min(int(time_to), now)
+        for gap_from, gap_to in self.missing(symbol, resolution, time_from, closed_to):
+            columns = self.market_info.get_market_history_range(
+                symbol, resolution, gap_from, gap_to, max_workers=max_workers
+            )
+            keep = columns["t"] + seconds <= now
+            if len(keep) and not keep[-1]:
+                open_bar = int(columns["t"][-1])
+                self._open_bars[(symbol, resolution)] = open_bar
+                gap_to = min(gap_to, open_bar - 1)
+            else:
+                # No open bar was returned (e.g. no trades yet), so only the range
+                # every bar of which has closed counts as downloaded.
+                gap_to = min(gap_to, now - seconds)
+            if gap_to < gap_from:
+                continue
+            columns = {field: values[keep] for field, values in columns.items()}
+            self.write(symbol, resolution, columns, gap_from, gap_to)
+        return self.read(symbol, resolution, time_from, time_to)
+
+
+# ----- Execution Analytics -----
+DEPTH_SIDES: dict = {"ask": 1, "bid": -1}  # side walked by a BUY / SELL order
+
+
+class DepthMatrix:
+    """
+    One side of the order books of many markets as padded NumPy arrays.
 
-        payload: dict = {
-            "symbol": symbol,
-            "type": type_order,
-            "side": side,
-            "price": price,
+    Row i holds the levels of `symbols[i]`, best price first; missing levels have zero
+    quantity. All estimates are computed for every market and every size in one
+    vectorized call, without walking the levels in Python. Requires `numpy`.
+
+    Args:
+        books (dict): Depth results ({"ask": [...], "bid": [...]}) keyed by symbol.
+        side (str): "ask" to estimate BUY orders, "bid" to estimate SELL orders.
+
+    Example:
+        asks = DepthMatrix.from_order_book_all(MarketInfo().get_order_book_all("USDTTMN"), "ask")
+        estimate = asks.vwap([1, 10, 100])
+        print(dict(zip(asks.symbols, estimate["slippage_bps"][:, 1])))
+        print(asks.quantity_within([5, 10, 25]))
+    """
+
+    def __init__(self, books: dict, side: str):
+        """
+        Build the padded price and quantity matrices.
+
+        Args:
+            books (dict): Depth results ({"ask": [...], "bid": [...]}) keyed by symbol.
+            side (str): "ask" to estimate BUY orders, "bid" to estimate SELL orders.
+        """
+        import numpy as np
+
+        if side not in DEPTH_SIDES:
+            raise ValueError('side must be "ask" or "bid"')
+        self.side = side
+        self.sign = DEPTH_SIDES[side]
+        self.symbols = list(books)
+        levels = [
+            _parse_levels(DepthLevel.parse(books[symbol], side)._items)
+            for symbol in self.symbols
+        ]
+        width = max((len(rows) for rows in levels), default=0) or 1
+        self.prices = np.zeros((len(levels), width))
+        self.quantities = np.zeros((len(levels), width))
+        for i, rows in enumerate(levels):
+            # Best price first: lowest ask, highest bid.
+            rows.sort(key=lambda level: self.sign * level[0])
+            for j, (price, quantity) in enumerate(rows):
+                self.prices[i, j] = price
+                self.quantities[i, j] = quantity
+        self.cum_quantity = np.cumsum(self.quantities, axis=1)
+        self.cum_notional = np.cumsum(self.prices * self.quantities, axis=1)
+
+    @classmethod
+    def from_order_book(cls, payload, symbol: str, side: str) -> "DepthMatrix":
+        """
+        :param payload(dict): A `get_order_book_symbol` response.
+        :param symbol(str): The symbol of the book.
+        :param side(str): "ask" or "bid".
+        :return: (DepthMatrix) A one-row matrix.
+        """
+        return cls({symbol: _result(payload)}, side)
+
+    @classmethod
+    def from_order_book_all(
+        cls, payload, side: str, symbols: list = None
+    ) -> "DepthMatrix":
+        """
+        :param payload(dict): A `get_order_book_all` response.
+        :param side(str): "ask" or "bid".
+        :param symbols(list): Only include these symbols (optional).
+        :return: (DepthMatrix) One row per market.
+        """
+        books = _result(payload)
+        if not isinstance(books, dict):
+            raise requests.exceptions.RequestException(f"(Depth) error: {payload}")
+        if symbols is not None:
+            books = {symbol: books[symbol] for symbol in symbols if symbol in books}
+        return cls(books, side)
+
+    @property
+    def best(self):
+        """
+        :return: (numpy.ndarray) The best price of every market (0 for an empty book).
+        """
+        return self.prices[:, 0]
+
+    def row(self, symbol: str) -> int:
+        """
+        :param symbol(str): A symbol of the matrix.
+        :return: (int) Its row index.
+        """
+        return self.symbols.index(symbol)
+
+    def vwap(self, sizes, quote: bool = False) -> dict:
+        """
+        Estimate the fill of market orders of every size on every market.
+
+        :param sizes(list | numpy.ndarray): Order sizes, shape (K,) for all markets or (M, K) per market.
+        :param quote(bool): Sizes are in quote currency (e.g. TMN to spend) instead of base quantity.
+        :return: (dict) (M, K) arrays: "quantity" and "notional" filled, "vwap",
+                 "slippage_bps" (cost against the best price, positive is worse) and
+                 "complete" (False where the book is too thin for the whole size).
+        """
+        import numpy as np
+
+        sizes = np.asarray(sizes, dtype=np.float64)
+        if sizes.ndim == 1:
+            sizes = np.broadcast_to(sizes, (len(self.symbols), len(sizes)))
+        cum = self.cum_notional if quote else self.cum_quantity
+        total = cum[:, -1:]
+        target = np.minimum(sizes, total)
+        last = self.prices.shape[1] - 1
+        # Index of the level each order finishes in.
+        index = np.minimum((cum[:, :, None] < target[:, None, :]).sum(axis=1), last)
+        before = index - 1
+        has_before = before >= 0
+        before = np.maximum(before, 0)
+        prev_quantity = np.where(
+            has_before, np.take_along_axis(self.cum_quantity, before, axis=1), 0.0
+        )
+        prev_notional = np.where(
+            has_before, np.take_along_axis(self.cum_notional, before, axis=1), 0.0
+        )
+        price = np.take_along_axis(self.prices, index, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if quote:
+                notional = target
+                quantity = prev_quantity + (target - prev_notional) / price
+            else:
+                quantity = target
+                notional = prev_notional + (target - prev_quantity) * price
+            quantity = np.nan_to_num(quantity)
+            vwap = np.where(quantity > 0, notional / quantity, np.nan)
+            best = self.best[:, None]
+            slippage = self.sign * (vwap - best) / best * 1e4
+        return {
             "quantity": quantity,
+            "notional": notional,
+            "vwap": vwap,
+            "slippage_bps": slippage,
+            "complete": sizes <= total * (1 + 1e-12),
         }
 
-        if client_id:
-            if not self._validate_client_id(client_id):
-                return {
-                    "error": "Invalid client ID. Only letters, numbers, '.', ':', '-' and '_' are allowed."
-                }
-            payload["client_id"] = client_id
-
-        return self._make_request(endpoint, method="POST", json_payload=payload)
+    def quantity_within(self, bps, quote: bool = False):
+        """
+        Quantity available within some distance of the best price.
 
-    def get_order(self, clientOrderId: str, endpoint=ORDERS_EP["orders"]) -> dict:
+        :param bps(list | numpy.ndarray): Distances from the best price, in basis points.
+        :param quote(bool): Return quote notional instead of base quantity.
+        :return: (numpy.ndarray) (M, B) available quantity (or notional).
         """
-        Get information about a specific order by its clientOrderId.
+        import numpy as np
+
+        bps = np.asarray(bps, dtype=np.float64)
+        limit = self.best[:, None] * (1 + self.sign * bps[None, :] / 1e4)
+        prices = self.prices[:, :, None]
+        within = (
+            prices <= limit[:, None, :]
+            if self.sign > 0
+            else prices >= limit[:, None, :]
+        )
+        amounts = self.prices * self.quantities if quote else self.quantities
+        return (amounts[:, :, None] * within).sum(axis=1)
 
-        :param clientOrderId(str): The unique client identifier of the order.
-        :return: (dict) JSON response or an error message.
+
+# ----- Triangular Arbitrage -----
+TRIANGLE_SIZES: tuple = tuple(10 ** (6 + i / 4) for i in range(13))  # 1M to 1B TMN
+
+
+def fee_rates(payload, taker: bool = True) -> dict:
+    """
+    Read the fee rate of every market from a `get_fee` response.
+
+    :param payload(dict): A `AccountManage.get_fee` response.
+    :param taker(bool): Read taker rates (market orders) instead of maker rates.
+    :return: (dict) Fee rates as fractions (0.0025 for 0.25%), keyed by symbol.
+    """
+    key = "takerFeeRate" if taker else "makerFeeRate"
+    result = _result(payload)
+    rates = {}
+    if isinstance(result, dict):
+        for symbol, fee in result.items():
+            if isinstance(fee, dict) and fee.get(key) is not None:
+                rates[symbol] = float(fee[key])
+    return rates
+
+
+class TriangleScanner:
+    """
+    Scans every BASE/bridge, BASE/home and bridge/home triangle for arbitrage.
+
+    With the defaults, each base asset XXX with both XXXUSDT and XXXTMN markets forms a
+    triangle with USDTTMN, evaluated in both directions:
+    TMN -> USDT -> XXX -> TMN ("via-bridge") and TMN -> XXX -> USDT -> TMN ("via-base").
+    Every triangle is evaluated for every starting amount in `sizes` in one vectorized
+    pass over `DepthMatrix` fills, so sizing is depth-aware, and taker fees of each leg
+    are applied. Books come from one `get_order_book_all` request (`scan`), or are kept
+    current from the depth channels of a WebSocket (`attach`). Requires `numpy`.
+
+    Args:
+        market_info (MarketInfo): The client used to call get_order_book_all.
+        account_manage (AccountManage, optional): Used to load taker fees with get_fee. Defaults to None.
+        bridge (str, optional): The intermediate currency. Defaults to "USDT".
+        home (str, optional): The currency each cycle starts and ends in. Defaults to "TMN".
+        sizes (list, optional): Starting amounts in `home` currency. Defaults to 1M to 1B TMN.
+        fee_rate (float, optional): Fee rate of markets missing from get_fee. Defaults to 0.0025.
+        min_profit_bps (float, optional): Report only cycles at least this profitable. Defaults to 0.
+
+    Example:
+        scanner = TriangleScanner(MarketInfo(), AccountManage(api_key))
+        for opportunity in scanner.scan():
+            print(opportunity["path"], opportunity["size"], opportunity["profit_bps"])
+
+        # Streaming: rescan every triangle whenever a depth channel updates
+        scanner.attach(WebSocket(once=False), on_opportunity=print)
+    """
+
+    def __init__(
+        self,
+        market_info: MarketInfo,
+        account_manage: AccountManage = None,
+        bridge: str = "USDT",
+        home: str = "TMN",
+        sizes: list = TRIANGLE_SIZES,
+        fee_rate: float = 0.0025,
+        min_profit_bps: float = 0.0,
+    ):
         """
-        endpoint = f"{endpoint}/{clientOrderId}"
-        return self._make_request(endpoint)
+        Initialize the scanner. Nothing is requested until scan() or attach() is called.
 
-    def del_order(self, clientOrderId: str, endpoint=ORDERS_EP["orders"]) -> dict:
+        Args:
+            market_info (MarketInfo): The client used to call get_order_book_all.
+            account_manage (AccountManage, optional): Used to load taker fees with get_fee. Defaults to None.
+            bridge (str, optional): The intermediate currency. Defaults to "USDT".
+            home (str, optional): The currency each cycle starts and ends in. Defaults to "TMN".
+            sizes (list, optional): Starting amounts in `home` currency. Defaults to 1M to 1B TMN.
+            fee_rate (float, optional): Fee rate of markets missing from get_fee. Defaults to 0.0025.
+            min_profit_bps (float, optional): Report only cycles at least this profitable. Defaults to 0.
         """
-        Cancel an order by its clientOrderId.
+        self.market_info = market_info
+        self.account_manage = account_manage
+        self.bridge = bridge
+        self.home = home
+        self.bridge_market = bridge + home
+        self.sizes = sizes
+        self.fee_rate = fee_rate
+        self.min_profit_bps = min_profit_bps
+        self.books: dict = {}  # symbol -> {"ask": levels, "bid": levels}
+        self.fees: dict = None  # symbol -> taker fee rate
+        self.opportunities: list = []
+        self._lock = threading.RLock()
+        self._last_scan = 0.0
+
+    def load_fees(self) -> dict:
+        """
+        Load taker fees with `AccountManage.get_fee` (once; get_fee itself may be cached).
 
-        :param clientOrderId(str): The unique client identifier of the order to cancel.
-        :return: (dict) JSON response or an error message.
+        :return: (dict) Fee rates keyed by symbol.
         """
-        endpoint = f"{endpoint}/{clientOrderId}"
-        return self._make_request(endpoint, method="DELETE")
+        if self.fees is None:
+            self.fees = (
+                fee_rates(self.account_manage.get_fee())
+                if self.account_manage is not None
+                else {}
+            )
+        return self.fees
 
-    def get_open_orders(
-        self, symbol: str = None, endpoint=ORDERS_EP["openOrders"]
-    ) -> dict:
+    def refresh(self):
         """
-        Get a list of open orders.
+        Replace every book with one `get_order_book_all` snapshot.
 
-        :param symbol(str): The trading symbol (optional).
-        :return: (dict) JSON response or an error message.
+        :raises requests.exceptions.RequestException: If the response is an error.
         """
-        # params = {"symbol": symbol} if symbol else None
-        params = {"symbol": symbol}
-        return self._make_request(endpoint, params=params)
+        payload = self.market_info.get_order_book_all(self.bridge_market)
+        books = _result(payload)
+        if not isinstance(books, dict):
+            raise requests.exceptions.RequestException(f"(Depth) error: {payload}")
+        with self._lock:
+            self.books = dict(books)
+
+    def triangles(self) -> list:
+        """
+        :return: (list) The base assets that currently form a complete triangle.
+        """
+        if self.bridge_market not in self.books:
+            return []
+        return [
+            symbol[: -len(self.bridge)]
+            for symbol in self.books
+            if symbol.endswith(self.bridge)
+            and symbol != self.bridge_market
+            and symbol[: -len(self.bridge)] + self.home in self.books
+            and symbol[: -len(self.bridge)] != self.home
+        ]
+
+    def scan(self, payload=None) -> list:
+        """
+        Fetch (or take) an all-markets depth snapshot and evaluate every triangle.
 
-    def get_last_trades(
-        self, symbol: str = None, side: str = None, endpoint=ORDERS_EP["last_trades"]
-    ) -> dict:
+        :param payload(dict): A `get_order_book_all` response to use instead of fetching one (optional).
+        :return: (list) Opportunities, most profitable first.
         """
-        Get a list of the last trades.
+        if payload is None:
+            self.refresh()
+        else:
+            books = _result(payload)
+            with self._lock:
+                self.books = dict(books)
+        return self.evaluate()
+
+    def _fee(self, symbols: list):
+        import numpy as np
+
+        fees = self.load_fees()
+        return np.array([fees.get(symbol, self.fee_rate) for symbol in symbols])[
+            :, None
+        ]
+
+    def evaluate(self) -> list:
+        """
+        Evaluate every triangle in both directions on the current books.
 
-        :param symbol(str): The trading symbol (optional).
-        :param side(str): Order side ("buy" or "sell") (optional).
-        :return: (dict) JSON response or an error message.
+        :return: (list) Opportunities with at least `min_profit_bps`, most profitable first.
+            Each one is a dict with "base", "path", "sides", "size" (start amount),
+            "final" (end amount), "profit", "profit_bps" and "prices" (VWAP of each leg).
         """
-        # params = {"symbol": symbol, "side": side} if symbol and side else None
-        params = {"symbol": symbol, "side": side}
-        return self._make_request(endpoint, params=params)
+        import numpy as np
+
+        with self._lock:
+            bases = self.triangles()
+            books = self.books
+            if not bases:
+                self.opportunities = []
+                return []
+            cross = [base + self.bridge for base in bases]
+            direct = [base + self.home for base in bases]
+            bridge = {self.bridge_market: books[self.bridge_market]}
+            matrices = {
+                "cross_ask": DepthMatrix({s: books[s] for s in cross}, "ask"),
+                "cross_bid": DepthMatrix({s: books[s] for s in cross}, "bid"),
+                "direct_ask": DepthMatrix({s: books[s] for s in direct}, "ask"),
+                "direct_bid": DepthMatrix({s: books[s] for s in direct}, "bid"),
+                "bridge_ask": DepthMatrix(bridge, "ask"),
+                "bridge_bid": DepthMatrix(bridge, "bid"),
+            }
+
+        sizes = np.asarray(self.sizes, dtype=np.float64)
+        shape = (len(bases), len(sizes))
+        fee_cross, fee_direct = self._fee(cross), self._fee(direct)
+        fee_bridge = self._fee([self.bridge_market])
+
+        # via-bridge: home -> bridge (buy) -> base (buy) -> home (sell)
+        leg1 = matrices["bridge_ask"].vwap(sizes, quote=True)
+        bridge_amount = np.broadcast_to(leg1["quantity"] * (1 - fee_bridge), shape)
+        leg2 = matrices["cross_ask"].vwap(bridge_amount, quote=True)
+        leg3 = matrices["direct_bid"].vwap(leg2["quantity"] * (1 - fee_cross))
+        via_bridge = (
+            leg3["notional"] * (1 - fee_direct),
+            leg1["complete"] & leg2["complete"] & leg3["complete"],
+            (np.broadcast_to(leg1["vwap"], shape), leg2["vwap"], leg3["vwap"]),
+        )
+
+        # via-base: home -> base (buy) -> bridge (sell) -> home (sell)
+        leg1 = matrices["direct_ask"].vwap(np.broadcast_to(sizes, shape), quote=True)
+        leg2 = matrices["cross_bid"].vwap(leg1["quantity"] * (1 - fee_direct))
+        bridge_amount = (leg2["notional"] * (1 - fee_cross)).reshape(1, -1)
+        leg3 = {
+            key: value.reshape(shape)
+            for key, value in matrices["bridge_bid"].vwap(bridge_amount).items()
+        }
+        via_base = (
+            leg3["notional"] * (1 - fee_bridge),
+            leg1["complete"] & leg2["complete"] & leg3["complete"],
+            (leg1["vwap"], leg2["vwap"], leg3["vwap"]),
+        )
 
+        opportunities = []
+        for direction, (final, complete, prices) in (
+            ("via-bridge", via_bridge),
+            ("via-base", via_base),
+        ):
+            profit = np.where(complete, final - sizes, -np.inf)
+            best = np.argmax(profit, axis=1)
+            for i, base in enumerate(bases):
+                k = best[i]
+                if not np.isfinite(profit[i, k]):
+                    continue
+                profit_bps = profit[i, k] / sizes[k] * 1e4
+                if profit_bps < self.min_profit_bps:
+                    continue
+                if direction == "via-bridge":
+                    path = [self.bridge_market, cross[i], direct[i]]
+                    sides = ["BUY", "BUY", "SELL"]
+                else:
+                    path = [direct[i], cross[i], self.bridge_market]
+                    sides = ["BUY", "SELL", "SELL"]
+                opportunities.append(
+                    {
+                        "base": base,
+                        "direction": direction,
+                        "path": path,
+                        "sides": sides,
+                        "size": float(sizes[k]),
+                        "final": float(final[i, k]),
+                        "profit": float(profit[i, k]),
+                        "profit_bps": float(profit_bps),
+                        "prices": [float(leg[i, k]) for leg in prices],
+                    }
+                )
+        opportunities.sort(key=lambda item: item["profit_bps"], reverse=True)
+        self.opportunities = opportunities
+        return opportunities
+
+    def attach(
+        self,
+        websocket: WebSocket,
+        on_opportunity: callable = None,
+        min_interval: float = 0.0,
+    ):
+        """
+        Keep the books current from the depth channels of a WebSocket and rescan on every update.
+
+        :param websocket: A WebSocket client created with once=False.
+        :type websocket: WebSocket
+        :param on_opportunity: Called with the opportunity list whenever a rescan finds any (optional).
+        :type on_opportunity: callable
+        :param min_interval: Minimum seconds between two rescans. Defaults to 0.
+        :type min_interval: float
+        """
+        if not self.books:
+            self.refresh()
+        symbols = {self.bridge_market}
+        for base in self.triangles():
+            symbols.update((base + self.bridge, base + self.home))
+
+        def on_depth(symbol, side, levels):
+            with self._lock:
+                self.books[symbol] = dict(
+                    self.books.get(symbol) or {}, **{side: levels}
+                )
+                now = time.monotonic()
+                if now - self._last_scan < min_interval:
+                    return
+                self._last_scan = now
+                opportunities = self.evaluate()
+            if opportunities and on_opportunity is not None:
+                try:
+                    on_opportunity(opportunities)
+                except Exception as e:
+                    print(f"Error in callback: {e}")
+
+        for symbol in sorted(symbols):
+            websocket.subscribe(
+                symbol,
+                EVENTS["buyDepth"],
+                lambda levels, symbol=symbol: on_depth(symbol, "bid", levels),
+                wait=False,
+            )
+            websocket.subscribe(
+                symbol,
+                EVENTS["sellDepth"],
+                lambda levels, symbol=symbol: on_depth(symbol, "ask", levels),
+                wait=False,
+            )
 
-class MarketsOTC:
-    """
-    A Python client for interacting with the Wallex OTC Markets API.
 
-    Args:
-        api_key (str): Your Wallex API key.
-        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+# ----- Best Execution -----
+ROUTE_SIDES: dict = {
+    "BUY": "ask",
+    "SELL": "bid",
+}  # spot book side walked by each order side
 
-    Methods:
-        get_otc_markets():
-            Get OTC markets.
 
-            Returns:
-                dict: JSON response or an error message.
+def _round_fixed(value, scale: int, rounding: str) -> Fixed:
+    """
+    :param value(float | str | Fixed): The number.
+    :param scale(int): Number of decimal places kept.
+    :param rounding(str): A `decimal` rounding mode, e.g. ROUND_FLOOR.
+    :return: (Fixed) The value rounded to `scale` places in the given direction.
+    """
+    number = Decimal(repr(value) if isinstance(value, float) else str(value))
+    return Fixed(number.quantize(Decimal(1).scaleb(-scale), rounding), scale)
 
-        get_otc_price(symbol: str, side: str):
-            Get the OTC price for a specific symbol and side.
 
-            Args:
-                symbol (str): The trading symbol.
-                side (str): OTC side (BUY or SELL).
+class ExecutionRouter:
+    """
+    Routes an order to OTC or to the spot order book, whichever is better after fees.
 
-            Returns:
-                dict: JSON response or an error message.
+    For a (symbol, side, amount) the OTC quote (`get_otc_price`) and the spot book
+    (`get_order_book_symbol`) are fetched concurrently, so a decision costs one parallel
+    round trip. The spot fill is estimated by walking the book with `DepthMatrix`, and
+    both routes are compared all-in: the lowest total cost for a BUY, the highest total
+    proceeds for a SELL. Spot orders are sent as LIMIT orders at the deepest price the
+    estimate walks to, so the fill can not be worse than the estimate; the price and
+    quantity are rounded to the market's `Precision` (the price away from the book, the
+    quantity down). Requires `numpy`.
 
-        get_otc_orders(symbol: str, side: str, amount: float):
-            Get OTC orders for a specific symbol, side, and amount.
+    Args:
+        market_info (MarketInfo): The client used to call get_order_book_symbol.
+        markets_otc (MarketsOTC): The client used to call get_otc_price and get_otc_orders.
+        orders_manage (OrdersManage, optional): The client used to call set_order. Defaults to None (quote only).
+        account_manage (AccountManage, optional): Used to load taker fees with get_fee. Defaults to None.
+        fee_rate (float, optional): Spot fee rate of markets missing from get_fee. Defaults to 0.0025.
+        otc_fee_rate (float, optional): Fee rate charged on top of the OTC price. Defaults to 0.
 
-            Args:
-                symbol (str): The trading symbol.
-                side (str): OTC side (BUY or SELL).
-                amount (float): The amount of the OTC order.
+    Example:
+        router = ExecutionRouter(MarketInfo(), MarketsOTC(api_key), OrdersManage(api_key), AccountManage(api_key))
+        decision = router.quote("USDTTMN", "BUY", 100)
+        print(decision["route"], decision["otc"]["total"], decision["spot"]["total"])
 
-            Returns:
-                dict: JSON response or an error message.
+        # Quote and send the order through the chosen route
+        print(router.execute("USDTTMN", "BUY", 100)["result"])
     """
 
-    def __init__(self, api_key, base_url=BASE_URL):
+    def __init__(
+        self,
+        market_info: MarketInfo,
+        markets_otc: MarketsOTC,
+        orders_manage: OrdersManage = None,
+        account_manage: AccountManage = None,
+        fee_rate: float = 0.0025,
+        otc_fee_rate: float = 0.0,
+    ):
         """
-        Initialize the API client with the provided API key.
+        Initialize the router. Nothing is requested until quote() or execute() is called.
 
         Args:
-            api_key (str): Your Wallex API key.
-            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            market_info (MarketInfo): The client used to call get_order_book_symbol.
+            markets_otc (MarketsOTC): The client used to call get_otc_price and get_otc_orders.
+            orders_manage (OrdersManage, optional): The client used to call set_order. Defaults to None (quote only).
+            account_manage (AccountManage, optional): Used to load taker fees with get_fee. Defaults to None.
+            fee_rate (float, optional): Spot fee rate of markets missing from get_fee. Defaults to 0.0025.
+            otc_fee_rate (float, optional): Fee rate charged on top of the OTC price. Defaults to 0.
         """
-        self.api_key = api_key
-        self.BASE_URL = base_url
-        self.CONTENT_TYPE = CONTENT_TYPE
-
-    def _make_request(self, endpoint, method="GET", params=None, json_payload=None):
+        self.market_info = market_info
+        self.markets_otc = markets_otc
+        self.orders_manage = orders_manage
+        self.account_manage = account_manage
+        self.fee_rate = fee_rate
+        self.otc_fee_rate = otc_fee_rate
+        self.fees: dict = None  # symbol -> taker fee rate
+        self.precisions: dict = None  # symbol -> Precision
+
+    def load_fees(self) -> dict:
         """
-        Make an HTTP request to the Wallex API.
+        Load taker fees with `AccountManage.get_fee` (once; get_fee itself may be cached).
 
-        :param endpoint(str): The API endpoint.
-        :param method(str): The HTTP method (GET or POST or DELETE).
-        :param params(dict): Query parameters (for GET requests).
-        :param json_payload(dict): JSON payload (for POST requests).
-        :return: (dict) JSON response or an error message.
+        :return: (dict) Fee rates keyed by symbol.
         """
-        url = self.BASE_URL + endpoint
-        headers = {
-            "Content-Type": self.CONTENT_TYPE,
-            "x-api-key": self.api_key,
-        }
-        try:
-            response = requests.request(
-                method, url, headers=headers, params=params, json=json_payload
+        if self.fees is None:
+            self.fees = (
+                fee_rates(self.account_manage.get_fee())
+                if self.account_manage is not None
+                else {}
             )
-            # response.raise_for_status()  # Raise an error if the response status code is not in the 200s.
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"(Request) error: {e}"}
-        except requests.exceptions.HTTPError as e:
-            return {"error": f"(HTTP) error: {e}"}
+        return self.fees
 
-    def get_otc_markets(self, endpoint=OTC_EP["otc_markets"]):
+    def load_precisions(self) -> dict:
         """
-        Get a list of OTC markets.
+        Load market precisions with `MarketInfo.get_markets` (once; get_markets itself may be cached).
 
-        :return: (dict) JSON response or an error message.
+        :return: (dict) Precision keyed by symbol.
         """
-        return self._make_request(endpoint)
+        if self.precisions is None:
+            precisions = Precision.from_markets(self.market_info.get_markets())
+            if not precisions:
+                return {}
+            self.precisions = precisions
+        return self.precisions
+
+    @staticmethod
+    def _costs(side: str, amount: float, notional: float, fee_rate: float) -> dict:
+        fee = notional * fee_rate
+        total = notional + fee if side == "BUY" else notional - fee
+        return {
+            "notional": notional,
+            "fee_rate": fee_rate,
+            "fee": fee,
+            "total": total,
+            "effective_price": total / amount,
+        }
 
-    def get_otc_price(self, symbol: str, side: str, endpoint=OTC_EP["otc_price"]):
+    def _otc_route(self, side: str, amount: float, payload) -> dict:
+        result = _result(payload)
+        if not isinstance(result, dict) or result.get("price") in (None, ""):
+            return {"available": False, "error": f"(OTC) error: {payload}"}
+        price = float(result["price"])
+        route = {"available": True, "price": price}
+        route.update(self._costs(side, amount, price * amount, self.otc_fee_rate))
+        return route
+
+    def _spot_route(self, symbol: str, side: str, amount: float, payload) -> dict:
+        import numpy as np
+
+        book = _result(payload)
+        if not isinstance(book, dict) or "error" in book:
+            return {"available": False, "error": f"(Depth) error: {payload}"}
+        matrix = DepthMatrix({symbol: book}, ROUTE_SIDES[side])
+        fill = {key: value[0, 0] for key, value in matrix.vwap([amount]).items()}
+        if not fill["complete"]:
+            return {
+                "available": False,
+                "error": f"Spot depth ({matrix.cum_quantity[0, -1]}) is below {amount}",
+            }
+        # Deepest level the order walks to: the limit price that caps its fill.
+        last = np.searchsorted(matrix.cum_quantity[0], amount * (1 - 1e-12))
+        route = {
+            "available": True,
+            "price": float(fill["vwap"]),
+            "best": float(matrix.best[0]),
+            "limit": float(matrix.prices[0, min(last, matrix.prices.shape[1] - 1)]),
+            "slippage_bps": float(fill["slippage_bps"]),
+        }
+        fee_rate = (self.fees or {}).get(symbol, self.fee_rate)
+        route.update(self._costs(side, amount, float(fill["notional"]), fee_rate))
+        return route
+
+    def quote(self, symbol: str, side: str, amount) -> dict:
         """
-        Get the OTC price for a specific symbol and side.
+        Fetch the OTC quote and the spot book concurrently and choose a route.
 
         :param symbol(str): The trading symbol.
-        :param side(str): OTC side (BUY or SELL).
-        :return: (dict) JSON response or an error message.
+        :param side(str): Order side (BUY or SELL).
+        :param amount(float | str | Fixed): Quantity of the base asset.
+        :return: (dict) The decision: "route" ("otc", "spot" or None if neither can fill),
+                 "otc" and "spot" price breakdowns (price, notional, fee_rate, fee, total,
+                 effective_price; spot also best, limit and slippage_bps), "savings" (total
+                 saved against the other route) and "latency" (seconds to decide).
         """
-        if side not in {"BUY", "SELL"}:
-            return {"error": "Invalid OTC side"}
-
-        params = {"symbol": symbol, "side": side}
-        return self._make_request(endpoint, params=params)
+        if side not in ROUTE_SIDES:
+            return {"error": "Invalid side"}
+        size = float(amount)
+        calls = {
+            "otc": lambda: self.markets_otc.get_otc_price(symbol, side),
+            "spot": lambda: self.market_info.get_order_book_symbol(symbol),
+        }
+        if self.fees is None and self.account_manage is not None:
+            calls["fee"] = self.load_fees
+        if self.precisions is None and self.orders_manage is not None:
+            calls["markets"] = self.load_precisions
+        started = time.perf_counter()
+        responses = _fan_out(lambda name: calls[name](), calls)
+        latency = time.perf_counter() - started
+
+        otc = self._otc_route(side, size, responses["otc"])
+        spot = self._spot_route(symbol, side, size, responses["spot"])
+        routes = {
+            name: r for name, r in (("spot", spot), ("otc", otc)) if r["available"]
+        }
+        choose = min if side == "BUY" else max
+        route = choose(routes, key=lambda name: routes[name]["total"], default=None)
+        savings = None
+        if len(routes) == 2:
+            savings = abs(otc["total"] - spot["total"])
+        return {
+            "symbol": symbol,
+            "side": side,
+            "amount": amount,
+            "route": route,
+            "otc": otc,
+            "spot": spot,
+            "savings": savings,
+            "latency": latency,
+        }
 
-    def get_otc_orders(
-        self, symbol: str, side: str, amount: float, endpoint=OTC_EP["otc_orders"]
-    ):
+    def execute(self, symbol: str, side: str, amount, client_id: str = None) -> dict:
         """
-        Get OTC orders for a specific symbol, side, and amount.
+        Quote both routes and send the order through the better one.
 
         :param symbol(str): The trading symbol.
-        :param side(str): OTC side (BUY or SELL).
-        :param amount(float): The amount of the OTC order.
-        :return: (dict) JSON response or an error message.
+        :param side(str): Order side (BUY or SELL).
+        :param amount(float | str | Fixed): Quantity of the base asset.
+        :param client_id(str): Client identifier of a spot order (optional).
+        :return: (dict) The `quote` decision with the order response under "result".
         """
-        if side not in {"BUY", "SELL"}:
-            return {"error": "Invalid OTC side"}
+        decision = self.quote(symbol, side, amount)
+        route = decision.get("route")
+        if route == "otc":
+            decision["result"] = self.markets_otc.get_otc_orders(symbol, side, amount)
+        elif route == "spot" and self.orders_manage is not None:
+            precision = self.load_precisions().get(symbol, Precision())
+            price = _round_fixed(
+                decision["spot"]["limit"],
+                precision.price_scale,
+                ROUND_CEILING if side == "BUY" else ROUND_FLOOR,
+            )
+            quantity = _round_fixed(amount, precision.quantity_scale, ROUND_FLOOR)
+            if quantity > 0:
+                decision["result"] = self.orders_manage.set_order(
+                    symbol, "LIMIT", side, price, quantity, client_id
+                )
+            else:
+                decision["result"] = {
+                    "error": f"Amount {amount} is below the market precision"
+                }
+        elif route == "spot":
+            decision["result"] = {"error": "Spot route needs an OrdersManage client"}
+        else:
+            decision["result"] = {
+                "error": decision.get("error", "Neither route can fill the order")
+            }
+        return decision
 
-        payload = {"symbol": symbol, "side": side, "amount": amount}
-        return self._make_request(endpoint, method="POST", json_payload=payload)
 
+# ----- Stream Recorder -----
+RECORD_MAGIC: bytes = b"WALLEXR1"
+RECORD_HEADER = struct.Struct("<dHI")  # receive time, channel length, payload length
+RECORD_SUFFIX: str = ".wxr"
 
-class WebSocket:
+
+def list_segments(directory: str, prefix: str = "wallex") -> list:
     """
-    A class for interacting with the Wallex WebSocket API to receive live market data.
+    List recorded segment files in recording order.
 
-    Args:
-        base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+    :param directory(str): The directory the recorder wrote to.
+    :param prefix(str): The segment file name prefix.
+    :return: (list) Segment file paths, oldest first.
+    """
+    names = sorted(
+        name
+        for name in os.listdir(directory)
+        if name.startswith(prefix + "-") and name.endswith(RECORD_SUFFIX)
+    )
+    return [os.path.join(directory, name) for name in names]
 
-    Methods:
-        __init__(self, once: bool = True, base_url: str = BASE_URL): Initialize the WebSocket class.
-        subscribe(self, symbol: str, event: str, callback: callable): Subscribe to a market event.
-        handle_received_data(self, data: dict): Handle received data.
-        disconnect(self): Disconnect from the Socket.IO server.
-        get_market_cap(self, symbol, event=EVENTS["marketCap"]): Get market capitalization data.
-        get_buy_depth(self, symbol, event=EVENTS["buyDepth"]): Get buy depth data.
-        get_sell_depth(self, symbol, event=EVENTS["sellDepth"]): Get sell depth data.
-        get_trade(self, symbol, event=EVENTS["trade"]): Get trade data.
 
-    Example:
-        # Create an instance of the WebSocket class
-        client = WebSocket()
+def read_records(path: str):
+    """
+    Iterate over the records of one segment file.
 
-        # Define a symbol to subscribe to (e.g., "USDTTMN")
-        symbol = "USDTTMN"
+    A truncated last record (e.g. after a crash) is ignored.
 
-        # Subscribe to the "marketCap" event and provide a callback function
-        client.subscribe(symbol, EVENTS["marketCap"], client.handle_received_data)
+    :param path(str): The segment file path.
+    :return: (generator) (channel, receive_time, payload) tuples; the payload is the raw JSON bytes.
+    :raises ValueError: If the file is not a recorder segment.
+    """
+    header_size = RECORD_HEADER.size
+    unpack = RECORD_HEADER.unpack_from
+    with open(path, "rb") as f:
+        if f.read(len(RECORD_MAGIC)) != RECORD_MAGIC:
+            raise ValueError(f"Not a recorder segment: {path}")
+        buffer = f.read()
+    offset, end = 0, len(buffer)
+    while offset + header_size <= end:
+        received_at, channel_length, payload_length = unpack(buffer, offset)
+        start = offset + header_size
+        stop = start + channel_length + payload_length
+        if stop > end:
+            break
+        channel = buffer[start : start + channel_length].decode("utf-8")
+        yield channel, received_at, buffer[start + channel_length : stop]
+        offset = stop
+
+
+class StreamRecorder:
+    """
+    An append-only binary recorder for live WebSocket channels.
 
-        # Subscribe to the "sellDepth" event and provide a callback function
-        client.subscribe(symbol, EVENTS["sellDepth"], client.handle_received_data)
+    Every "Broadcaster" message of the recorded channels is appended to a segment file as
+    a length-prefixed record (receive time, channel, JSON payload). Segments rotate when
+    they reach `max_bytes` or `max_seconds`, and can be read back with `read_records`.
 
-        # Subscribe to the "buyDepth" event and provide a callback function
-        client.subscribe(symbol, EVENTS["buyDepth"], client.handle_received_data)
+    Args:
+        directory (str): Directory for the segment files; created if missing.
+        symbols (list): The symbols to record.
+        events (list, optional): The events to record for each symbol. Defaults to all EVENTS.
+        websocket (WebSocket, optional): Connection to subscribe on. Defaults to a new WebSocket(once=False).
+        max_bytes (int, optional): Rotate a segment once it reaches this size. Defaults to 64 MiB.
+        max_seconds (float, optional): Rotate a segment once it is this old. Defaults to 3600.
+        prefix (str, optional): Segment file name prefix. Defaults to "wallex".
 
-        # Subscribe to the "trade" event and provide a callback function
-        client.subscribe(symbol, EVENTS["trade"], client.handle_received_data)
+    Example:
+        recorder = StreamRecorder("recordings", ["USDTTMN", "BTCUSDT"])
+        recorder.start()
+        time.sleep(60)
+        recorder.stop()
+
+        for path in list_segments("recordings"):
+            for channel, received_at, payload in read_records(path):
+                print(channel, received_at, json.loads(payload))
     """
 
-    def __init__(self, once: bool = True, base_url=BASE_URL):
+    def __init__(
+        self,
+        directory: str,
+        symbols: list,
+        events: list = None,
+        websocket: WebSocket = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_seconds: float = 3600.0,
+        prefix: str = "wallex",
+    ):
         """
-        Initialize the WebSocket class.
+        Initialize the recorder. Nothing is subscribed until start() is called.
 
         Args:
-            once (bool, optional): Whether to disconnect after receiving data once. Defaults to True.
-            base_url (str, optional): The base URL of the Wallex API. Defaults to "https://api.wallex.ir/".
+            directory (str): Directory for the segment files; created if missing.
+            symbols (list): The symbols to record.
+            events (list, optional): The events to record for each symbol. Defaults to all EVENTS.
+            websocket (WebSocket, optional): Connection to subscribe on. Defaults to a new WebSocket(once=False).
+            max_bytes (int, optional): Rotate a segment once it reaches this size. Defaults to 64 MiB.
+            max_seconds (float, optional): Rotate a segment once it is this old. Defaults to 3600.
+            prefix (str, optional): Segment file name prefix. Defaults to "wallex".
         """
-        self.once = once
-        self.sio = socketio.Client()
-        self.latest_data = None  # Initialize instance variable to store latest data
-        self.BASE_URL = base_url
-        self.TRANSPORT = "websocket"
-
-    def _on_broadcaster(self, channel: str, data: dict):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.channels = [
+            (symbol, event)
+            for symbol in symbols
+            for event in (EVENTS.values() if events is None else events)
+        ]
+        self._owns_websocket = websocket is None
+        self.websocket = websocket if websocket is not None else WebSocket(once=False)
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.prefix = prefix
+        self.records = 0
+        self.bytes_written = 0
+        self._file = None
+        self._segment_bytes = 0
+        self._segment_started = 0.0
+        self._sequence = 0
+        self._callbacks = {}
+        self._lock = threading.Lock()
+
+    def _open_segment(self):
+        self._segment_started = time.time()
+        stamp = int(self._segment_started * 1000)
+        while True:
+            # The sequence number keeps segments opened within the same millisecond
+            # apart; "xb" never appends to a segment another recorder created.
+            self._sequence += 1
+            name = f"{self.prefix}-{stamp:013d}-{self._sequence:06d}{RECORD_SUFFIX}"
+            try:
+                self._file = open(
+                    os.path.join(self.directory, name), "xb", buffering=1 << 20
+                )
+                break
+            except FileExistsError:
+                continue
+        self._file.write(RECORD_MAGIC)
+        self._segment_bytes = len(RECORD_MAGIC)
+
+    def _close_segment(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def record(self, channel: str, data, received_at: float = None):
         """
-        Internal event handler for "Broadcaster" events.
+        Append one message to the current segment, rotating it first if needed.
 
-        :param channel: The channel name.
+        :param channel: The channel the message arrived on.
         :type channel: str
 
-        :param data: The data received.
-        :type data: dict
+        :param data: The decoded message payload.
+        :type data: dict | list
 
+        :param received_at: Receive time (Unix seconds). Defaults to now.
+        :type received_at: float
         """
-        try:
-            if self.callback:
-                self.callback(data)
-        except Exception as e:
-            print(f"Error in callback: {e}")
+        if received_at is None:
+            received_at = time.time()
+        channel_bytes = channel.encode("utf-8")
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        record = (
+            RECORD_HEADER.pack(received_at, len(channel_bytes), len(payload))
+            + channel_bytes
+            + payload
+        )
+        with self._lock:
+            if self._file is None or (
+                self._segment_bytes + len(record) > self.max_bytes
+                or received_at - self._segment_started >= self.max_seconds
+            ):
+                self._close_segment()
+                self._open_segment()
+            self._file.write(record)
+            self._segment_bytes += len(record)
+            self.bytes_written += len(record)
+            self.records += 1
+
+    def start(self):
+        """
+        Subscribe to every recorded channel and start appending messages.
+        """
+        for symbol, event in self.channels:
+            channel = symbol + event
+            callback = self._callbacks[channel] = (
+                lambda data, channel=channel: self.record(channel, data)
+            )
+            self.websocket.subscribe(symbol, event, callback, wait=False)
 
-    def _connect(self):
+    def flush(self):
         """
-        Connect to the Socket.IO server and subscribe to the specified channel.
+        Flush buffered records of the current segment to disk.
         """
-        try:
-            # Define the "connect" event handler
-            @self.sio.event
-            def connect():
-                # Emit the "subscribe" event with the desired channel
-                self.sio.emit("subscribe", {"channel": self.channel})
-                print(f"Connected to {self.BASE_URL}")
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def stop(self):
+        """
+        Unsubscribe from every recorded channel and close the current segment.
+        """
+        for symbol, event in self.channels:
+            callback = self._callbacks.pop(symbol + event, None)
+            if callback is not None:
+                self.websocket.unsubscribe(symbol, event, callback)
+        if self._owns_websocket:
+            self.websocket.disconnect()
+        with self._lock:
+            self._close_segment()
+
+
+# ----- Stream Replay -----
+class ReplayWebSocket:
+    """
+    A stand-in for `WebSocket` that replays recorded channels instead of connecting.
 
-            # Define the "disconnect" event handler
-            @self.sio.event
-            def disconnect():
-                print("Disconnected from the server")
+    Messages written by `StreamRecorder` are fed, in recording order, to the callbacks
+    registered with the same `subscribe(symbol, event, callback)` API, so strategies run
+    unchanged against recorded data. Messages of channels nobody subscribed to are
+    skipped without being decoded.
 
-            # Register the "Broadcaster" event handler
-            self.sio.on("Broadcaster", self._on_broadcaster)
+    Args:
+        source (str | list): A recording directory, or a list of segment file paths.
+        speed (float, optional): Replay speed; 1.0 is real time, 10.0 is ten times faster and None is as fast as possible. Defaults to None.
+        prefix (str, optional): Segment file name prefix when `source` is a directory. Defaults to "wallex".
 
-            # Connect to the Socket.IO server with the specified transport
-            self.sio.connect(self.BASE_URL, transports=[self.TRANSPORT])
+    Example:
+        client = ReplayWebSocket("recordings", speed=None)
+        book = OrderBook("USDTTMN")
+        book.attach(client)
+        client.subscribe("USDTTMN", EVENTS["trade"], on_trade)  # runs the replay
+        print(client.messages, client.rate())
+    """
 
-            # Keep the client running
-            self.sio.wait()
+    def __init__(self, source, speed: float = None, prefix: str = "wallex"):
+        """
+        Initialize the replay source.
 
-        except Exception as e:
-            print(f"Error: {e}")
+        Args:
+            source (str | list): A recording directory, or a list of segment file paths.
+            speed (float, optional): Replay speed; 1.0 is real time, 10.0 is ten times faster and None is as fast as possible. Defaults to None.
+            prefix (str, optional): Segment file name prefix when `source` is a directory. Defaults to "wallex".
+        """
+        self.paths = (
+            list_segments(source, prefix) if isinstance(source, str) else list(source)
+        )
+        self.speed = speed
+        self.subscriptions: dict = {}  # channel -> list of callbacks
+        self.snapshots: dict = {}  # channel -> latest payload
+        self.latest_data = None
+        self.messages = 0
+        self.elapsed = 0.0
+        self._stopped = False
+
+    def _on_broadcaster(self, channel: str, data):
+        self.snapshots[channel] = data
+        for callback in tuple(self.subscriptions.get(channel, ())):
+            try:
+                callback(data)
+            except Exception as e:
+                print(f"Error in callback: {e}")
+
+    def connect(self):
+        """
+        Kept for compatibility with `WebSocket`; a replay has nothing to connect to.
+        """
+        self._stopped = False
+
+    def wait(self):
+        """
+        Replay every recorded message to the subscribed callbacks, then return.
+        """
+        self._stopped = False
+        loads = get_json_decoder()
+        subscriptions = self.subscriptions
+        dispatch = self._on_broadcaster
+        speed = self.speed
+        first_at = None
+        started = time.perf_counter()
+        messages = 0
+        for path in self.paths:
+            if self._stopped:
+                break
+            for channel, received_at, payload in read_records(path):
+                if self._stopped:
+                    break
+                if channel not in subscriptions:
+                    continue
+                if speed:
+                    if first_at is None:
+                        first_at = received_at
+                    delay = (received_at - first_at) / speed - (
+                        time.perf_counter() - started
+                    )
+                    if delay > 0:
+                        time.sleep(delay)
+                dispatch(channel, loads(payload))
+                messages += 1
+        self.messages += messages
+        self.elapsed += time.perf_counter() - started
 
     def disconnect(self):
         """
-        Disconnect from the Socket.IO server.
+        Stop a replay in progress (e.g. from inside a callback).
         """
-        self.sio.disconnect()
+        self._stopped = True
 
-    def subscribe(self, symbol: str, event: str, callback: callable):
+    def subscribe(self, symbol: str, event: str, callback: callable, wait: bool = True):
         """
-        Subscribe to a specific channel and set the callback function to handle received data.
+        Subscribe to a recorded channel and add a callback function to handle its messages.
 
         :param symbol: The symbol or market identifier.
         :type symbol: str
@@ -939,91 +6126,366 @@ class WebSocket:
         :param callback: The callback function to handle received data.
         :type callback: callable
 
+        :param wait: Whether to run the replay now. Defaults to True.
+        :type wait: bool
         """
-        self.channel = symbol + event
-        self.callback = callback
-        self._connect()
+        self.subscriptions.setdefault(symbol + event, []).append(callback)
+        if wait:
+            self.wait()
 
-    def handle_received_data(self, data: dict):
+    def unsubscribe(self, symbol: str, event: str, callback: callable = None):
         """
-        Handle received data.
+        Remove a callback from a channel, or the whole channel.
 
-        :param data: The received data.
-        :type data: dict
+        :param symbol: The symbol or market identifier.
+        :type symbol: str
+
+        :param event: The event type to unsubscribe from.
+        :type event: str
+
+        :param callback: The callback to remove (optional; all callbacks of the channel by default).
+        :type callback: callable
         """
+        channel = symbol + event
+        callbacks = self.subscriptions.get(channel)
+        if callbacks is None:
+            return
+        if callback is not None and callback in callbacks:
+            callbacks.remove(callback)
+        if callback is None or not callbacks:
+            del self.subscriptions[channel]
+
+    def rate(self) -> float:
+        """
+        :return: Messages dispatched per second of replay so far.
+        :rtype: float
+        """
+        return self.messages / self.elapsed if self.elapsed else 0.0
 
-        # print(f"{self.channel} - Received message:\n", data)
 
-        # Store received data in instance variable
-        self.latest_data = data
+# ----- Order Tracker -----
+ORDER_EVENTS: tuple = ("new", "partial", "filled", "cancelled")
 
-        # Disconnect after receiving data once
-        if self.once:
-            self.disconnect()
 
-    def get_market_cap(self, symbol, event=EVENTS["marketCap"]) -> dict:
-        """
-        Get market capitalization data for a symbol.
+def _order_quantity(order: dict, key: str) -> float:
+    try:
+        return float(order.get(key) or 0)
+    except (TypeError, ValueError):
+        return 0.0
 
-        :param symbol: The symbol or market identifier.
-        :type symbol: str
 
-        :param event: The event type (default: marketCap).
-        :type event: str
+TRADE_MEMORY: int = 10000  # trade keys remembered by OrderTracker
 
-        :return: The latest market capitalization data.
-        :rtype: dict
-        """
-        self.subscribe(symbol=symbol, event=event, callback=self.handle_received_data)
-        return self.latest_data
 
-    def get_buy_depth(self, symbol, event=EVENTS["buyDepth"]) -> dict:
-        """
-        Get buy depth data for a symbol.
+def _trade_keys(trades: list) -> list:
+    """
+    Identify each trade of a `get_last_trades` response: by its id when it has one,
+    otherwise by its fields plus an occurrence number, so that two trades with the same
+    time, price and quantity stay distinct.
+    """
+    keys, counts = [], {}
+    for trade in trades:
+        trade_id = trade.get("id", trade.get("tradeId"))
+        if trade_id is not None:
+            keys.append((trade.get("symbol"), trade_id))
+            continue
+        key = (
+            trade.get("symbol"),
+            trade.get("timestamp"),
+            trade.get("price"),
+            trade.get("quantity"),
+            trade.get("isBuyer"),
+        )
+        counts[key] = counts.get(key, 0) + 1
+        keys.append(key + (counts[key],))
+    return keys
 
-        :param symbol: The symbol or market identifier.
-        :type symbol: str
 
-        :param event: The event type (default: buyDepth).
-        :type event: str
+class OrderTracker:
+    """
+    A local view of open orders, reconciled with one request per interval.
+
+    Instead of calling `get_order` for every live order, each `poll()` makes a single
+    `get_open_orders` call and diffs it against the tracked orders. Orders that disappear
+    are classified with one `get_last_trades` call: if new trades at the order's symbol
+    and side, at its limit price or better, cover its remaining quantity it is reported
+    as filled, otherwise as cancelled. If the trades cannot be fetched, vanished orders
+    are kept aside and classified on a later poll. A partial fill also costs one
+    `get_last_trades` call, which attributes its trades to the order so they are not
+    counted again. Every change is reported as an (event, order) pair, where event is
+    one of "new", "partial", "filled" or "cancelled".
 
-        :return: The latest buy depth data.
-        :rtype: dict
+    Args:
+        orders_manage (OrdersManage): The client used to query orders and trades.
+        symbol (str, optional): Track only this symbol. Defaults to None (all symbols).
+        interval (float, optional): Seconds between polls when running in the background. Defaults to 1.
+        on_update (callable, optional): Called as on_update(event, order) for every change. Defaults to None.
+
+    Example:
+        tracker = OrderTracker(OrdersManage(api_key), symbol="USDTTMN", on_update=print)
+        tracker.start()
+        ...
+        print(tracker.open_orders("USDTTMN"))
+        tracker.stop()
+    """
+
+    def __init__(
+        self,
+        orders_manage: OrdersManage,
+        symbol: str = None,
+        interval: float = 1.0,
+        on_update=None,
+    ):
         """
-        self.subscribe(symbol=symbol, event=event, callback=self.handle_received_data)
-        return self.latest_data
+        Initialize the tracker. Nothing is requested until poll() or start() is called.
 
-    def get_sell_depth(self, symbol, event=EVENTS["sellDepth"]) -> dict:
+        Args:
+            orders_manage (OrdersManage): The client used to query orders and trades.
+            symbol (str, optional): Track only this symbol. Defaults to None (all symbols).
+            interval (float, optional): Seconds between polls when running in the background. Defaults to 1.
+            on_update (callable, optional): Called as on_update(event, order) for every change. Defaults to None.
         """
-        Get sell depth data for a symbol.
+        self.orders_manage = orders_manage
+        self.symbol = symbol
+        self.interval = interval
+        self.on_update = on_update
+        self.orders: dict = {}  # clientOrderId -> order
+        self.by_symbol: dict = {}  # symbol -> set of clientOrderIds
+        self.requests = 0
+        self.last_error = None
+        self._seen_trades = None  # set of trade keys, bounded by _seen_order
+        self._seen_order = collections.deque()
+        self._unresolved: dict = {}  # clientOrderId -> vanished order awaiting trades
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def get(self, client_id: str) -> dict:
+        """
+        :param client_id(str): The clientOrderId.
+        :return: (dict | None) The tracked open order, or None if it is not open.
+        """
+        return self.orders.get(client_id)
 
-        :param symbol: The symbol or market identifier.
-        :type symbol: str
+    def open_orders(self, symbol: str = None) -> list:
+        """
+        :param symbol(str): Only return orders of this symbol (optional).
+        :return: (list) The tracked open orders.
+        """
+        with self._lock:
+            if symbol is None:
+                return list(self.orders.values())
+            return [self.orders[i] for i in self.by_symbol.get(symbol, ())]
+
+    def _add(self, order: dict):
+        client_id = order["clientOrderId"]
+        self.orders[client_id] = order
+        self.by_symbol.setdefault(order.get("symbol"), set()).add(client_id)
+
+    def _remove(self, client_id: str) -> dict:
+        order = self.orders.pop(client_id)
+        ids = self.by_symbol.get(order.get("symbol"))
+        if ids is not None:
+            ids.discard(client_id)
+            if not ids:
+                del self.by_symbol[order.get("symbol")]
+        return order
+
+    def _fetch_trades(self):
+        self.requests += 1
+        result = self.orders_manage.get_last_trades(self.symbol)
+        try:
+            return result["result"]["AccountLatestTrades"]
+        except (KeyError, TypeError):
+            pass
+        try:
+            trades = result["result"]
+        except (KeyError, TypeError):
+            return None
+        return trades if isinstance(trades, list) else None
+
+    def _remember(self, keys):
+        for key in keys:
+            if key in self._seen_trades:
+                continue
+            self._seen_trades.add(key)
+            self._seen_order.append(key)
+            if len(self._seen_order) > TRADE_MEMORY:
+                self._seen_trades.discard(self._seen_order.popleft())
+
+    def _fresh_trades(self) -> list:
+        """
+        :return: (list | None) (key, trade) pairs not attributed to any order yet.
+        """
+        trades = self._fetch_trades()
+        if trades is None:
+            return None
+        return [
+            (key, trade)
+            for key, trade in zip(_trade_keys(trades), trades)
+            if key not in self._seen_trades
+        ]
+
+    @staticmethod
+    def _match(fresh: list, order: dict, quantity: float) -> tuple:
+        """
+        Pick fresh trades at the order's symbol and side covering `quantity`.
 
-        :param event: The event type (default: sellDepth).
-        :type event: str
+        Trades at the order's price or better (lower for a buy, higher for a sell) match,
+        so fills with price improvement count; trades at exactly the order's price are
+        taken first.
 
-        :return: The latest sell depth data.
-        :rtype: dict
+        :return: (tuple) The matched (key, trade) pairs and their total quantity.
         """
-        self.subscribe(symbol=symbol, event=event, callback=self.handle_received_data)
-        return self.latest_data
+        is_buyer = str(order.get("side", "")).upper() == "BUY"
+        price = _order_quantity(order, "price")
+
+        def acceptable(trade: dict) -> bool:
+            if not price:
+                return True
+            traded = _order_quantity(trade, "price")
+            return traded <= price if is_buyer else traded >= price
+
+        candidates = [
+            (key, trade)
+            for key, trade in fresh
+            if trade.get("symbol") == order.get("symbol")
+            and bool(trade.get("isBuyer")) == is_buyer
+            and acceptable(trade)
+        ]
+        candidates.sort(key=lambda item: _order_quantity(item[1], "price") != price)
+        matched, filled = [], 0.0
+        for key, trade in candidates:
+            if filled >= quantity * (1 - 1e-9):
+                break
+            matched.append((key, trade))
+            filled += _order_quantity(trade, "quantity")
+        return matched, filled
+
+    def _attribute(self, partial: list):
+        """
+        Mark the trades behind partial fills as seen, so they are not counted again when
+        the order later disappears.
 
-    def get_trade(self, symbol, event=EVENTS["trade"]) -> dict:
+        :param partial(list): (order, newly executed quantity) pairs.
         """
-        Get trade data for a symbol.
+        fresh = self._fresh_trades()
+        if fresh is None:
+            return
+        for order, quantity in partial:
+            matched, _ = self._match(fresh, order, quantity)
+            self._remember(key for key, _ in matched)
+            fresh = [item for item in fresh if item not in matched]
+
+    def _classify(self, gone: list) -> list:
+        """
+        Split vanished orders into filled and cancelled using the new trades.
 
-        :param symbol: The symbol or market identifier.
-        :type symbol: str
+        If the trades cannot be fetched, the orders are kept aside unclassified and
+        retried on the next poll rather than reported as cancelled.
+        """
+        fresh = self._fresh_trades()
+        if fresh is None:
+            self._unresolved.update((order["clientOrderId"], order) for order in gone)
+            return []
+        events = []
+        for order in gone:
+            remaining = _order_quantity(order, "origQty") - _order_quantity(
+                order, "executedQty"
+            )
+            matched, filled = self._match(fresh, order, remaining)
+            if remaining > 0 and filled >= remaining * (1 - 1e-9):
+                self._remember(key for key, _ in matched)
+                fresh = [item for item in fresh if item not in matched]
+                order = dict(order, executedQty=order.get("origQty"), status="FILLED")
+                events.append(("filled", order))
+            else:
+                events.append(("cancelled", dict(order, status="CANCELED")))
+        return events
+
+    def poll(self) -> list:
+        """
+        Reconcile the tracked orders with the exchange once.
 
-        :param event: The event type (default: trade).
-        :type event: str
+        :return: (list) The (event, order) changes found in this cycle.
+        """
+        with self._lock:
+            if self._seen_trades is None:
+                # Trades made before tracking started must not be attributed to orders.
+                trades = self._fetch_trades() or []
+                self._seen_trades = set()
+                self._remember(_trade_keys(trades))
+
+            self.requests += 1
+            result = self.orders_manage.get_open_orders(self.symbol)
+            try:
+                current = {
+                    order["clientOrderId"]: order
+                    for order in result["result"]["orders"]
+                }
+            except (KeyError, TypeError):
+                self.last_error = result
+                return []
+            self.last_error = None
+
+            events, partial = [], []
+            for client_id, order in current.items():
+                known = self.orders.get(client_id) or self._unresolved.pop(
+                    client_id, None
+                )
+                if known is None:
+                    events.append(("new", order))
+                else:
+                    executed = _order_quantity(order, "executedQty") - _order_quantity(
+                        known, "executedQty"
+                    )
+                    if executed:
+                        events.append(("partial", order))
+                    if executed > 0:
+                        partial.append((order, executed))
+                self._add(order)
+            if partial:
+                self._attribute(partial)
+
+            gone = [self._remove(i) for i in list(self.orders) if i not in current]
+            gone.extend(self._unresolved.pop(i) for i in list(self._unresolved))
+            if gone:
+                events.extend(self._classify(gone))
+
+        if self.on_update is not None:
+            for event, order in events:
+                try:
+                    self.on_update(event, order)
+                except Exception as e:
+                    print(f"Error in order tracker callback: {e}")
+        return events
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                self.last_error = {"error": f"{e}"}
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """
+        Poll in a background thread every `interval` seconds.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
 
-        :return: The latest trade data.
-        :rtype: dict
+    def stop(self):
         """
-        self.subscribe(symbol=symbol, event=event, callback=self.handle_received_data)
-        return self.latest_data
+        Stop the background polling thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
 
 
 # Example usage of the API methods (replace with your actual API key and data)
@@ -1219,6 +6681,12 @@ if __name__ == "__main__":
         #     if client_id_for.startswith("MohZeh") and side_for != "SELL":
         #         api.del_order(clientOrderId=client_id_for)
 
+        ### Example usage of cancel_all function (same as the loop above, concurrently)
+        # cancel_all_result = api.cancel_all(
+        #     symbol=symbol, client_id_prefix="MohZeh", side="BUY"
+        # )
+        # print("Cancel All Result:", cancel_all_result)
+
         # client_id = open_orders_result["result"]["orders"][0]["clientOrderId"]
         # print("client_id:", client_id)
 
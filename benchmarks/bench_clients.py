@@ -0,0 +1,177 @@
+"""
+Offline benchmark of the REST and WebSocket clients against a local stand-in server.
+
+Starts `StandInServer` (see stand_in_server.py), then measures for every client class
+the requests per second and latency percentiles of its main methods, sequentially for
+the blocking clients and with `--concurrency` requests in flight for the asyncio
+clients, and finally the WebSocket message throughput. No network access is needed;
+requires the optional `aiohttp` package.
+
+Usage:
+    python benchmarks/bench_clients.py [--requests 500] [--concurrency 32] [--messages 20000] [--channels 4]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stand_in_server import SYMBOLS, StandInServer  # noqa: E402
+from WallexAPI import (  # noqa: E402
+    EVENTS,
+    AccountManage,
+    AsyncAccountManage,
+    AsyncHTTPTransport,
+    AsyncMarketInfo,
+    AsyncMarketsOTC,
+    AsyncOrdersManage,
+    HTTPTransport,
+    MarketInfo,
+    MarketsOTC,
+    OrdersManage,
+    WebSocket,
+)
+
+SYMBOL = "USDTTMN"
+
+
+def calls(market, account, orders, otc) -> dict:
+    """
+    The benchmarked calls of each client class, as zero-argument callables.
+    """
+    now = int(time.time())
+    return {
+        "MarketInfo": [
+            market.get_markets,
+            market.get_currencies,
+            lambda: market.get_order_book_symbol(SYMBOL),
+            lambda: market.get_order_book_all(SYMBOL),
+            lambda: market.get_latest_trades(SYMBOL),
+            lambda: market.get_market_history(SYMBOL, "1", now - 30000, now),
+        ],
+        "AccountManage": [
+            account.get_profile,
+            account.get_fee,
+            account.get_balances,
+            account.get_money_deposit,
+            account.get_transfer,
+        ],
+        "OrdersManage": [
+            lambda: orders.set_order(SYMBOL, "LIMIT", "BUY", "57900", "10", "bench_1"),
+            lambda: orders.get_order("bench_1"),
+            lambda: orders.get_open_orders(SYMBOL),
+            lambda: orders.get_last_trades(SYMBOL),
+            lambda: orders.del_order("bench_1"),
+        ],
+        "MarketsOTC": [
+            otc.get_otc_markets,
+            lambda: otc.get_otc_price(SYMBOL, "BUY"),
+        ],
+    }
+
+
+def percentile(ordered: list, q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def report(label: str, latencies: list, elapsed: float):
+    ordered = sorted(latencies)
+    print(
+        f"{label:22s}: {len(ordered) / elapsed:>9,.0f} req/s"
+        f"  p50 {percentile(ordered, 0.50) * 1000:7.2f} ms"
+        f"  p90 {percentile(ordered, 0.90) * 1000:7.2f} ms"
+        f"  p99 {percentile(ordered, 0.99) * 1000:7.2f} ms"
+    )
+
+
+def bench_blocking(base_url: str, requests: int):
+    transport = HTTPTransport()
+    clients = calls(
+        MarketInfo(base_url=base_url, transport=transport),
+        AccountManage("bench-key", base_url=base_url, transport=transport),
+        OrdersManage("bench-key", base_url=base_url, transport=transport),
+        MarketsOTC("bench-key", base_url=base_url, transport=transport),
+    )
+    for name, functions in clients.items():
+        latencies = []
+        started = time.perf_counter()
+        for i in range(requests):
+            call_started = time.perf_counter()
+            functions[i % len(functions)]()
+            latencies.append(time.perf_counter() - call_started)
+        report(name, latencies, time.perf_counter() - started)
+    transport.close()
+
+
+async def bench_async(base_url: str, requests: int, concurrency: int):
+    transport = AsyncHTTPTransport()
+    clients = calls(
+        AsyncMarketInfo(base_url=base_url, transport=transport),
+        AsyncAccountManage("bench-key", base_url=base_url, transport=transport),
+        AsyncOrdersManage("bench-key", base_url=base_url, transport=transport),
+        AsyncMarketsOTC("bench-key", base_url=base_url, transport=transport),
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(function, latencies):
+        async with semaphore:
+            call_started = time.perf_counter()
+            await function()
+            latencies.append(time.perf_counter() - call_started)
+
+    for name, functions in clients.items():
+        latencies = []
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(timed(functions[i % len(functions)], latencies) for i in range(requests))
+        )
+        report(f"Async{name}", latencies, time.perf_counter() - started)
+    await transport.close()
+
+
+def bench_websocket(base_url: str, channels: int, messages: int):
+    client = WebSocket(once=False, base_url=base_url, reconnect=False)
+    expected = channels * messages
+    received = [0]
+    done = threading.Event()
+
+    def on_message(data):
+        received[0] += 1
+        if received[0] >= expected:
+            done.set()
+
+    events = list(EVENTS.values())
+    symbols = list(SYMBOLS)
+    started = time.perf_counter()
+    for i in range(channels):
+        symbol = symbols[i // len(events) % len(symbols)]
+        client.subscribe(symbol, events[i % len(events)], on_message, wait=False)
+    done.wait(timeout=120)
+    elapsed = time.perf_counter() - started
+    client.disconnect()
+    print(
+        f"{'WebSocket':22s}: {received[0] / elapsed:>9,.0f} msg/s"
+        f"  ({received[0]} messages on {channels} channels)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--channels", type=int, default=4)
+    args = parser.parse_args()
+
+    with StandInServer(messages_per_channel=args.messages) as server:
+        bench_blocking(server.base_url, args.requests)
+        asyncio.run(bench_async(server.base_url, args.requests, args.concurrency))
+        bench_websocket(server.base_url, args.channels, args.messages)
+
+
+if __name__ == "__main__":
+    main()
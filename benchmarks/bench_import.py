@@ -0,0 +1,101 @@
+"""
+Import-time benchmark for short-lived processes.
+
+Starts `--runs` fresh interpreters per scenario and reports the median and worst time
+spent importing WallexAPI (and creating a client), the wall time of the whole process,
+and which heavy dependencies ended up loaded. The first run of each scenario is a
+warm-up that writes the bytecode cache, as a deployed install would have it. Exits with
+status 1 if the median time of a plain `import WallexAPI` exceeds `--budget` ms, or if
+that import loads requests or the Socket.IO stack.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 20] [--budget 50]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY: tuple = ("requests", "socketio", "engineio", "aiohttp", "numpy")
+
+SCENARIOS: dict = {
+    "import WallexAPI": "",
+    "MarketInfo()": "WallexAPI.MarketInfo()",
+    "WebSocket()": "WallexAPI.WebSocket()",
+}
+
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+import WallexAPI
+{setup}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def run(setup: str) -> tuple:
+    """
+    Time one fresh interpreter; returns (in-process ms, process wall ms, loaded modules).
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD.format(setup=setup, heavy=HEAVY)],
+        env=env,
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    wall = (time.perf_counter() - started) * 1000
+    result = json.loads(output.strip().splitlines()[-1])
+    return result["ms"], wall, result["loaded"]
+
+
+def run_wall(executable: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([executable, "-c", "pass"], check=True)
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget", type=float, default=50.0)
+    args = parser.parse_args()
+
+    baseline = statistics.median(
+        [run_wall(sys.executable) for _ in range(max(3, args.runs // 4))]
+    )
+    print(f"{'python -c pass':22s}: process {baseline:7.1f} ms")
+
+    failed = False
+    for label, setup in SCENARIOS.items():
+        run(setup)  # warm-up: writes the bytecode cache
+        samples = [run(setup) for _ in range(args.runs)]
+        import_ms = [sample[0] for sample in samples]
+        median = statistics.median(import_ms)
+        print(
+            f"{label:22s}: median {median:7.1f} ms  max {max(import_ms):7.1f} ms"
+            f"  process {statistics.median(s[1] for s in samples):7.1f} ms"
+            f"  loaded: {', '.join(samples[-1][2]) or '-'}"
+        )
+        if label == "import WallexAPI":
+            if median > args.budget:
+                print(f"  over budget: {median:.1f} ms > {args.budget:.1f} ms")
+                failed = True
+            if samples[-1][2]:
+                print(f"  eagerly imported: {', '.join(samples[-1][2])}")
+                failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Throughput benchmark for the replay path (StreamRecorder -> ReplayWebSocket).
+
+Writes a synthetic recording of depth and trade messages to a temporary directory,
+then replays it as fast as possible and reports messages per second.
+
+Usage:
+    python benchmarks/bench_replay.py [--messages 200000] [--symbols 20]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from WallexAPI import EVENTS, OrderBook, ReplayWebSocket, StreamRecorder  # noqa: E402
+
+
+class _NoConnection:
+    """
+    A WebSocket placeholder for writing a synthetic recording without a network.
+    """
+
+    def subscribe(self, *args, **kwargs):
+        pass
+
+    def unsubscribe(self, *args, **kwargs):
+        pass
+
+
+def make_recording(directory: str, messages: int, symbols: list):
+    recorder = StreamRecorder(directory, symbols, websocket=_NoConnection())
+    levels = [
+        {"price": f"{100 + i * 0.1:.1f}", "quantity": "1.5", "sum": "1.5"}
+        for i in range(20)
+    ]
+    trade = {"price": "100.0", "quantity": "0.25", "isBuyOrder": True}
+    events = [EVENTS["buyDepth"], EVENTS["sellDepth"], EVENTS["trade"]]
+    received_at = time.time()
+    for i in range(messages):
+        event = events[i % len(events)]
+        channel = symbols[i % len(symbols)] + event
+        data = trade if event == EVENTS["trade"] else levels
+        recorder.record(channel, data, received_at + i * 0.001)
+    recorder.stop()
+
+
+def bench(directory: str, symbols: list, with_books: bool) -> tuple:
+    client = ReplayWebSocket(directory, speed=None)
+    counter = [0]
+
+    def on_trade(data):
+        counter[0] += 1
+
+    for symbol in symbols:
+        if with_books:
+            OrderBook(symbol).attach(client)
+        client.subscribe(symbol, EVENTS["trade"], on_trade, wait=False)
+    client.wait()
+    return client.messages, client.elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200000)
+    parser.add_argument("--symbols", type=int, default=20)
+    args = parser.parse_args()
+    symbols = [f"SYM{i}TMN" for i in range(args.symbols)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        started = time.perf_counter()
+        make_recording(directory, args.messages, symbols)
+        print(
+            f"record : {args.messages / (time.perf_counter() - started):>12,.0f} msg/s"
+        )
+        for label, with_books in (
+            ("replay (callbacks)", False),
+            ("replay (books)", True),
+        ):
+            messages, elapsed = bench(directory, symbols, with_books)
+            print(
+                f"{label:18s}: {messages / elapsed:>12,.0f} msg/s ({messages} messages)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+A local stand-in for the Wallex API, used by the offline benchmarks.
+
+Serves every route of MARKET_EP, ACCOUNT_EP, ORDERS_EP and OTC_EP with canned payloads
+shaped like the real responses, and runs a Socket.IO server on the same port that answers
+"subscribe" by emitting "Broadcaster" messages on the requested channel. Requires the
+optional `aiohttp` package (python-socketio is already a dependency).
+
+Usage:
+    with StandInServer(messages_per_channel=10000) as server:
+        api = MarketInfo(base_url=server.base_url)
+        print(api.get_markets())
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from WallexAPI import ACCOUNT_EP, MARKET_EP, ORDERS_EP, OTC_EP  # noqa: E402
+
+SYMBOLS: dict = {
+    "USDTTMN": ("USDT", "TMN", 58000.0, 0),
+    "BTCTMN": ("BTC", "TMN", 3.9e9, 0),
+    "BTCUSDT": ("BTC", "USDT", 67000.0, 2),
+    "ETHTMN": ("ETH", "TMN", 1.95e8, 0),
+    "ETHUSDT": ("ETH", "USDT", 3350.0, 2),
+    "SHIBTMN": ("SHIB", "TMN", 1.45, 4),
+}
+DEPTH_LEVELS: int = 50
+
+
+def _levels(mid: float, precision: int, sign: int) -> list:
+    levels, total = [], 0.0
+    for i in range(DEPTH_LEVELS):
+        price = round(mid * (1 + sign * 0.0005 * (i + 1)), precision)
+        quantity = round(1.0 + (i % 7) * 0.35, 4)
+        total += price * quantity
+        levels.append({"price": price, "quantity": quantity, "sum": round(total, 4)})
+    return levels
+
+
+def _depth(symbol: str) -> dict:
+    _, _, mid, precision = SYMBOLS.get(symbol, SYMBOLS["USDTTMN"])
+    return {"ask": _levels(mid, precision, 1), "bid": _levels(mid, precision, -1)}
+
+
+def _order(client_id: str, symbol: str = "USDTTMN", side: str = "BUY") -> dict:
+    return {
+        "symbol": symbol,
+        "type": "LIMIT",
+        "side": side,
+        "clientOrderId": client_id,
+        "price": "57900",
+        "origQty": "10",
+        "executedQty": "0",
+        "executedSum": "0",
+        "executedPercent": 0,
+        "status": "NEW",
+        "active": True,
+        "created_at": "2024-02-21T10:00:00Z",
+    }
+
+
+def _ok(result) -> dict:
+    return {
+        "success": True,
+        "message": "The operation was successful",
+        "result": result,
+    }
+
+
+class StandInServer:
+    """
+    A stand-in Wallex HTTP and Socket.IO server running in a background thread.
+
+    Args:
+        host (str, optional): Interface to listen on. Defaults to "127.0.0.1".
+        messages_per_channel (int, optional): "Broadcaster" messages sent after each subscribe. Defaults to 1000.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", messages_per_channel: int = 1000):
+        self.host = host
+        self.messages_per_channel = messages_per_channel
+        self.base_url = None
+        self._loop = None
+        self._runner = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._payloads = self._build_payloads()
+
+    def _build_payloads(self) -> dict:
+        markets = {
+            symbol: {
+                "symbol": symbol,
+                "baseAsset": base,
+                "quoteAsset": quote,
+                "baseAssetPrecision": 6,
+                "quotePrecision": precision,
+                "stats": {"lastPrice": str(mid), "24h_volume": "1000"},
+            }
+            for symbol, (base, quote, mid, precision) in SYMBOLS.items()
+        }
+        trades = [
+            {
+                "symbol": "USDTTMN",
+                "quantity": "12.5",
+                "price": "58000",
+                "sum": "725000",
+                "isBuyOrder": i % 2 == 0,
+                "timestamp": "2024-02-21T10:00:00Z",
+            }
+            for i in range(100)
+        ]
+        now = int(time.time())
+        bars = 500
+        return {
+            MARKET_EP["markets"]: _ok({"symbols": markets}),
+            MARKET_EP["currencies_stats"]: _ok(
+                [
+                    {"key": base, "name": base, "price": mid, "market_cap": mid * 1e6}
+                    for base, _, mid, _ in SYMBOLS.values()
+                ]
+            ),
+            MARKET_EP["order_book_all"]: _ok(
+                {symbol: _depth(symbol) for symbol in SYMBOLS}
+            ),
+            MARKET_EP["latest_trades"]: _ok({"latestTrades": trades}),
+            MARKET_EP["market_history"]: {
+                "s": "ok",
+                "t": list(range(now - bars * 60, now, 60)),
+                "o": ["58000"] * bars,
+                "h": ["58100"] * bars,
+                "l": ["57900"] * bars,
+                "c": ["58050"] * bars,
+                "v": ["1000"] * bars,
+            },
+            ACCOUNT_EP["profile"]: _ok({"email": "bench@example.com", "level": 2}),
+            ACCOUNT_EP["fee"]: _ok(
+                {
+                    symbol: {"makerFeeRate": "0.0025", "takerFeeRate": "0.0030"}
+                    for symbol in SYMBOLS
+                }
+            ),
+            ACCOUNT_EP["card_numbers"]: _ok(
+                [{"id": 1, "card_number": "6037********1234"}]
+            ),
+            ACCOUNT_EP["ibans"]: _ok([{"id": 1, "iban": "IR000000000000000000000000"}]),
+            ACCOUNT_EP["balances"]: _ok(
+                {
+                    "balances": {
+                        asset: {"asset": asset, "value": "100", "locked": "0"}
+                        for asset in ("TMN", "USDT", "BTC", "ETH", "SHIB")
+                    }
+                }
+            ),
+            ACCOUNT_EP["money_deposit"]: _ok([]),
+            ACCOUNT_EP["money_withdrawal"]: _ok({"id": 1, "status": "PENDING"}),
+            ACCOUNT_EP["crypto_deposit"]: _ok([]),
+            ACCOUNT_EP["crypto_withdrawal"]: _ok({"id": 1, "status": "PENDING"}),
+            ACCOUNT_EP["transfers"]: _ok([]),
+            ORDERS_EP["openOrders"]: _ok(
+                {"orders": [_order(f"bench_{i}") for i in range(20)]}
+            ),
+            ORDERS_EP["last_trades"]: _ok({"AccountLatestTrades": trades[:20]}),
+            OTC_EP["otc_markets"]: _ok(
+                [{"symbol": symbol, "enabled": True} for symbol in SYMBOLS]
+            ),
+            OTC_EP["otc_price"]: _ok({"price": "58100", "expire": 10}),
+            OTC_EP["otc_orders"]: _ok({"id": 1, "status": "FILLED"}),
+        }
+
+    async def _handle(self, request):
+        from aiohttp import web
+
+        path = request.path.strip("/")
+        if path.startswith(ORDERS_EP["orders"]):
+            return web.json_response(await self._handle_order(request, path))
+        if path == MARKET_EP["order_book_symbol"]:
+            return web.json_response(_ok(_depth(request.query.get("symbol", ""))))
+        payload = self._payloads.get(path)
+        if payload is None:
+            return web.json_response(
+                {"success": False, "message": "Not found"}, status=404
+            )
+        return web.json_response(payload)
+
+    async def _handle_order(self, request, path: str) -> dict:
+        client_id = path[len(ORDERS_EP["orders"]) :].strip("/")
+        if request.method == "POST":
+            body = await request.json()
+            return _ok(
+                _order(
+                    body.get("client_id", "bench"), body.get("symbol"), body.get("side")
+                )
+            )
+        if request.method == "DELETE":
+            return _ok(dict(_order(client_id), status="CANCELED", active=False))
+        return _ok(_order(client_id))
+
+    def _build_app(self):
+        import socketio
+        from aiohttp import web
+
+        sio = socketio.AsyncServer(async_mode="aiohttp")
+        app = web.Application()
+        sio.attach(app)
+
+        @sio.on("subscribe")
+        async def subscribe(sid, data):
+            channel = data.get("channel", "")
+            sio.start_background_task(self._broadcast, sio, sid, channel)
+
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        return app
+
+    async def _broadcast(self, sio, sid: str, channel: str):
+        symbol = channel.split("@", 1)[0]
+        if channel.endswith("@trade"):
+            payload = self._payloads[MARKET_EP["latest_trades"]]["result"][
+                "latestTrades"
+            ][0]
+        elif channel.endswith("@marketCap"):
+            payload = {"symbol": symbol, "24h_volume": "1000", "lastPrice": "58000"}
+        else:
+            side = "ask" if channel.endswith("@sellDepth") else "bid"
+            payload = _depth(symbol)[side][:20]
+        for i in range(self.messages_per_channel):
+            await sio.emit("Broadcaster", (channel, payload), to=sid)
+            if i % 100 == 99:
+                await asyncio.sleep(0)
+
+    def _serve(self):
+        from aiohttp import web
+
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, 0))
+        self._runner = web.AppRunner(self._build_app(), shutdown_timeout=0.1)
+        self._loop.run_until_complete(self._runner.setup())
+        self._loop.run_until_complete(web.SockSite(self._runner, sock).start())
+        self.base_url = f"http://{self.host}:{sock.getsockname()[1]}/"
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self._runner.cleanup())
+        pending = asyncio.all_tasks(self._loop)
+        for task in pending:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self._loop.close()
+
+    def start(self):
+        """
+        Start serving in a background thread; returns once the server is listening.
+        """
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self):
+        """
+        Stop the server and wait for its thread to finish.
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()